@@ -0,0 +1,137 @@
+"""
+Compares the per-request cost of packing the flat filter values (what the
+`Filter()` dependency receives) into the nested filter params: the generic
+packing, scanning the values once per nested filter class, against
+the generated packer (`get_values_packer`).
+
+The filter classes have 5, 50 and 200 fields, a fifth of them in
+nested filter classes (two levels deep).
+
+Usage (from the repository root, `fastapi_query` is imported from the tree):
+    PYTHONPATH=. python benchmarks/filter_packing.py [--repeat 2000]
+"""
+import argparse
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import create_model
+
+from fastapi_query._compat import _validate
+from fastapi_query.filtering import BaseFilterParams
+from fastapi_query.filtering.utils import (
+    get_filter_fields_info,
+    get_values_packer
+)
+
+FIELDS_COUNTS = (5, 50, 200)
+
+
+def _pack_values_generic(
+        filter_class: Type[BaseFilterParams],
+        values: Dict[str, Any]
+) -> BaseFilterParams:
+    # The packing before the generated packers
+    construction_dict = {}
+
+    for field_info in get_filter_fields_info(filter_class):
+        if field_info.nested_filter_type is not None:
+            nested_values = {
+                "__".join(key.split("__")[1:]): value
+                for key, value in values.items()
+                if key.startswith(f"{field_info.prefix}__")
+            }
+
+            construction_dict[field_info.name] = _pack_values_generic(
+                filter_class=field_info.nested_filter_type,
+                values=nested_values
+            )
+        else:
+            construction_dict[field_info.name] = values.get(field_info.name)
+
+    return _validate(filter_class, construction_dict)
+
+
+def _create_filter_class(
+        name: str,
+        fields_count: int,
+        depth: int = 0
+) -> Type[BaseFilterParams]:
+    nested_count = fields_count // 5 if depth < 2 else 0
+    nested_classes = max(1, nested_count // 10) if nested_count else 0
+    fields: Dict[str, Any] = {
+        f"field_{i}": (Optional[int], None)
+        for i in range(fields_count - nested_count)
+    }
+
+    for i in range(nested_classes):
+        nested = _create_filter_class(
+            name=f"{name}Nested{i}",
+            fields_count=nested_count // nested_classes,
+            depth=depth + 1
+        )
+        fields[f"nested_{i}"] = (Optional[nested], None)
+
+    return create_model(name, __base__=BaseFilterParams, **fields)
+
+
+def _get_flat_values(
+        filter_class: Type[BaseFilterParams],
+        key_prefix: str = ""
+) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+
+    for i, field_info in enumerate(get_filter_fields_info(filter_class)):
+        if field_info.nested_filter_type is not None:
+            values.update(_get_flat_values(
+                filter_class=field_info.nested_filter_type,
+                key_prefix=f"{key_prefix}{field_info.prefix}__"
+            ))
+        else:
+            # Every other filter is set
+            values[f"{key_prefix}{field_info.name}"] = i if i % 2 else None
+
+    return values
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> float:
+    func()
+
+    start = perf_counter()
+    for _ in range(repeat):
+        func()
+
+    return (perf_counter() - start) / repeat * 1000000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"Mean of {args.repeat} runs (us per request)")
+    print(f"{'fields':>8} {'generic':>10} {'generated':>10}")
+
+    for fields_count in FIELDS_COUNTS:
+        filter_class = _create_filter_class(
+            name=f"Filters{fields_count}",
+            fields_count=fields_count
+        )
+        values = _get_flat_values(filter_class)
+        packer = get_values_packer(filter_class)
+
+        assert packer(values) == _pack_values_generic(filter_class, values)
+
+        generic_us = _measure(
+            lambda: _pack_values_generic(filter_class, values),  # noqa: B023
+            args.repeat
+        )
+        generated_us = _measure(
+            lambda: packer(values),  # noqa: B023
+            args.repeat
+        )
+
+        print(f"{fields_count:>8} {generic_us:>10.1f} {generated_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Compares the default response construction (the paginated dict of ORM-like
+objects validated and serialized by FastAPI against the response model)
+with the prebuilt JSON response (`prepare_json_response`) on a 200-item page.
+The construction is measured without the HTTP round trip.
+
+Usage (from the repository root, `fastapi_query` is imported from the tree):
+    PYTHONPATH=. python benchmarks/response_construction.py [--repeat 500]
+"""
+import argparse
+import asyncio
+import json
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from pydantic import BaseModel
+
+from fastapi_query.pagination import (
+    Paginated,
+    PaginationParams,
+    prepare_json_response
+)
+from fastapi_query.pagination.utils import prepare_response
+
+PAGE_SIZE = 200
+
+
+class CategoryOut(BaseModel):
+    id: int
+    name: str
+
+
+class ProductOut(BaseModel):
+    id: int
+    name: str
+    description: Optional[str]
+    price: int
+    created_at: datetime
+    updated_at: datetime
+    deleted_at: Optional[datetime]
+    categories: List[CategoryOut]
+
+
+class Record:
+    """ ORM-like object """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.__dict__.update(kwargs)
+
+
+def _get_page() -> Dict[str, Any]:
+    now = datetime.now(tz=timezone.utc)
+    items = [
+        Record(
+            id=i,
+            name=f"Product {i}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            price=i * 100,
+            created_at=now,
+            updated_at=now,
+            deleted_at=None,
+            categories=[Record(id=j, name=f"Category {j}") for j in range(3)]
+        )
+        for i in range(PAGE_SIZE)
+    ]
+
+    return prepare_response(
+        items=items,
+        total_items=10000,
+        pagination_params=PaginationParams(page=1, size=PAGE_SIZE)
+    )
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> float:
+    func()
+
+    start = perf_counter()
+    for _ in range(repeat):
+        func()
+
+    return (perf_counter() - start) / repeat * 1000
+
+
+def _get_response_field() -> Any:
+    # Field FastAPI creates for `response_model=Paginated[ProductOut]`
+    try:
+        from fastapi.utils import create_model_field
+    except ImportError:  # FastAPI < 0.100
+        from fastapi.utils import create_response_field as create_model_field
+
+    return create_model_field(
+        name="Response_get_products",
+        type_=Paginated[ProductOut]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    page = _get_page()
+    field = _get_response_field()
+    loop = asyncio.new_event_loop()
+
+    def default_path() -> bytes:
+        # What FastAPI does with the returned dict: validation against
+        # the response model, serialization and rendering of the JSON
+        content = loop.run_until_complete(serialize_response(
+            field=field,
+            response_content=page
+        ))
+        return JSONResponse(content=content).body
+
+    def prebuilt_path() -> bytes:
+        return prepare_json_response(
+            response=page,
+            item_schema=ProductOut
+        ).body
+
+    assert json.loads(default_path()) == json.loads(prebuilt_path())
+
+    default_ms = _measure(default_path, args.repeat)
+    prebuilt_ms = _measure(prebuilt_path, args.repeat)
+
+    print(f"Page of {PAGE_SIZE} items, mean of {args.repeat} runs")
+    print(f"default   {default_ms:8.3f} ms")
+    print(f"prebuilt  {prebuilt_ms:8.3f} ms  ({default_ms / prebuilt_ms:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
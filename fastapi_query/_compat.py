@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Any, Dict, Type, Callable
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, Callable, get_args, get_origin
 
 from pydantic import BaseModel
 from pydantic.version import VERSION as PYDANTIC_VERSION
@@ -10,7 +11,7 @@ PYDANTIC_V2 = PYDANTIC_VERSION.startswith("2.")
 if PYDANTIC_V2:
     from pydantic import model_validator
     from pydantic.fields import FieldInfo
-    from pydantic import TypeAdapter
+    from pydantic import TypeAdapter, SkipValidation
     from pydantic_core import PydanticUndefined, PydanticUndefinedType
 
     Undefined = PydanticUndefined
@@ -40,8 +41,11 @@ if PYDANTIC_V2:
         def type_(self) -> Any:
             return self.field_info.annotation
 
-        def __post_init__(self) -> None:
-            self._type_adapter: TypeAdapter[Any] = TypeAdapter(
+        @cached_property
+        def _type_adapter(self) -> TypeAdapter[Any]:
+            # Built on first use, the schema building is too costly
+            # to be paid on each request
+            return TypeAdapter(
                 Annotated[self.field_info.annotation, self.field_info]
             )
 
@@ -83,6 +87,65 @@ if PYDANTIC_V2:
         return model.model_validate(obj=value)
 
 
+    def _validate_from_attributes(
+            model: Type[BaseModel],
+            value: Any
+    ) -> Any:
+        return model.model_validate(obj=value, from_attributes=True)
+
+
+    def _model_dump_json(
+            model: BaseModel,
+            **kwargs: Any
+    ) -> str:
+        return model.model_dump_json(**kwargs)
+
+
+    @lru_cache(maxsize=None)
+    def _get_type_adapter(type_: Any) -> TypeAdapter:
+        return TypeAdapter(type_)
+
+
+    def _get_response_validator(type_: Any) -> Any:
+        return _get_type_adapter(type_)
+
+
+    def _dump_json_from_attributes(
+            type_: Any,
+            value: Any
+    ) -> bytes:
+        adapter = _get_type_adapter(type_)
+        return adapter.dump_json(
+            adapter.validate_python(value, from_attributes=True)
+        )
+
+
+    def _skip_validation(type_: Any) -> Any:
+        return Annotated[type_, SkipValidation()]
+
+
+    def _get_query_field_params(
+            field_info: FieldInfo
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Returns the constraints (annotated metadata) of the field
+        and the other attributes as the `Query` arguments
+        """
+        kwargs = {
+            "alias": field_info.alias,
+            "title": field_info.title,
+            "description": field_info.description,
+            "examples": field_info.examples,
+            "json_schema_extra": field_info.json_schema_extra
+        }
+        deprecated = getattr(field_info, "deprecated", None)
+
+        if deprecated is not None:
+            kwargs["deprecated"] = deprecated
+
+        return tuple(field_info.metadata), kwargs
+
+
     def _model_validator(
             *args,
             mode: Literal["before", "after"] = "before"
@@ -93,8 +156,11 @@ if PYDANTIC_V2:
     def _is_model_field_required(field: Any) -> bool:
         return field.is_required()
 else:
+    from collections.abc import Iterable, Mapping
+
     from pydantic import root_validator
-    from pydantic.fields import ModelField
+    from pydantic.fields import FieldInfo, ModelField
+    from pydantic.fields import SHAPE_SINGLETON, Undefined  # type: ignore
 
 
     def _get_model_fields(
@@ -118,6 +184,151 @@ else:
         return model.validate(value=value)
 
 
+    def _get_field_data(
+            field: Any,
+            value: Any,
+            type_vars: Dict[Any, Any]
+    ) -> Any:
+        nested_model = field.type_
+        get_data: Callable[[Any, Any], Any] = _get_attributes_data
+
+        if nested_model in type_vars:
+            # Not validated by the generic model, so validated here
+            nested_model = type_vars[nested_model]
+            get_data = _validate_from_attributes
+
+        if not (isinstance(nested_model, type) and issubclass(nested_model, BaseModel)):
+            return value
+
+        if field.shape == SHAPE_SINGLETON:
+            return get_data(nested_model, value)
+
+        if isinstance(value, Mapping):
+            return {
+                key: get_data(nested_model, item)
+                for key, item in value.items()
+            }
+
+        if isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+            return [get_data(nested_model, item) for item in value]
+
+        return value
+
+
+    def _get_attributes_data(
+            model: Any,
+            value: Any,
+            type_vars: Optional[Dict[Any, Any]] = None
+    ) -> Any:
+        """
+        Reads the fields of the schema (and of the nested schemas) from the
+        attributes of the object, as v2 `from_attributes` does without
+        requiring `orm_mode`. The mappings are read by the keys.
+        """
+        if (
+                value is None or
+                isinstance(value, BaseModel) or
+                model.__custom_root_type__
+        ):
+            return value
+
+        if isinstance(value, Mapping):
+            data = dict(value)
+        else:
+            data = {}
+
+        for field in model.__fields__.values():
+            if isinstance(value, Mapping):
+                if field.alias not in value:
+                    continue
+
+                field_value = value[field.alias]
+            elif hasattr(value, field.alias):
+                field_value = getattr(value, field.alias)
+            else:
+                continue
+
+            data[field.alias] = _get_field_data(
+                field,
+                field_value,
+                type_vars or {}
+            )
+
+        return data
+
+
+    def _validate_from_attributes(
+            model: Type[BaseModel],
+            value: Any
+    ) -> Any:
+        schema: Any = model
+
+        if schema.__config__.orm_mode:
+            return schema.from_orm(value)
+
+        return schema.parse_obj(_get_attributes_data(schema, value))
+
+
+    def _model_dump_json(
+            model: BaseModel,
+            **kwargs: Any
+    ) -> str:
+        return model.json(**kwargs)
+
+
+    def _get_response_validator(type_: Any) -> Any:
+        # The validators are built with the (generic) model class
+        return type_
+
+
+    def _dump_json_from_attributes(
+            type_: Any,
+            value: Any
+    ) -> bytes:
+        # Validated from the attributes (as on v2), without `orm_mode`.
+        # The generic models are parametrized by typing (`Paginated[Item]`),
+        # the values of the type variables are validated with the schemas.
+        model = get_origin(type_) or type_
+        type_vars = dict(zip(  # noqa: B905
+            getattr(model, "__parameters__", ()),
+            get_args(type_)
+        ))
+        data = _get_attributes_data(model, value, type_vars)
+
+        return model.parse_obj(data).json().encode()
+
+
+    def _skip_validation(type_: Any) -> Any:
+        # Not supported, the values are validated as the type
+        return type_
+
+
+    _QUERY_CONSTRAINTS = (
+        "gt", "ge", "lt", "le", "multiple_of", "min_length", "max_length", "regex"
+    )
+
+
+    def _get_query_field_params(
+            field_info: FieldInfo
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Returns the constraints (none are annotated on v1)
+        and the attributes of the field as the `Query` arguments
+        """
+        kwargs = {
+            "alias": field_info.alias,
+            "title": field_info.title,
+            "description": field_info.description,
+            **getattr(field_info, "extra", {})
+        }
+
+        for name in _QUERY_CONSTRAINTS:
+            if getattr(field_info, name, None) is not None:
+                kwargs[name] = getattr(field_info, name)
+
+        return (), kwargs
+
+
     def _model_validator(
             *args,
             mode: Literal["before", "after"] = "before"
@@ -130,9 +341,16 @@ else:
 
 __all__ = [
     "PYDANTIC_V2",
+    "Undefined",
     "_model_dump",
     "_model_validator",
     "_get_model_fields",
     "_validate",
+    "_validate_from_attributes",
+    "_model_dump_json",
+    "_dump_json_from_attributes",
+    "_get_response_validator",
+    "_get_query_field_params",
+    "_skip_validation",
     "_is_model_field_required"
 ]
@@ -1,10 +1,26 @@
-from .filtering import apply_filters
+from fastapi_query.registry import register_model_warmer
+from .counting import get_count_statement
+from .fields import apply_fields
+from .filtering import apply_filters, compile_filters
 from .ordering import apply_ordering
 from .pagination import paginate, paginate_async
+from .streaming import stream, stream_async
+from .statement_cache import StatementCacheStats, track_statement_cache
+from .warmup import warmup_model
+
+register_model_warmer(warmup_model)
 
 __all__ = [
+    "apply_fields",
     "apply_filters",
+    "compile_filters",
     "paginate",
     "paginate_async",
-    "apply_ordering"
+    "get_count_statement",
+    "apply_ordering",
+    "stream",
+    "stream_async",
+    "StatementCacheStats",
+    "track_statement_cache",
+    "warmup_model"
 ]
@@ -0,0 +1,366 @@
+import json
+from typing import Any, Callable, Dict, Generator, Optional, Tuple, Union
+
+from sqlalchemy import Select, Table, Join, distinct, func, inspect, select, text
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, RelationshipProperty
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from fastapi_query.pagination.cache import CountCache
+from fastapi_query.pagination.enums import CountStrategy
+from .utils import get_select_statement
+
+CountResult = Tuple[Optional[int], bool]
+CountSteps = Generator[Executable, Any, CountResult]
+
+# Max number of the count cache key SQL strings kept (by statement structure)
+COUNT_KEY_SQL_CACHE_SIZE = 256
+
+_count_key_sql: Dict[Tuple[Any, Dialect], str] = {}
+
+
+class _Explain(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) statement, only supported for PostgreSQL
+    """
+    inherit_cache = False
+
+    def __init__(self, stmt: Select) -> None:
+        self.stmt = stmt
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.stmt, **kw)}"
+
+
+def _get_entity(
+        stmt: Select
+) -> Optional[Any]:
+    """
+    Returns the mapped class when the statement selects a single ORM entity
+    """
+    descriptions = stmt.column_descriptions
+
+    if len(descriptions) != 1:
+        return None
+
+    entity = descriptions[0].get("entity")
+
+    if not isinstance(entity, type) or descriptions[0].get("expr") is not entity:
+        return None
+
+    return entity
+
+
+def _could_fan_out(
+        stmt: Select
+) -> bool:
+    """
+    Returns True when the joins of the statement could repeat the entity rows,
+    joins along many-to-one / one-to-one relationships never do
+    """
+    for target, *_ in stmt._setup_joins:  # noqa
+        prop = getattr(target, "property", None)
+
+        if not isinstance(prop, RelationshipProperty) or prop.uselist:
+            return True
+
+    return (
+            len(stmt.get_final_froms()) > 1 or
+            any(isinstance(from_obj, Join) for from_obj in stmt._from_obj)  # noqa
+    )
+
+
+def _is_lean_countable(
+        stmt: Select
+) -> bool:
+    return (
+            stmt._limit_clause is None and  # noqa
+            stmt._offset_clause is None and  # noqa
+            not stmt._distinct and  # noqa
+            not stmt._group_by_clauses and  # noqa
+            stmt._having_criteria == ()  # noqa
+    )
+
+
+def get_count_statement(
+        stmt: Union[Select, Query],
+        count_cap: Optional[int] = None
+) -> Select:
+    """
+    Builds the count statement for the (filtered) statement. The ordering and
+    the loader options are dropped, the rows are counted in place
+    (no subquery) and `count(DISTINCT pk)` is used only when the joins of
+    the statement could repeat the entity rows.
+
+    Parameters:
+        stmt (Union[Select, Query]): Filtered Select Statement
+        count_cap (Optional[int]): Count at most `count_cap + 1` rows
+
+    Returns:
+        count_stmt (Select): Count Statement
+    """
+    stmt = get_select_statement(stmt)
+    entity = _get_entity(stmt) if _is_lean_countable(stmt) else None
+
+    if entity is None:
+        if stmt._limit_clause is None:  # noqa
+            stmt = stmt.order_by(None)
+
+        if count_cap is not None:
+            stmt = stmt.limit(count_cap + 1)
+
+        return select(func.count()).select_from(stmt.subquery())
+
+    primary_key = list(inspect(entity).primary_key)
+    is_distinct = _could_fan_out(stmt)
+    stmt = stmt.order_by(None)
+
+    if count_cap is None and (not is_distinct or len(primary_key) == 1):
+        count_expr = func.count(distinct(*primary_key)) if is_distinct else func.count()
+
+        return stmt.with_only_columns(
+            count_expr,
+            maintain_column_froms=True
+        )
+
+    stmt = stmt.with_only_columns(*primary_key, maintain_column_froms=True)
+
+    if is_distinct:
+        stmt = stmt.distinct()
+
+    if count_cap is not None:
+        stmt = stmt.limit(count_cap + 1)
+
+    return select(func.count()).select_from(stmt.subquery())
+
+
+def _get_table_name(
+        stmt: Select
+) -> Optional[str]:
+    froms = stmt.get_final_froms()
+
+    if len(froms) == 1 and isinstance(froms[0], Table):
+        return froms[0].name
+
+    return None
+
+
+def _estimate_count(
+        stmt: Union[Select, Query],
+        dialect_name: str
+) -> Generator[Executable, Any, Optional[int]]:
+    """
+    Yields the queries needed for the planner estimate of the row count,
+    returns None when the estimate is not available for the dialect / statement
+    """
+    stmt = get_select_statement(stmt)
+
+    if dialect_name == "postgresql":
+        result = yield _Explain(stmt.order_by(None))
+        plan = result.scalar()
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    table_name = _get_table_name(stmt)
+
+    # sqlite_stat1 holds table level statistics only, so it can't
+    # estimate the number of rows matched by the filters
+    if dialect_name == "sqlite" and table_name and stmt.whereclause is None:
+        result = yield text(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'table' AND name = 'sqlite_stat1'"
+        )
+
+        if result.scalar() is None:
+            return None
+
+        result = yield text(
+            "SELECT stat FROM sqlite_stat1 WHERE tbl = :tbl"
+        ).bindparams(tbl=table_name)
+        stat = result.scalar()
+
+        return int(stat.split()[0]) if stat else None
+
+    return None
+
+
+def count_steps(
+        stmt: Union[Select, Query],
+        count_strategy: CountStrategy,
+        count_cap: Optional[int] = None,
+        dialect_name: Optional[str] = None
+) -> CountSteps:
+    """
+    Yields the count queries for the strategy and receives their results,
+    so the same logic drives both the sync and the async sessions.
+    The window strategy counts within the page query, so when a separate
+    count is needed it is counted exactly.
+
+    Parameters:
+        stmt (Union[Select, Query]): Filtered Select Statement
+        count_strategy (CountStrategy): Count Strategy
+        count_cap (Optional[int]): Max number of rows counted (capped strategy)
+        dialect_name (Optional[str]): Name of the database dialect
+
+    Returns:
+        count_result (Tuple[Optional[int], bool]): Total items and exact flag
+    """
+    if count_strategy == CountStrategy.NONE:
+        return None, False
+
+    if count_strategy == CountStrategy.CAPPED:
+        if not count_cap:
+            raise ValueError("'count_cap' is required for the capped count strategy")
+
+        result = yield get_count_statement(
+            stmt=stmt,
+            count_cap=count_cap
+        )
+        total_items = result.scalar_one()
+
+        if total_items > count_cap:
+            return count_cap, False
+
+        return total_items, True
+
+    if count_strategy == CountStrategy.ESTIMATED:
+        estimate = yield from _estimate_count(
+            stmt=stmt,
+            dialect_name=dialect_name or ""
+        )
+
+        if estimate is not None:
+            return estimate, False
+
+    result = yield get_count_statement(stmt)
+
+    return result.scalar_one(), True
+
+
+def _get_fingerprint(
+        stmt: Select,
+        dialect: Dialect
+) -> Tuple[str, Any]:
+    """
+    Returns the SQL of the statement and its bound values, the SQL is
+    compiled once per statement structure (SQLAlchemy cache key)
+    """
+    cache_key = stmt._generate_cache_key()  # noqa
+
+    if cache_key is None:
+        compiled = stmt.compile(dialect=dialect)
+
+        return str(compiled), compiled.params
+
+    key = (cache_key.key, dialect)
+    sql = _count_key_sql.get(key)
+
+    if sql is None:
+        sql = str(stmt.compile(dialect=dialect))
+
+        if len(_count_key_sql) >= COUNT_KEY_SQL_CACHE_SIZE:
+            _count_key_sql.clear()
+
+        _count_key_sql[key] = sql
+
+    return sql, [bind.effective_value for bind in cache_key.bindparams]
+
+
+def get_count_cache_key(
+        count_cache: CountCache,
+        stmt: Union[Select, Query],
+        count_strategy: CountStrategy,
+        dialect: Dialect,
+        count_cap: Optional[int] = None
+) -> str:
+    """
+    Returns the count cache key of the (filtered, not paginated) statement.
+    The key is made of the SQL (compiled once per statement structure) and
+    the bound filter values, the ordering is dropped since it doesn't change
+    the count.
+
+    Parameters:
+        count_cache (CountCache): Count Cache
+        stmt (Union[Select, Query]): Filtered Select Statement
+        count_strategy (CountStrategy): Count Strategy
+        dialect (Dialect): Database dialect the statement is compiled for
+        count_cap (Optional[int]): Max number of rows counted (capped strategy)
+
+    Returns:
+        cache_key (str): Count Cache Key
+    """
+    select_stmt = get_select_statement(stmt)
+
+    if select_stmt._limit_clause is None:  # noqa
+        select_stmt = select_stmt.order_by(None)
+
+    sql, values = _get_fingerprint(stmt=select_stmt, dialect=dialect)
+
+    # The window strategy counts exactly, so it shares the exact counts
+    if count_strategy == CountStrategy.WINDOW:
+        count_strategy = CountStrategy.EXACT
+
+    if count_strategy != CountStrategy.CAPPED:
+        count_cap = None
+
+    return count_cache.make_key(
+        sql,
+        values,
+        count_strategy.value,
+        count_cap
+    )
+
+
+def run_count(
+        db: Any,
+        steps: CountSteps
+) -> CountResult:
+    """
+    Executes the count queries using the sync session / connection
+    """
+    try:
+        query = next(steps)
+
+        while True:
+            query = steps.send(db.execute(query))
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_count_async(
+        db: Any,
+        steps: CountSteps
+) -> CountResult:
+    """
+    Executes the count queries using the async session / connection
+    """
+    try:
+        query = next(steps)
+
+        while True:
+            query = steps.send(await db.execute(query))
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_count_with_bind_async(
+        bind: Union[AsyncEngine, Callable[[], AsyncSession]],
+        steps: CountSteps
+) -> CountResult:
+    """
+    Executes the count queries on a new connection / session of the bind
+    """
+    if isinstance(bind, AsyncEngine):
+        async with bind.connect() as conn:
+            return await run_count_async(db=conn, steps=steps)
+
+    async with bind() as db:
+        return await run_count_async(db=db, steps=steps)
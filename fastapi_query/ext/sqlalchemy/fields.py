@@ -0,0 +1,141 @@
+from typing import Any, List, Optional, Tuple, Union
+
+from sqlalchemy import Select, inspect
+from sqlalchemy.orm import Query, lazyload, load_only, selectinload
+
+from fastapi_query.fields.schemas import FieldsParams
+from fastapi_query.fields.utils import (
+    FieldsTree,
+    get_fields_tree,
+    raise_invalid_field
+)
+
+
+def _resolve_fields_tree(
+        model_class: Any,
+        tree: FieldsTree,
+        path: str = ""
+) -> FieldsTree:
+    """
+    Validates the selected fields against the model, the relationships
+    selected without nested fields are expanded to all their columns
+    """
+    mapper = inspect(model_class)
+    res: FieldsTree = {}
+
+    for name, subtree in tree.items():
+        field_path = f"{path}{name}"
+
+        if name in mapper.column_attrs and not subtree:
+            res[name] = {}
+        elif name in mapper.relationships:
+            related_class = mapper.relationships[name].mapper.class_
+
+            if subtree:
+                res[name] = _resolve_fields_tree(
+                    model_class=related_class,
+                    tree=subtree,
+                    path=f"{field_path}__"
+                )
+            else:
+                res[name] = {
+                    key: {} for key in inspect(related_class).column_attrs.keys()
+                }
+        else:
+            raise_invalid_field(field_path)
+
+    return res
+
+
+def _get_load_options(
+        model_class: Any,
+        tree: FieldsTree
+) -> List[Any]:
+    """
+    Loads only the selected columns (and the primary key), the selected
+    relationships are loaded with `selectinload`, the other ones are not loaded
+    (lazy loading, they are never accessed by `project_items`)
+    """
+    mapper = inspect(model_class)
+    options: List[Any] = []
+
+    columns = [
+        getattr(model_class, name)
+        for name in tree
+        if name in mapper.column_attrs
+    ]
+
+    if columns:
+        options.append(load_only(*columns))
+
+    for name, relationship in mapper.relationships.items():
+        attr = getattr(model_class, name)
+
+        if name not in tree:
+            options.append(lazyload(attr))
+            continue
+
+        options.append(
+            selectinload(attr).options(*_get_load_options(
+                model_class=relationship.mapper.class_,
+                tree=tree[name]
+            ))
+        )
+
+    return options
+
+
+def get_fields(
+        model_class: Any,
+        fields_params: Optional[FieldsParams]
+) -> FieldsTree:
+    """
+    Parses and validates the selected fields against the model
+
+    Parameters:
+        model_class (Any): SQLAlchemy Model Class
+        fields_params (Optional[FieldsParams]): Fields Params
+
+    Returns:
+        tree (FieldsTree): Selected fields, empty when all the fields are loaded
+    """
+    if fields_params is None:
+        return {}
+
+    return _resolve_fields_tree(
+        model_class=model_class,
+        tree=get_fields_tree(fields_params.fields)
+    )
+
+
+def apply_fields(
+        model_class: Any,
+        stmt: Union[Select, Query],
+        fields_params: Optional[FieldsParams]
+) -> Tuple[Union[Select, Query], FieldsTree]:
+    """
+    Restricts the loaded columns and relationships to the selected fields
+    (`load_only` / `lazyload`), the items should be read with `project_items`,
+    so the columns that were not loaded are not lazy-loaded
+
+    Parameters:
+        model_class (Any): SQLAlchemy Model Class
+        stmt (Union[Select, Query]): Pre-constructed Select Statement
+        fields_params (Optional[FieldsParams]): Fields Params
+
+    Returns:
+        result (Tuple[Union[Select, Query], FieldsTree]): Result Statement
+            and the selected fields
+    """
+    tree = get_fields(
+        model_class=model_class,
+        fields_params=fields_params
+    )
+
+    if tree:
+        stmt = stmt.options(*_get_load_options(
+            model_class=model_class,
+            tree=tree
+        ))
+
+    return stmt, tree
@@ -1,159 +1,1037 @@
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union
+)
 
-from sqlalchemy import Select, and_, Column, or_, ColumnElement
+from sqlalchemy import (
+    Select,
+    and_,
+    or_,
+    bindparam,
+    func,
+    select,
+    tuple_,
+    ColumnElement
+)
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import Relationship, Query
+from sqlalchemy.orm import Relationship, RelationshipProperty, Query
 
-from fastapi_query._compat import _model_dump
+from fastapi_query._compat import _get_model_fields
+from fastapi_query.registry import register
 from fastapi_query.filtering import BaseFilterParams
-from fastapi_query.filtering.enums import FilterOperators
+from fastapi_query.filtering.enums import (
+    FilterOperators,
+    RelationshipFilterStrategy,
+    SearchMode
+)
+from fastapi_query.filtering.utils import (
+    check_nested_filter_type,
+    get_optional_subtype,
+    get_prefix_upper_bound
+)
+from .in_list import InList
+from .search import (
+    LIKE_ESCAPE,
+    FullTextMatch,
+    SearchOptions,
+    escape_like,
+    to_fts5_query
+)
 
-_orm_operator_transformer = {
+_OperatorTransformer = Callable[[Any], Tuple[str, Any]]
+
+_orm_operator_transformer: Dict[str, _OperatorTransformer] = {
     FilterOperators.EQ: lambda value: ("__eq__", value),
     FilterOperators.NEQ: lambda value: ("__ne__", value),
     FilterOperators.GT: lambda value: ("__gt__", value),
     FilterOperators.GTE: lambda value: ("__ge__", value),
     FilterOperators.LT: lambda value: ("__lt__", value),
     FilterOperators.LTE: lambda value: ("__le__", value),
-    FilterOperators.IN: lambda value: ("in_", value),
-    FilterOperators.NOT_IN: lambda value: ("not_in", value),
+    FilterOperators.IN: lambda value: ("in_", list(value)),
+    FilterOperators.NOT_IN: lambda value: ("not_in", list(value)),
     FilterOperators.IS_NULL: lambda value: ("is_", None) if value is True else ("is_not", None),  # noqa: E501
-    FilterOperators.STARTSWITH: lambda value: ("like", f"{value}%"),
-    FilterOperators.ISTARTSWITH: lambda value: ("ilike", f"{value}%"),
-    FilterOperators.ENDSWITH: lambda value: ("like", f"%{value}"),
-    FilterOperators.IENDSWITH: lambda value: ("ilike", f"%{value}"),
-    FilterOperators.CONTAINS: lambda value: ("like", f"%{value}%"),
-    FilterOperators.ICONTAINS: lambda value: ("ilike", f"%{value}%"),
-    FilterOperators.IEXACT: lambda value: ("ilike", value),
+    FilterOperators.STARTSWITH: lambda value: ("like", f"{escape_like(value)}%"),
+    FilterOperators.ISTARTSWITH: lambda value: ("ilike", f"{escape_like(value)}%"),
+    FilterOperators.ENDSWITH: lambda value: ("like", f"%{escape_like(value)}"),
+    FilterOperators.IENDSWITH: lambda value: ("ilike", f"%{escape_like(value)}"),
+    FilterOperators.CONTAINS: lambda value: ("like", f"%{escape_like(value)}%"),
+    FilterOperators.ICONTAINS: lambda value: ("ilike", f"%{escape_like(value)}%"),
+    FilterOperators.IEXACT: lambda value: ("ilike", escape_like(value)),
 }
 
+# `startswith` as the range predicate (`Settings.startswith_as_range`),
+# the case-insensitive variant ranges over `lower(column)`
+_range_operator_transformer: Dict[str, _OperatorTransformer] = {
+    FilterOperators.STARTSWITH: lambda value: (
+        "range", (value, get_prefix_upper_bound(value))
+    ),
+    FilterOperators.ISTARTSWITH: lambda value: (
+        "irange", (value.lower(), get_prefix_upper_bound(value.lower()))
+    ),
+}
 
-def _get_search_criteria(
-        model_class: Any,
-        search_query: str,
-        searchable_fields: Optional[List[str]]
+_PARAM_PREFIX = "fq_"
+
+
+def _bind_value(
+        operator: str,
+        value: Any,
+        param_key: Optional[str]
+) -> Any:
+    """
+    Wraps the filter value into the named bind parameter, so the rendered
+    statement doesn't depend on the generated (anonymous) parameter names.
+    """
+    if param_key is None or value is None:
+        return value
+
+    return bindparam(
+        key=param_key,
+        value=value
+    )
+
+
+def _apply_operator(
+        model_field: Any,
+        operator: str,
+        value: Any,
+        param_key: Optional[str]
+) -> ColumnElement[bool]:
+    if operator in ("range", "irange"):
+        expression = func.lower(model_field) if operator == "irange" else model_field
+        lower_bound, upper_bound = value
+        criteria = expression >= _bind_value(
+            operator=operator,
+            value=lower_bound,
+            param_key=f"{param_key}__lower" if param_key else None
+        )
+
+        if upper_bound is None:
+            return criteria
+
+        return and_(criteria, expression < _bind_value(
+            operator=operator,
+            value=upper_bound,
+            param_key=f"{param_key}__upper" if param_key else None
+        ))
+
+    if operator in ("in_", "not_in"):
+        return InList(
+            column=model_field,
+            values=value,
+            negate=operator == "not_in",
+            param_key=param_key
+        )
+
+    value = _bind_value(
+        operator=operator,
+        value=value,
+        param_key=param_key
+    )
+
+    if operator in ("like", "ilike"):
+        return getattr(model_field, operator)(value, escape=LIKE_ESCAPE)
+
+    return getattr(model_field, operator)(value)
+
+
+class _BuildContext:
+    """
+    State shared by the plans while the criteria are built: the relationship
+    strategy and the joins requested by the JOIN strategy. Without the joins
+    accumulator the JOIN strategy can't be applied and EXISTS is used instead.
+    """
+
+    def __init__(
+            self,
+            strategy: RelationshipFilterStrategy = RelationshipFilterStrategy.EXISTS,
+            joins: Optional[List[Tuple[Any, bool]]] = None,
+            joined: Optional[Set[Any]] = None,
+            outer: bool = False
+    ) -> None:
+        if strategy == RelationshipFilterStrategy.JOIN and joins is None:
+            strategy = RelationshipFilterStrategy.EXISTS
+
+        self.strategy = strategy
+        self.joins = joins
+        self.joined = joined if joined is not None else set()
+        self.outer = outer
+
+    def derive(
+            self,
+            strategy: Optional[RelationshipFilterStrategy] = None,
+            outer: Optional[bool] = None
+    ) -> "_BuildContext":
+        return _BuildContext(
+            strategy=strategy or self.strategy,
+            joins=self.joins,
+            joined=self.joined,
+            outer=self.outer if outer is None else outer
+        )
+
+
+def _is_equi_join(
+        join_condition: Any,
+        pairs: Sequence[Tuple[Any, Any]]
+) -> bool:
+    return join_condition.compare(and_(*[
+        local == remote for local, remote in pairs
+    ]))
+
+
+@lru_cache(maxsize=None)
+def _get_in_subquery_columns(
+        prop: RelationshipProperty
+) -> Optional[Tuple[List[Any], List[Any]]]:
+    """
+    Returns the local and the remote (foreign key / association table) columns
+    of the relationship, None when the relationship has a custom join
+    condition that can't be expressed as a semi-join on the key columns.
+    """
+    if prop.secondary is not None:
+        pairs = prop.synchronize_pairs
+        is_simple = (
+                _is_equi_join(prop.primaryjoin, pairs) and
+                _is_equi_join(
+                    prop.secondaryjoin,
+                    prop.secondary_synchronize_pairs or []
+                )
+        )
+    else:
+        pairs = prop.local_remote_pairs
+        is_simple = _is_equi_join(prop.primaryjoin, pairs)
+
+    if not is_simple:
+        return None
+
+    return [local for local, _ in pairs], [remote for _, remote in pairs]
+
+
+def _relationship_criteria(
+        model_field: Any,
+        is_many: bool,
+        build_criteria: Callable[[_BuildContext], Optional[ColumnElement[bool]]],
+        context: _BuildContext
 ) -> Optional[ColumnElement[bool]]:
-    relationships: Dict[str, Relationship] = dict(inspect(model_class).relationships)
+    """
+    Wraps the criteria on the related model according to the relationship
+    strategy: correlated EXISTS (`any` / `has`), `fk IN (SELECT ...)`
+    semi-join or JOIN of the related model (registered in the context).
+    The JOIN strategy joins the to-one relationships only, the to-many ones
+    are semi-joined, so the rows are not repeated.
+    """
+    prop = model_field.property
+    strategy = context.strategy
+
+    if strategy == RelationshipFilterStrategy.JOIN and is_many:
+        # The to-many joins would repeat the rows, they are semi-joined
+        strategy = RelationshipFilterStrategy.IN
+
+    if (
+            strategy == RelationshipFilterStrategy.JOIN and
+            context.joins is not None and
+            prop.mapper.class_ not in context.joined
+    ):
+        # Each related model is joined once, so the criteria built for it
+        # reference the joined table unambiguously
+        context.joined.add(prop.mapper.class_)
+        context.joins.append((model_field, context.outer))
+
+        return build_criteria(context)
+
+    in_columns = None
+
+    if strategy == RelationshipFilterStrategy.IN:
+        in_columns = _get_in_subquery_columns(prop)
+
+    if in_columns is None:
+        strategy = RelationshipFilterStrategy.EXISTS
+
+    criteria = build_criteria(context.derive(strategy=strategy, outer=False))
+
+    if in_columns is None:
+        if is_many:
+            return model_field.any(criteria)
+
+        return model_field.has(criteria)
+
+    local_columns, remote_columns = in_columns
+    target = prop.target
+
+    if prop.secondary is not None:
+        target = prop.secondary.join(prop.target, prop.secondaryjoin)
+
+    subquery = select(*remote_columns).select_from(target).correlate(None)
+
+    if criteria is not None:
+        subquery = subquery.where(criteria)
+
+    if len(local_columns) == 1:
+        return local_columns[0].in_(subquery)
+
+    return tuple_(*local_columns).in_(subquery)
+
+
+class _SearchPlan:
+    """
+    Compiled search criteria for a single model and list of searchable fields
+    """
+
+    def __init__(
+            self,
+            model_class: Any,
+            path: str,
+            columns: List[Any],
+            relationships: List[Tuple[Any, bool, "_SearchPlan"]]
+    ) -> None:
+        self.model_class = model_class
+        self.path = path
+        self.columns = columns
+        self.relationships = relationships
+
+    def _build_full_text(
+            self,
+            search_query: str,
+            pattern: Any,
+            param_key: Optional[str],
+            options: SearchOptions
+    ) -> Optional[ColumnElement[bool]]:
+        fts_query = to_fts5_query(search_query)
+
+        # Queries without words can't be matched as full text
+        if fts_query is None:
+            return None
+
+        vector_field = options.vector_fields.get(self.path)
+        primary_key = inspect(self.model_class).primary_key
+
+        return FullTextMatch(
+            columns=self.columns,
+            pattern=pattern,
+            query=_bind_value(
+                operator="match",
+                value=search_query,
+                param_key=f"{param_key}__query" if param_key else None
+            ),
+            fts_query=_bind_value(
+                operator="match",
+                value=fts_query,
+                param_key=f"{param_key}__fts" if param_key else None
+            ),
+            config=options.config,
+            vector=(
+                getattr(self.model_class, vector_field)
+                if vector_field else None
+            ),
+            fts_table=options.fts_tables.get(self.path),
+            primary_key=primary_key[0] if len(primary_key) == 1 else None
+        )
+
+    def build(
+            self,
+            search_query: str,
+            param_key: Optional[str] = None,
+            context: Optional[_BuildContext] = None,
+            options: Optional[SearchOptions] = None
+    ) -> Optional[ColumnElement[bool]]:
+        context = context or _BuildContext()
+        options = options or SearchOptions()
+        pattern = _bind_value(
+            operator="ilike",
+            value=f"%{escape_like(search_query)}%",
+            param_key=param_key
+        )
+        full_text_criteria = None
+
+        if options.mode == SearchMode.FULL_TEXT and self.columns:
+            full_text_criteria = self._build_full_text(
+                search_query=search_query,
+                pattern=pattern,
+                param_key=param_key,
+                options=options
+            )
+
+        if full_text_criteria is not None:
+            res = [full_text_criteria]
+        else:
+            res = [
+                column.ilike(pattern, escape=LIKE_ESCAPE)
+                for column in self.columns
+            ]
+
+        for model_field, is_many, nested_plan in self.relationships:
+            # Alternatives are OR-ed, so the joined models must not
+            # drop the rows without related items
+            criteria = _relationship_criteria(
+                model_field=model_field,
+                is_many=is_many,
+                build_criteria=partial(
+                    nested_plan.build,
+                    search_query,
+                    param_key,
+                    options=options
+                ),
+                context=context.derive(outer=True)
+            )
+
+            if criteria is not None:
+                res.append(criteria)
+
+        if not res:
+            return None
+
+        if len(res) == 1:
+            return res[0]
+
+        return or_(*res)
+
+
+class _PredicateGroup:
+    """
+    AND-ed predicates of the filters grouped by the relationship path, so each
+    relationship is probed once per row (one EXISTS / semi-join / join) and
+    all the predicates on it apply to the same related row
+    """
+
+    def __init__(self, param_keys: Optional[Set[str]] = None) -> None:
+        self.criteria: List[ColumnElement[bool]] = []
+        self.relationships: Dict[str, Tuple[Any, bool, "_PredicateGroup"]] = {}
+        # Bind parameter keys used by the predicates of the whole group tree
+        self.param_keys = param_keys if param_keys is not None else set()
+
+    def unique_param_key(self, param_key: str) -> str:
+        """
+        Returns the bind parameter key not used by the other predicates,
+        e.g. the flat `items__qty` filter and the `qty` filter of the nested
+        `items` filters would both be bound to `fq_items__qty`
+        """
+        res = param_key
+        suffix = 1
+
+        while res in self.param_keys:
+            suffix += 1
+            res = f"{param_key}_{suffix}"
+
+        self.param_keys.add(res)
+
+        return res
+
+    def relationship(
+            self,
+            model_field: Any,
+            is_many: bool
+    ) -> "_PredicateGroup":
+        if model_field.key not in self.relationships:
+            self.relationships[model_field.key] = (
+                model_field,
+                is_many,
+                _PredicateGroup(param_keys=self.param_keys)
+            )
+
+        return self.relationships[model_field.key][2]
+
+    def render(
+            self,
+            context: Optional[_BuildContext] = None
+    ) -> List[ColumnElement[bool]]:
+        context = context or _BuildContext()
+        res = list(self.criteria)
+
+        for model_field, is_many, group in self.relationships.values():
+            criteria = _relationship_criteria(
+                model_field=model_field,
+                is_many=is_many,
+                build_criteria=group.render_conjunction,
+                context=context
+            )
+
+            if criteria is not None:
+                res.append(criteria)
+
+        return res
+
+    def render_conjunction(
+            self,
+            context: Optional[_BuildContext] = None
+    ) -> Optional[ColumnElement[bool]]:
+        res = self.render(context=context)
+
+        return and_(*res) if res else None
+
+
+class _FieldPlan:
+    """
+    Compiled filter field, adds the ORM criteria for the field value
+    to the predicate group
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def collect(
+            self,
+            value: Any,
+            group: _PredicateGroup,
+            param_key: Optional[str] = None,
+            context: Optional[_BuildContext] = None
+    ) -> None:
+        raise NotImplementedError
+
+
+class _ColumnFieldPlan(_FieldPlan):
+
+    def __init__(
+            self,
+            name: str,
+            model_field: Any,
+            transformer: Callable[[Any], Tuple[str, Any]]
+    ) -> None:
+        super().__init__(name=name)
+        self.model_field = model_field
+        self.transformer = transformer
+
+    def collect(
+            self,
+            value: Any,
+            group: _PredicateGroup,
+            param_key: Optional[str] = None,
+            context: Optional[_BuildContext] = None
+    ) -> None:
+        operator, value = self.transformer(value)
+
+        group.criteria.append(_apply_operator(
+            model_field=self.model_field,
+            operator=operator,
+            value=value,
+            param_key=param_key
+        ))
+
+
+class _PathFieldPlan(_FieldPlan):
+    """
+    Filter field on the column of a related model (`relationship__column__op`)
+    """
+
+    def __init__(
+            self,
+            name: str,
+            path: List[Tuple[Any, bool]],
+            column_plan: _ColumnFieldPlan
+    ) -> None:
+        super().__init__(name=name)
+        self.path = path
+        self.column_plan = column_plan
+
+    def collect(
+            self,
+            value: Any,
+            group: _PredicateGroup,
+            param_key: Optional[str] = None,
+            context: Optional[_BuildContext] = None
+    ) -> None:
+        for model_field, is_many in self.path:
+            group = group.relationship(
+                model_field=model_field,
+                is_many=is_many
+            )
+
+        self.column_plan.collect(
+            value=value,
+            group=group,
+            param_key=param_key,
+            context=context
+        )
+
 
-    res = []
+class _RelationshipFieldPlan(_FieldPlan):
 
-    fields = searchable_fields or []
+    def __init__(
+            self,
+            name: str,
+            model_field: Any,
+            is_many: bool,
+            related_model_class: Any,
+            nested_plan: "_FilterPlan"
+    ) -> None:
+        super().__init__(name=name)
+        self.model_field = model_field
+        self.is_many = is_many
+        self.related_model_class = related_model_class
+        self.nested_plan = nested_plan
+
+    def collect(
+            self,
+            value: Any,
+            group: _PredicateGroup,
+            param_key: Optional[str] = None,
+            context: Optional[_BuildContext] = None
+    ) -> None:
+        nested_plan = self.nested_plan
+        filter_class: Type[BaseFilterParams] = type(value)
+
+        if filter_class is not nested_plan.filter_class:
+            nested_plan = compile_filters(
+                model_class=self.related_model_class,
+                filter_class=filter_class
+            )
+
+        # The group is created even for the empty nested filters,
+        # so the existence of the related row is still required
+        nested_plan.collect(
+            filters=value,
+            group=group.relationship(
+                model_field=self.model_field,
+                is_many=self.is_many
+            ),
+            param_prefix=f"{param_key}__" if param_key is not None else None,
+            context=context
+        )
+
+
+class _SearchFieldPlan(_FieldPlan):
+
+    def __init__(
+            self,
+            name: str,
+            search_plan: _SearchPlan,
+            options: SearchOptions
+    ) -> None:
+        super().__init__(name=name)
+        self.search_plan = search_plan
+        self.options = options
+
+    def collect(
+            self,
+            value: Any,
+            group: _PredicateGroup,
+            param_key: Optional[str] = None,
+            context: Optional[_BuildContext] = None
+    ) -> None:
+        # The search alternatives are OR-ed with the columns of the model,
+        # so they can't be merged with the relationship groups
+        criteria = self.search_plan.build(
+            search_query=value,
+            param_key=param_key,
+            context=context,
+            options=self.options
+        )
+
+        if criteria is not None:
+            group.criteria.append(criteria)
+
+
+class _InvalidFieldPlan(_FieldPlan):
+    """
+    Field that can't be applied to the model. The error is deferred until the
+    field is actually used, so unused invalid fields behave as before.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            message: str,
+            strict: bool = True
+    ) -> None:
+        super().__init__(name=name)
+        self.message = message
+        self.strict = strict
+
+    def collect(
+            self,
+            value: Any,
+            group: _PredicateGroup,
+            param_key: Optional[str] = None,
+            context: Optional[_BuildContext] = None
+    ) -> None:
+        if self.strict or value:
+            raise ValueError(self.message)
+
+
+class _FilterPlan:
+    """
+    Compiled filters for a single (model class, filter class) pair
+    """
+
+    def __init__(
+            self,
+            model_class: Any,
+            filter_class: Type[BaseFilterParams],
+            fields: List[_FieldPlan]
+    ) -> None:
+        self.model_class = model_class
+        self.filter_class = filter_class
+        self.fields = fields
+
+    def collect(
+            self,
+            filters: BaseFilterParams,
+            group: _PredicateGroup,
+            param_prefix: Optional[str] = None,
+            context: Optional[_BuildContext] = None
+    ) -> None:
+        for field in self.fields:
+            value = getattr(filters, field.name, None)
+
+            if value is None:
+                continue
+
+            field.collect(
+                value=value,
+                group=group,
+                param_key=(
+                    group.unique_param_key(f"{param_prefix}{field.name}")
+                    if param_prefix is not None else None
+                ),
+                context=context
+            )
+
+    def build(
+            self,
+            filters: BaseFilterParams,
+            param_prefix: Optional[str] = None,
+            context: Optional[_BuildContext] = None
+    ) -> List[ColumnElement[bool]]:
+        group = _PredicateGroup()
+
+        self.collect(
+            filters=filters,
+            group=group,
+            param_prefix=param_prefix,
+            context=context
+        )
+
+        return group.render(context=context)
+
+
+@lru_cache(maxsize=None)
+def _compile_search(
+        model_class: Any,
+        searchable_fields: Tuple[str, ...],
+        path: str = ""
+) -> _SearchPlan:
+    relationships: Dict[str, Relationship] = dict(inspect(model_class).relationships)
+
+    columns = []
     nested_searchable_fields: Dict[str, List[str]] = {
         field: [] for field in relationships.keys()
     }
 
-    for path in fields:
-        field_name, *parts = path.split("__")
+    for searchable_field in searchable_fields:
+        field_name, *parts = searchable_field.split("__")
         if field_name in relationships:
             nested_searchable_fields[field_name].append("__".join(parts))
         elif hasattr(model_class, field_name):
-            model_field = getattr(model_class, field_name)
-            res.append(model_field.ilike(f"%{search_query}%"))
+            columns.append(getattr(model_class, field_name))
         else:
             raise ValueError(
                 f"{field_name} is not valid field for [{model_class.__name__}] model!"
             )
 
+    nested_plans = []
+
     for rel, nest_searchable_fields in nested_searchable_fields.items():
         if not nest_searchable_fields:
             continue
 
-        is_many = relationships[rel].uselist
-        model_field = getattr(model_class, rel)
+        related_model_class: Any = relationships[rel].mapper.class_  # noqa
+
+        nested_plans.append((
+            getattr(model_class, rel),
+            bool(relationships[rel].uselist),
+            _compile_search(
+                model_class=related_model_class,
+                searchable_fields=tuple(nest_searchable_fields),
+                path=f"{path}__{rel}" if path else rel
+            )
+        ))
+
+    return _SearchPlan(
+        model_class=model_class,
+        path=path,
+        columns=columns,
+        relationships=nested_plans
+    )
+
+
+def _resolve_path(
+        model_class: Any,
+        field_name: str
+) -> Optional[Tuple[List[Tuple[Any, bool]], Any]]:
+    """
+    Resolves `relationship__...__column` to the relationships
+    along the path and the column of the last related model
+    """
+    *relationship_names, column_name = field_name.split("__")
+    path = []
+
+    for relationship_name in relationship_names:
+        relationships = inspect(model_class).relationships
+
+        if relationship_name not in relationships:
+            return None
 
-        criteria = _get_search_criteria(
-            model_class=relationships[rel].mapper.class_,  # noqa
-            search_query=search_query,
-            searchable_fields=nest_searchable_fields
+        path.append((
+            getattr(model_class, relationship_name),
+            relationships[relationship_name].uselist
+        ))
+        model_class = relationships[relationship_name].mapper.class_
+
+    if not hasattr(model_class, column_name):
+        return None
+
+    return path, getattr(model_class, column_name)
+
+
+def _compile_column_field(
+        model_class: Any,
+        name: str,
+        field_name: str,
+        transformer: Callable[[Any], Tuple[str, Any]]
+) -> _FieldPlan:
+    if "__" in field_name:
+        resolved_path = _resolve_path(
+            model_class=model_class,
+            field_name=field_name
         )
 
-        if is_many:
-            res.append(
-                model_field.any(criteria)
+        if resolved_path is not None:
+            path, model_field = resolved_path
+
+            return _PathFieldPlan(
+                name=name,
+                path=path,
+                column_plan=_ColumnFieldPlan(
+                    name=name,
+                    model_field=model_field,
+                    transformer=transformer
+                )
             )
+    elif hasattr(model_class, field_name):
+        return _ColumnFieldPlan(
+            name=name,
+            model_field=getattr(model_class, field_name),
+            transformer=transformer
+        )
+
+    return _InvalidFieldPlan(
+        name=name,
+        message=f"Invalid {model_class.__name__} Field - {field_name}",
+        strict=False
+    )
+
+
+def _compile_field(
+        model_class: Any,
+        filter_class: Type[BaseFilterParams],
+        relationships: Dict[str, Relationship],
+        name: str,
+        field_type: Any
+) -> _FieldPlan:
+    field_name = name
+    transformer = _orm_operator_transformer[FilterOperators.EQ]
+
+    if "__" in name:
+        parts = name.split("__")
+        field_name, operator = "__".join(parts[:-1]), parts[-1]
+
+        if (
+                operator in _range_operator_transformer and
+                getattr(filter_class.Settings, "startswith_as_range", False)
+        ):
+            transformer = _range_operator_transformer[operator]
+        elif operator in _orm_operator_transformer:
+            transformer = _orm_operator_transformer[operator]
+        elif parts[0] in relationships:
+            # Relationship path with the implicit `eq` operator
+            field_name = name
         else:
-            res.append(
-                model_field.has(criteria)
+            return _InvalidFieldPlan(
+                name=name,
+                message=f"Invalid Filter Operator - {operator}"
             )
 
-    if not res:
-        return None
+    if field_name == filter_class.Settings.search_field:
+        try:
+            search_plan = _compile_search(
+                model_class=model_class,
+                searchable_fields=tuple(filter_class.Settings.searchable_fields or [])
+            )
+        except ValueError as err:
+            return _InvalidFieldPlan(
+                name=name,
+                message=str(err)
+            )
+
+        return _SearchFieldPlan(
+            name=name,
+            search_plan=search_plan,
+            options=SearchOptions.from_settings(filter_class.Settings)
+        )
 
-    if len(res) == 1:
-        return res[0]
+    if check_nested_filter_type(field_type):
+        if field_name not in relationships:
+            return _InvalidFieldPlan(
+                name=name,
+                message=f"Invalid {model_class.__name__} Field - {field_name}",
+                strict=False
+            )
+
+        related_model_class: Any = relationships[field_name].mapper.class_  # noqa
+        nested_filter_class: Type[BaseFilterParams] = (
+            get_optional_subtype(field_type) or field_type
+        )
 
-    return or_(*res)
+        return _RelationshipFieldPlan(
+            name=name,
+            model_field=getattr(model_class, field_name),
+            is_many=bool(relationships[field_name].uselist),
+            related_model_class=related_model_class,
+            nested_plan=compile_filters(
+                model_class=related_model_class,
+                filter_class=nested_filter_class
+            )
+        )
 
+    return _compile_column_field(
+        model_class=model_class,
+        name=name,
+        field_name=field_name,
+        transformer=transformer
+    )
 
-def _get_orm_filters(
+
+@lru_cache(maxsize=None)
+def compile_filters(
         model_class: Any,
-        filters: BaseFilterParams
-) -> List[Any]:
+        filter_class: Type[BaseFilterParams]
+) -> _FilterPlan:
+    """
+    Compiles (and caches) the filter plan for the model and filter class pair.
+    Called implicitly by `apply_filters`, but can be called at startup
+    to avoid paying the compilation cost on the first request.
+
+    Parameters:
+        model_class (Any): SQLAlchemy Model Class
+        filter_class (Type[BaseFilterParams]): Filter Params Schema
+
+    Returns:
+        filter_plan (_FilterPlan): Compiled Filter Plan
+    """
     relationships: Dict[str, Relationship] = dict(inspect(model_class).relationships)
+    model_fields = _get_model_fields(filter_class)
 
-    res = []
-    filter_fields = _model_dump(filters, exclude_none=True)
+    fields = [
+        _compile_field(
+            model_class=model_class,
+            filter_class=filter_class,
+            relationships=relationships,
+            name=name,
+            field_type=filter_class.__annotations__.get(name, f.type_)
+        )
+        for name, f in model_fields.items()
+    ]
 
-    for field_name, value in filter_fields.items():
-        if "__" in field_name:
-            parts = field_name.split("__")
-            field_name, operator = "__".join(parts[:-1]), parts[-1]
+    return _FilterPlan(
+        model_class=model_class,
+        filter_class=filter_class,
+        fields=fields
+    )
 
-            if operator not in _orm_operator_transformer:
-                raise ValueError(f"Invalid Filter Operator - {operator}")
 
-            operator, value = _orm_operator_transformer[operator](value)
-        else:
-            operator = "__eq__"
+def _get_relationship_strategy(
+        filter_class: Type[BaseFilterParams],
+        relationship_strategy: Optional[RelationshipFilterStrategy]
+) -> RelationshipFilterStrategy:
+    if relationship_strategy is not None:
+        return relationship_strategy
 
-        if field_name == filters.Settings.search_field:
+    return getattr(
+        filter_class.Settings,
+        "relationship_strategy",
+        RelationshipFilterStrategy.EXISTS
+    )
 
-            criteria = _get_search_criteria(
-                model_class=model_class,
-                search_query=value,
-                searchable_fields=filters.Settings.searchable_fields
-            )
-            if criteria is not None:
-                res.append(criteria)
 
-        elif (
-                isinstance(value, dict) and
-                field_name in relationships and
-                relationships[field_name]
-        ):
+def _get_search_criteria(
+        model_class: Any,
+        search_query: str,
+        searchable_fields: Optional[List[str]],
+        relationship_strategy: RelationshipFilterStrategy = (
+            RelationshipFilterStrategy.EXISTS
+        ),
+        joins: Optional[List[Tuple[Any, bool]]] = None,
+        search_options: Optional[SearchOptions] = None
+) -> Optional[ColumnElement[bool]]:
+    search_plan = _compile_search(
+        model_class=model_class,
+        searchable_fields=tuple(searchable_fields or [])
+    )
 
-            is_many = relationships[field_name].uselist
-            nested_orm_filters = _get_orm_filters(
-                model_class=relationships[field_name].mapper.class_,  # noqa
-                filters=getattr(filters, field_name)
-            )
+    return search_plan.build(
+        search_query=search_query,
+        context=_BuildContext(
+            strategy=relationship_strategy,
+            joins=joins,
+            joined={model_class}
+        ),
+        options=search_options
+    )
 
-            model_field = getattr(model_class, field_name)
-            if is_many:
-                res.append(
-                    model_field.any(and_(*nested_orm_filters))
-                )
-            else:
-                res.append(
-                    model_field.has(and_(*nested_orm_filters))
-                )
 
-        elif hasattr(model_class, field_name):
-            model_field = getattr(model_class, field_name)
-            res.append(getattr(model_field, operator)(value))
+def _get_orm_filters(
+        model_class: Any,
+        filters: BaseFilterParams,
+        named_params: bool = False,
+        relationship_strategy: Optional[RelationshipFilterStrategy] = None,
+        joins: Optional[List[Tuple[Any, bool]]] = None
+) -> List[Any]:
+    filter_plan = compile_filters(
+        model_class=model_class,
+        filter_class=type(filters)
+    )
+
+    return filter_plan.build(
+        filters=filters,
+        param_prefix=_PARAM_PREFIX if named_params else None,
+        context=_BuildContext(
+            strategy=_get_relationship_strategy(
+                filter_class=type(filters),
+                relationship_strategy=relationship_strategy
+            ),
+            joins=joins,
+            joined={model_class}
+        )
+    )
 
-        elif value:
-            raise ValueError(
-                f"Invalid {model_class.__name__} Field - {field_name}"
-            )
 
-    return res
+def _apply_joins(
+        stmt: Union[Select, Query],
+        joins: List[Tuple[Any, bool]]
+) -> Union[Select, Query]:
+    """
+    Joins the related models (to-one relationships) requested by the JOIN strategy
+    """
+    for model_field, is_outer in joins:
+        stmt = stmt.join(model_field, isouter=is_outer)
+
+    return stmt
 
 
 def apply_filters(
         model_class: Any,
         stmt: Union[Select, Query],
-        filters: Optional[BaseFilterParams]
+        filters: Optional[BaseFilterParams],
+        named_params: bool = False,
+        relationship_strategy: Optional[RelationshipFilterStrategy] = None
 ) -> Union[Select, Query]:
     """
     Function for applying filters to the query object
@@ -162,6 +1040,12 @@ def apply_filters(
         model_class (Any): SQLAlchemy Model Class
         stmt (Union[Select, Query]): Pre-constructed Select Statement
         filters (BaseFilterParams): Comma-separated fields / field-paths
+        named_params (bool): Bind filter values to parameters named after the
+            filter fields, so the same set of active filters always renders
+            the same SQL string
+        relationship_strategy (Optional[RelationshipFilterStrategy]): How the
+            nested filters and the nested search fields are applied, overrides
+            `relationship_strategy` of the filter class Settings
 
     Returns:
         result_stmt (Union[Select, Query]): Result Statement
@@ -170,11 +1054,21 @@ def apply_filters(
     if not filters:
         return stmt
 
+    register(filter_class=type(filters), model_class=model_class)
+
+    joins: List[Tuple[Any, bool]] = []
+
     orm_filters = _get_orm_filters(
         model_class=model_class,
-        filters=filters
+        filters=filters,
+        named_params=named_params,
+        relationship_strategy=relationship_strategy,
+        joins=joins
     )
 
+    if joins:
+        stmt = _apply_joins(stmt=stmt, joins=joins)
+
     if not orm_filters:
         return stmt
 
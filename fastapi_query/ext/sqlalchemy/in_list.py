@@ -0,0 +1,147 @@
+import json
+from typing import Any, List, Optional
+
+from sqlalchemy import (
+    Boolean,
+    Enum,
+    Integer,
+    String,
+    all_,
+    any_,
+    bindparam,
+    func,
+    select
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+
+class _ListType(TypeDecorator):
+    """
+    The whole list bound to a single parameter: an array for PostgreSQL,
+    a JSON array (expanded with `json_each`) for the other dialects
+    """
+    impl = String
+    cache_ok = True
+
+    def __init__(self, item_type: TypeEngine) -> None:
+        super().__init__()
+        self.item_type = item_type
+
+    def load_dialect_impl(self, dialect: Any) -> TypeEngine:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(self.item_type))
+
+        return dialect.type_descriptor(String())
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+
+        return json.dumps(list(value))
+
+
+def _is_plain_type(type_: TypeEngine) -> bool:
+    # The list parameter skips the bind processing of the column type
+    # (e.g. Enum stores the names), so only the plain types can use it
+    return (
+        isinstance(type_, (Integer, String))
+        and not isinstance(type_, (Enum, TypeDecorator))
+    )
+
+
+def _is_single_param_safe(type_: TypeEngine, values: List[Any]) -> bool:
+    return _is_plain_type(type_) and all(
+        isinstance(value, (int, float, str)) and not isinstance(value, bool)
+        for value in values
+    )
+
+
+class InList(ColumnElement[bool]):
+    """
+    `column IN (values)` (or `NOT IN`) with the statement shape independent
+    of the number of values.
+
+    Compiles to `column = ANY(:values)` (`!= ALL`) with a single array
+    parameter for PostgreSQL, to `column IN (SELECT value FROM
+    json_each(:values))` for SQLite, and to the expanding `IN` otherwise.
+    The single parameter is used only for the plain Integer / String
+    columns and JSON-safe values.
+    """
+    __visit_name__ = "in_list"
+    inherit_cache = True
+    type = Boolean()
+    _is_implicitly_boolean = True
+
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("values_param", InternalTraversal.dp_clauseelement),
+        ("expanding_param", InternalTraversal.dp_clauseelement),
+        ("negate", InternalTraversal.dp_boolean),
+        ("single_param", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(
+            self,
+            column: Any,
+            values: List[Any],
+            negate: bool = False,
+            param_key: Optional[str] = None
+    ) -> None:
+        self.column = column.expression
+        self.values_param = bindparam(
+            key=f"{param_key}__list" if param_key else None,
+            value=values,
+            type_=_ListType(self.column.type)
+        )
+        self.expanding_param = bindparam(
+            key=param_key,
+            value=values,
+            type_=self.column.type,
+            expanding=True
+        )
+        self.negate = negate
+        self.single_param = _is_single_param_safe(self.column.type, values)
+
+
+@compiles(InList)
+def _compile_in_list(element: InList, compiler: Any, **kw: Any) -> str:
+    if element.negate:
+        criteria = element.column.not_in(element.expanding_param)
+    else:
+        criteria = element.column.in_(element.expanding_param)
+
+    return compiler.process(criteria, **kw)
+
+
+@compiles(InList, "postgresql")
+def _compile_in_list_postgresql(element: InList, compiler: Any, **kw: Any) -> str:
+    if not element.single_param:
+        return _compile_in_list(element, compiler, **kw)
+
+    if element.negate:
+        criteria = element.column != all_(element.values_param)
+    else:
+        criteria = element.column == any_(element.values_param)
+
+    return compiler.process(criteria, **kw)
+
+
+@compiles(InList, "sqlite")
+def _compile_in_list_sqlite(element: InList, compiler: Any, **kw: Any) -> str:
+    if not element.single_param:
+        return _compile_in_list(element, compiler, **kw)
+
+    values = select(
+        func.json_each(element.values_param).table_valued("value").c.value
+    )
+
+    if element.negate:
+        criteria = element.column.not_in(values)
+    else:
+        criteria = element.column.in_(values)
+
+    return compiler.process(criteria, **kw)
@@ -1,88 +1,363 @@
-from typing import Any, Optional, List, Dict, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Optional,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+    Union
+)
 
-from sqlalchemy import Select, inspect
-from sqlalchemy.orm import Relationship, Query
+from sqlalchemy import Select, func, inspect, select
+from sqlalchemy.orm import Query, QueryableAttribute, aliased
+from sqlalchemy.sql import Join
+from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.util import find_tables
 
+from fastapi_query.registry import register
+from fastapi_query.utils import filter_ordering_fields
+from .utils import get_select_statement
 
-def _get_field(
+# Max number of resolved (model, order by) pairs kept in the cache
+ORDERING_CACHE_SIZE = 256
+
+
+class _OrderingTerm(NamedTuple):
+    expression: Any
+    desc: bool
+    # To-one relationships the statement has to be (outer) joined with
+    joins: Tuple[Any, ...]
+    # Field of the last joined model, None for the aggregates
+    field_name: Optional[str] = None
+
+
+def _resolve_field_path(
     model_class: Any,
     field_path: List[str]
-):
+) -> Optional[Tuple[Tuple[Any, ...], str]]:
     """
-    Returns Model Fields based on the field path
+    Resolves the field path to the relationships on the path
+    and the field name on the last model
 
     Parameters:
         model_class (Any): SQLAlchemy Model Class
         field_path (List[str]): Field Path
 
     Returns:
-        result_field (Any): Result Model Field
+        result (Optional[Tuple[Tuple[Any, ...], str]]): Relationship Attributes
+            and Field Name, None when the path is not valid
     """
-    field_path = list(filter(lambda item: len(item.strip()) > 0, field_path))
+    field_path = [item for item in field_path if item.strip()]
 
     if not field_path:
         return None
 
-    field_name = field_path[0]
+    *relationship_names, field_name = field_path
+    relationships = []
+
+    for name in relationship_names:
+        if name not in inspect(model_class).relationships:
+            return None
+
+        relationship = getattr(model_class, name)
+        relationships.append(relationship)
+        model_class = relationship.property.mapper.class_
 
     if not hasattr(model_class, field_name):
         return None
 
-    if len(field_path) == 1:
-        return getattr(model_class, field_name)
+    return tuple(relationships), field_name
+
+
+def _get_aggregate_expression(
+        model_class: Any,
+        relationships: Tuple[Any, ...],
+        field_name: str,
+        desc: bool
+) -> Any:
+    """
+    Returns the correlated subquery selecting the min (max when desc)
+    of the related values, so the to-many paths do not fan out the rows
+    """
+    root = aliased(model_class)
+    joins = []
+    parent = root
+
+    for relationship in relationships:
+        target = aliased(relationship.property.mapper.class_)
+        joins.append(getattr(parent, relationship.key).of_type(target))
+        parent = target
 
-    relationships: Dict[str, Relationship] = dict(inspect(model_class).relationships)
+    column = getattr(parent, field_name)
+    subquery = select(
+        func.max(column) if desc else func.min(column)
+    ).select_from(root)
 
-    if field_name not in relationships:
+    for join in joins:
+        subquery = subquery.join(join)
+
+    mapper = inspect(model_class)
+
+    return subquery.where(*[
+        getattr(root, key) == getattr(model_class, key)
+        for key in (
+            mapper.get_property_by_column(pk_column).key
+            for pk_column in mapper.primary_key
+        )
+    ]).scalar_subquery()
+
+
+def _resolve_ordering_term(
+        model_class: Any,
+        field: str
+) -> Optional[_OrderingTerm]:
+    desc = False
+    if field.startswith(("-", "+")):
+        desc = field[0] == "-"
+        field = field[1:]
+
+    resolved_path = _resolve_field_path(
+        model_class=model_class,
+        field_path=field.split("__")
+    )
+
+    if resolved_path is None:
         return None
 
-    return _get_field(
-        model_class=relationships[field_name].mapper.class_,  # noqa
-        field_path=field_path[1:]
+    relationships, field_name = resolved_path
+    mapper = inspect(model_class)
+    targets = [relationship.property.mapper for relationship in relationships]
+
+    # To-many and self-referential paths are ordered by an aggregate
+    # of the related values instead of being joined
+    if any(
+            relationship.property.uselist or target.isa(mapper)
+            for relationship, target in zip(relationships, targets)  # noqa: B905
+    ):
+        return _OrderingTerm(
+            expression=_get_aggregate_expression(
+                model_class=model_class,
+                relationships=relationships,
+                field_name=field_name,
+                desc=desc
+            ),
+            desc=desc,
+            joins=()
+        )
+
+    parent = targets[-1].class_ if targets else model_class
+
+    return _OrderingTerm(
+        expression=getattr(parent, field_name),
+        desc=desc,
+        joins=relationships,
+        field_name=field_name
     )
 
 
-def apply_ordering(
+@lru_cache(maxsize=ORDERING_CACHE_SIZE)
+def _resolve_ordering_terms(
+        model_class: Any,
+        order_by: str
+) -> Tuple[_OrderingTerm, ...]:
+    """
+    Resolves the order by string to the ordering terms (cached)
+    """
+    terms = []
+
+    for field in order_by.split(","):
+        term = _resolve_ordering_term(
+            model_class=model_class,
+            field=field.strip()
+        )
+
+        if term is not None:
+            terms.append(term)
+
+    return tuple(terms)
+
+
+def _get_ordering_terms(
         model_class: Any,
+        order_by: Optional[str],
+        allowed_fields: Optional[Collection[str]] = None
+) -> Tuple[_OrderingTerm, ...]:
+    if order_by and allowed_fields is not None:
+        order_by = filter_ordering_fields(
+            order_by=order_by,
+            allowed_fields=allowed_fields
+        )
+
+    if not order_by:
+        return ()
+
+    return _resolve_ordering_terms(
+        model_class=model_class,
+        order_by=order_by
+    )
+
+
+def _get_joined_tables(stmt: Union[Select, Query]) -> Set[Any]:
+    """
+    Returns the tables the statement is already joined with
+    """
+    tables: Set[Any] = set()
+
+    for from_clause in get_select_statement(stmt).get_final_froms():
+        if isinstance(from_clause, Join):
+            tables.update(find_tables(from_clause))
+
+    return tables
+
+
+def _is_relationship_joined(
         stmt: Union[Select, Query],
-        order_by: Optional[str]
-) -> Union[Select, Query]:
+        prop: Any
+) -> bool:
+    """
+    Returns True when the statement is joined with the (not aliased) target
+    of the relationship through the relationship itself or its ON clause
+    """
+    for target, onclause, *_ in stmt._setup_joins:  # noqa
+        for item in (target, onclause):
+            if (
+                    isinstance(item, QueryableAttribute) and
+                    item.property is prop and
+                    item.parent.is_mapper and
+                    getattr(item, "_of_type", None) is None
+            ):
+                return True
+
+        if (
+                isinstance(onclause, ClauseElement) and
+                onclause.compare(prop.primaryjoin)
+        ):
+            return True
+
+    return False
+
+
+def _apply_ordering_joins(
+        stmt: Union[Select, Query],
+        terms: Tuple[_OrderingTerm, ...]
+) -> Tuple[Union[Select, Query], List[Tuple[Any, bool]]]:
     """
-    Function for applying order by on the query object
+    Outer joins the relationships the ordering terms depend on, the ones
+    already joined (e.g. by filtering) are not joined again. The target
+    whose table is joined through another relationship is joined aliased.
 
     Parameters:
-        model_class (Any): SQLAlchemy Model Class
         stmt (Union[Select, Query]): Pre-constructed Select Statement
-        order_by (Optional[str]): Comma-separated fields / field-paths
+        terms (Tuple[_OrderingTerm, ...]): Resolved Ordering Terms
 
     Returns:
-        result_stmt (Union[Select, Query]): Result Statement
+        result (Tuple[Union[Select, Query], List[Tuple[Any, bool]]]): Joined
+            Statement and Pairs of model field and desc flag
     """
+    if not any(term.joins for term in terms):
+        return stmt, [(term.expression, term.desc) for term in terms]
 
-    if not order_by:
-        return stmt
+    joined_tables = _get_joined_tables(stmt)
+    # Joined target (None when not aliased) by the parent and relationship
+    joined: Dict[Tuple[Any, Any], Any] = {}
+    criteria = []
 
-    fields = order_by.split(",")
-    criterion = []
+    for term in terms:
+        parent = None
 
-    for field in fields:
-        field = field.strip()
-        desc = False
-        if field.startswith(("-", "+")):
-            desc = field[0] == "-"
-            field = field[1:]
+        for relationship in term.joins:
+            prop = relationship.property
+            key = (parent, prop)
 
-        model_field = _get_field(
-            model_class=model_class,
-            field_path=field.split("__")
+            if key not in joined:
+                table = prop.mapper.local_table
+
+                if parent is None and _is_relationship_joined(stmt, prop):
+                    target = None
+                elif parent is None and table not in joined_tables:
+                    stmt = stmt.outerjoin(relationship)
+                    target = None
+                else:
+                    target = aliased(prop.mapper.class_)
+                    attribute = getattr(parent, prop.key) if parent else relationship
+                    stmt = stmt.outerjoin(attribute.of_type(target))
+
+                joined_tables.add(table)
+                joined[key] = target
+
+            parent = joined[key]
+
+        expression = (
+            getattr(parent, term.field_name)
+            if parent is not None and term.field_name is not None
+            else term.expression
         )
+        criteria.append((expression, term.desc))
+
+    return stmt, criteria
+
 
-        if not model_field:
-            continue
+def _prepare_ordering(
+        model_class: Any,
+        stmt: Union[Select, Query],
+        order_by: Optional[str],
+        allowed_fields: Optional[Collection[str]] = None
+) -> Tuple[Union[Select, Query], List[Tuple[Any, bool]]]:
+    """
+    Joins the statement with the relationships the ordering depends on
 
-        criterion.append(model_field.desc() if desc else model_field)
+    Returns:
+        result (Tuple[Union[Select, Query], List[Tuple[Any, bool]]]): Joined
+            Statement and Pairs of model field and desc flag
+    """
+    if allowed_fields is not None:
+        register(model_class=model_class, ordering_fields=allowed_fields)
+
+    terms = _get_ordering_terms(
+        model_class=model_class,
+        order_by=order_by,
+        allowed_fields=allowed_fields
+    )
+
+    return _apply_ordering_joins(stmt=stmt, terms=terms)
+
+
+def apply_ordering(
+        model_class: Any,
+        stmt: Union[Select, Query],
+        order_by: Optional[str],
+        allowed_fields: Optional[Collection[str]] = None
+) -> Union[Select, Query]:
+    """
+    Function for applying order by on the query object. The to-one
+    relationships on the field-paths are outer joined (unless already joined),
+    the to-many ones are ordered by the min (max when desc) related value
+
+    Parameters:
+        model_class (Any): SQLAlchemy Model Class
+        stmt (Union[Select, Query]): Pre-constructed Select Statement
+        order_by (Optional[str]): Comma-separated fields / field-paths
+        allowed_fields (Optional[Collection[str]]): Fields / field-paths allowed
+            for ordering, the other ones are ignored (all fields when None)
+
+    Returns:
+        result_stmt (Union[Select, Query]): Result Statement
+    """
+
+    stmt, criteria = _prepare_ordering(
+        model_class=model_class,
+        stmt=stmt,
+        order_by=order_by,
+        allowed_fields=allowed_fields
+    )
 
-    if criterion:
-        stmt = stmt.order_by(*criterion)
+    if criteria:
+        stmt = stmt.order_by(*[
+            model_field.desc() if desc else model_field
+            for model_field, desc in criteria
+        ])
 
     return stmt
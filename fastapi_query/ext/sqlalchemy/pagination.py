@@ -1,64 +1,555 @@
-from typing import Any, TypeVar, Dict, Optional, Union
+import asyncio
+from typing import (
+    Any,
+    TypeVar,
+    Dict,
+    Optional,
+    Union,
+    List,
+    Tuple,
+    Sequence,
+    Callable,
+    Collection,
+    Type
+)
 
-from sqlalchemy import Select, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import Response
+from pydantic import BaseModel
+from sqlalchemy import Column, Select, and_, case, or_, func, inspect
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
 from sqlalchemy.orm import Session, Query
 
-from fastapi_query.filtering import BaseFilterParams
-from fastapi_query.pagination.schemas import PaginationParams
-from fastapi_query.pagination.utils import prepare_response
+from fastapi_query.fields.schemas import FieldsParams
+from fastapi_query.fields.utils import FieldsTree, project_items
+from fastapi_query.filtering import BaseFilterParams, RelationshipFilterStrategy
+from fastapi_query.pagination.cache import CountCache
+from fastapi_query.pagination.enums import CountStrategy, ResultMode
+from fastapi_query.pagination.responses import prepare_json_response
+from fastapi_query.pagination.schemas import (
+    DEFAULT_GET_ALL_LIMIT,
+    PaginationParams,
+    CursorPaginationParams
+)
+from fastapi_query.pagination.utils import (
+    prepare_get_all_response,
+    prepare_response,
+    prepare_cursor_response,
+    encode_cursor,
+    decode_cursor
+)
+from .counting import (
+    CountResult,
+    CountSteps,
+    count_steps,
+    get_count_cache_key,
+    run_count,
+    run_count_async,
+    run_count_with_bind_async
+)
+from .fields import apply_fields, get_fields
 from .filtering import apply_filters
-from .ordering import apply_ordering
+from .ordering import apply_ordering, _prepare_ordering
+from .results import RowReader, get_result_statement
 
 ModelClass = TypeVar("ModelClass")
 
 
 def _paginate_query_with_page(
         stmt: Union[Select, Query],
-        params: PaginationParams
-) -> Select:
+        params: PaginationParams,
+        extra_row: bool = False
+) -> Union[Select, Query]:
     """
     Applies Pagination to Query
 
     Parameters:
-        stmt (Select): Pre-constructed Select Statement
+        stmt (Union[Select, Query]): Pre-constructed Select Statement
         params (PaginationParams): Pagination Params that will be applied
+        extra_row (bool): Fetch one more row to find out if the next page exists
 
     Returns:
-        result_stmt (Select): Result Statement
+        result_stmt (Union[Select, Query]): Result Statement
     """
     offset = (params.page - 1) * params.size
-    stmt = stmt.offset(offset=offset).limit(limit=params.size)
+    limit = params.size + 1 if extra_row else params.size
+    stmt = stmt.offset(offset=offset).limit(limit=limit)
 
     return stmt
 
 
-def paginate(
-        db: Session,
+def _paginate_query_for_get_all(
         stmt: Union[Select, Query],
-        pagination_params: PaginationParams,
-        model_class: Optional[Any] = None,
-        filter_params: Optional[BaseFilterParams] = None,
-        ordering_params: Optional[str] = None
-) -> Dict[str, Any]:
+        get_all_limit: Optional[int],
+        chunk_size: int
+) -> Union[Select, Query]:
     """
-    Applies Pagination for SQLAlchemy Backend
+    Limits the `get_all` Query to one row over the limit (to find out whether
+    the result is truncated) and sets the rows to be fetched in chunks
 
     Parameters:
-        db (Session): SQLAlchemy Active Session
         stmt (Union[Select, Query]): Pre-constructed Select Statement
-        pagination_params (PaginationParams): Pagination Params
-        model_class (Optional[Any]): SQLAlchemy Model Class
-        filter_params (Optional[BaseFilterParams]): Filtering Params
-        ordering_params (Optional[str]): OrderBy Params (comma-separated)
+        get_all_limit (Optional[int]): Max number of items, None for no limit
+        chunk_size (int): Number of rows fetched from the cursor at once
+
+    Returns:
+        result_stmt (Union[Select, Query]): Result Statement
+    """
+    if get_all_limit is not None:
+        stmt = stmt.limit(limit=get_all_limit + 1)
+
+    return stmt.execution_options(yield_per=chunk_size)
+
+
+def _paginate_query_with_window_count(
+        stmt: Union[Select, Query],
+        params: PaginationParams
+) -> Union[Select, Query]:
+    """
+    Applies Pagination to Query and adds the total count of the matched rows
+    as the last column (`count(*) OVER ()`)
+
+    Parameters:
+        stmt (Union[Select, Query]): Pre-constructed Select Statement
+        params (PaginationParams): Pagination Params that will be applied
+
+    Returns:
+        result_stmt (Union[Select, Query]): Result Statement
+    """
+    return _paginate_query_with_page(
+        stmt=stmt.add_columns(func.count().over()),
+        params=params
+    )
+
+
+def _split_window_count_rows(
+        rows: Sequence[Any],
+        params: PaginationParams,
+        reader: RowReader
+) -> Tuple[List[Any], Optional[int]]:
+    """
+    Splits the rows fetched with the window count to items and total count.
+    The total is unknown (None) when a page after the first one is empty.
+    """
+    items = reader.read(rows)
+
+    if rows:
+        return items, rows[0][-1]
+
+    if params.page == 1:
+        return items, 0
+
+    return items, None
+
+
+def _prepare_page(
+        items: List[Any],
+        total_items: Optional[int],
+        total_items_exact: bool,
+        params: PaginationParams,
+        extra_row: bool
+) -> Dict[str, Any]:
+    """
+    Prepares the page response, when the page was fetched with an extra row
+    it determines whether the next page exists
+    """
+    has_next = None
+
+    if extra_row:
+        has_next = len(items) > params.size
+        items = items[:params.size]
+
+    return prepare_response(
+        items=items,
+        total_items=total_items,
+        pagination_params=params,
+        total_items_exact=total_items_exact,
+        has_next=has_next
+    )
+
+
+def _get_cached_count(
+        count_cache: Optional[CountCache],
+        stmt: Union[Select, Query],
+        count_strategy: CountStrategy,
+        count_cap: Optional[int],
+        dialect: Any
+) -> Tuple[Optional[str], Optional[CountResult]]:
+    """
+    Looks up the total count in the count cache,
+    returns the cache key (None when not cached) and the cached count
+    """
+    if count_cache is None or count_strategy == CountStrategy.NONE:
+        return None, None
+
+    cache_key = get_count_cache_key(
+        count_cache=count_cache,
+        stmt=stmt,
+        count_strategy=count_strategy,
+        dialect=dialect,
+        count_cap=count_cap
+    )
+
+    return cache_key, count_cache.get(cache_key)
+
+
+def _store_count(
+        count_cache: Optional[CountCache],
+        cache_key: Optional[str],
+        total_items: Optional[int],
+        total_items_exact: bool
+) -> None:
+    if count_cache is not None and cache_key is not None:
+        count_cache.set(
+            key=cache_key,
+            total_items=total_items,
+            total_items_exact=total_items_exact
+        )
+
+
+class _PagePlan:
+    """
+    The page query of the ordered statement and the count it needs, prepared
+    the same way for the sync and the async sessions: the page is fetched
+    with the window count (WINDOW strategy, count not cached) or with one
+    more row when the count doesn't determine whether the next page exists.
+    """
+
+    def __init__(
+            self,
+            stmt: Union[Select, Query],
+            params: PaginationParams,
+            count_strategy: CountStrategy,
+            count_cap: Optional[int],
+            count_cache: Optional[CountCache],
+            dialect: Any
+    ) -> None:
+        self.stmt = stmt
+        self.params = params
+        self.count_strategy = count_strategy
+        self.count_cap = count_cap
+        self.count_cache = count_cache
+        self.dialect_name = dialect.name
+        self.cache_key, self.cached_count = _get_cached_count(
+            count_cache=count_cache,
+            stmt=stmt,
+            count_strategy=count_strategy,
+            count_cap=count_cap,
+            dialect=dialect
+        )
+        self.window = (
+            count_strategy == CountStrategy.WINDOW and self.cached_count is None
+        )
+
+        # The page query is built before the count runs (the async count
+        # runs concurrently), so the extra row depends on the strategy
+        # unless the count is cached
+        if self.cached_count is not None:
+            self.extra_row = not self.cached_count[1]
+        else:
+            self.extra_row = count_strategy not in (
+                CountStrategy.EXACT,
+                CountStrategy.WINDOW
+            )
+
+        if self.window:
+            self.page_stmt = _paginate_query_with_window_count(
+                stmt=stmt,
+                params=params
+            )
+        else:
+            self.page_stmt = _paginate_query_with_page(
+                stmt=stmt,
+                params=params,
+                extra_row=self.extra_row
+            )
+
+    def count_steps(
+            self,
+            count_strategy: Optional[CountStrategy] = None
+    ) -> CountSteps:
+        return count_steps(
+            stmt=self.stmt,
+            count_strategy=count_strategy or self.count_strategy,
+            count_cap=self.count_cap,
+            dialect_name=self.dialect_name
+        )
+
+    def prepare(
+            self,
+            items: List[Any],
+            count_result: CountResult
+    ) -> Dict[str, Any]:
+        """
+        Stores the count (when it wasn't cached) and prepares the page response
+        """
+        total_items, total_items_exact = count_result
+
+        if self.cached_count is None:
+            _store_count(
+                count_cache=self.count_cache,
+                cache_key=self.cache_key,
+                total_items=total_items,
+                total_items_exact=total_items_exact
+            )
+
+        return _prepare_page(
+            items=items,
+            total_items=total_items,
+            total_items_exact=total_items_exact,
+            params=self.params,
+            extra_row=self.extra_row
+        )
+
+
+def _is_nullable(mapper: Any, model_field: Any) -> bool:
+    """
+    Returns False only for the NOT NULL columns of the model itself, the
+    columns of the outer joined models and the aggregates can be NULL
+    """
+    column = getattr(model_field, "expression", model_field)
+
+    return not (
+        isinstance(column, Column) and
+        column.table in mapper.tables and
+        not column.nullable
+    )
+
+
+def _get_keyset_columns(
+        model_class: Any,
+        stmt: Union[Select, Query],
+        ordering_params: Optional[str],
+        ordering_fields: Optional[Collection[str]] = None
+) -> Tuple[Union[Select, Query], List[Tuple[Any, bool]]]:
+    """
+    Returns the columns (with desc flag) that determine the row position,
+    the ordering columns (the nullable ones preceded by their IS NULL flag)
+    followed by the primary key as a tiebreaker, along with the statement
+    joined with the relationships they depend on.
+    """
+    stmt, criteria = _prepare_ordering(
+        model_class=model_class,
+        stmt=stmt,
+        order_by=ordering_params,
+        allowed_fields=ordering_fields
+    )
+    mapper = inspect(model_class)
+    columns = []
+
+    for model_field, desc in criteria:
+        if _is_nullable(mapper=mapper, model_field=model_field):
+            # NULLs are ordered as the greatest values on every dialect
+            # (the flag precedes the value), so they stay in the keyset
+            columns.append((case((model_field.is_(None), 1), else_=0), desc))
+
+        columns.append((model_field, desc))
+
+    for column in mapper.primary_key:
+        model_field = getattr(
+            model_class,
+            mapper.get_property_by_column(column).key
+        )
+
+        if all(field is not model_field for field, _ in columns):
+            columns.append((model_field, False))
+
+    return stmt, columns
+
+
+def _get_keyset_criteria(
+        columns: List[Tuple[Any, bool]],
+        values: List[Any],
+        backwards: bool
+) -> Any:
+    """
+    Returns the seek predicate selecting the rows after (or before) the cursor
+    """
+    res = []
+
+    for i, (model_field, desc) in enumerate(columns):
+        value = values[i]
+
+        if value is None:
+            # The NULL rows are ordered by the next columns,
+            # the ones after NULL are selected by its IS NULL flag
+            continue
+
+        comparison = model_field > value if desc == backwards else model_field < value
+
+        res.append(and_(
+            *[columns[j][0] == values[j] for j in range(i)],
+            comparison
+        ))
+
+    return or_(*res)
+
+
+def _paginate_query_with_cursor(
+        stmt: Union[Select, Query],
+        params: CursorPaginationParams,
+        columns: List[Tuple[Any, bool]]
+) -> Tuple[Union[Select, Query], bool]:
+    """
+    Applies Keyset Pagination to Query
+
+    Parameters:
+        stmt (Select): Pre-constructed Select Statement
+        params (CursorPaginationParams): Pagination Params that will be applied
+        columns (List[Tuple[Any, bool]]): Keyset Columns
+
+    Returns:
+        result (Tuple[Union[Select, Query], bool]): Result Statement
+            and backwards flag
+    """
+    backwards = False
+
+    if params.cursor:
+        values, backwards = decode_cursor(
+            cursor=params.cursor,
+            size=len(columns)
+        )
+        stmt = stmt.where(_get_keyset_criteria(
+            columns=columns,
+            values=values,
+            backwards=backwards
+        ))
+
+    stmt = stmt.add_columns(
+        *[model_field for model_field, _ in columns]
+    ).order_by(None).order_by(*[
+        model_field.desc() if desc != backwards else model_field.asc()
+        for model_field, desc in columns
+    ]).limit(params.size + 1)
+
+    return stmt, backwards
+
+
+def _paginate_statement_with_cursor(
+        stmt: Union[Select, Query],
+        params: CursorPaginationParams,
+        model_class: Any,
+        ordering_params: Optional[str],
+        ordering_fields: Optional[Collection[str]]
+) -> Tuple[Union[Select, Query], int, bool]:
+    """
+    Applies Ordering and Keyset Pagination to the filtered statement
 
     Returns:
-        paginated_response (Dict[str, Any]): Paginated Result
+        result (Tuple[Union[Select, Query], int, bool]): Result Statement,
+            number of the keyset columns (the last ones) and backwards flag
+    """
+    stmt, columns = _get_keyset_columns(
+        model_class=model_class,
+        stmt=stmt,
+        ordering_params=ordering_params,
+        ordering_fields=ordering_fields
+    )
+    stmt, backwards = _paginate_query_with_cursor(
+        stmt=stmt,
+        params=params,
+        columns=columns
+    )
+
+    return stmt, len(columns), backwards
+
+
+def _prepare_cursor_page(
+        rows: Sequence[Any],
+        params: CursorPaginationParams,
+        columns_count: int,
+        backwards: bool,
+        reader: RowReader
+) -> Dict[str, Any]:
+    """
+    Splits the fetched rows to items and keyset values and creates the cursors
+    """
+    has_more = len(rows) > params.size
+    rows = rows[:params.size]
+
+    if backwards:
+        rows = rows[::-1]
+
+    items = reader.read(rows)
+    keys = [list(row[-columns_count:]) for row in rows]
+
+    next_cursor, prev_cursor = None, None
+
+    if keys and (has_more or backwards):
+        next_cursor = encode_cursor(values=keys[-1])
+
+    if keys and (has_more if backwards else params.cursor):
+        prev_cursor = encode_cursor(values=keys[0], backwards=True)
+
+    return prepare_cursor_response(
+        items=items,
+        pagination_params=params,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor
+    )
+
+
+def _apply_result_mode(
+        stmt: Union[Select, Query],
+        model_class: Optional[Any],
+        fields_params: Optional[FieldsParams],
+        result_mode: ResultMode,
+        result_schema: Optional[Type[BaseModel]]
+) -> Tuple[Union[Select, Query], FieldsTree, RowReader]:
+    """
+    Applies the selected fields and the result mode to the statement, the ORM
+    objects are projected to the selected fields after they are fetched, the
+    mappings and the tuples contain only the selected columns
     """
+    if result_mode != ResultMode.ORM:
+        stmt, reader = get_result_statement(
+            stmt=stmt,
+            result_mode=result_mode,
+            result_schema=result_schema,
+            fields_tree=get_fields(
+                model_class=model_class,
+                fields_params=fields_params
+            )
+        )
+
+        return stmt, {}, reader
+
+    fields_tree: FieldsTree = {}
+
+    if fields_params:
+        stmt, fields_tree = apply_fields(
+            model_class=model_class,
+            stmt=stmt,
+            fields_params=fields_params
+        )
+
+    return stmt, fields_tree, RowReader()
 
-    if (filter_params or ordering_params) and not model_class:
+
+def _prepare_statement(
+        stmt: Union[Select, Query],
+        pagination_params: Union[PaginationParams, CursorPaginationParams],
+        model_class: Optional[Any],
+        filter_params: Optional[BaseFilterParams],
+        ordering_params: Optional[str],
+        named_params: bool,
+        relationship_strategy: Optional[RelationshipFilterStrategy],
+        fields_params: Optional[FieldsParams],
+        result_mode: ResultMode,
+        result_schema: Optional[Type[BaseModel]]
+) -> Tuple[Union[Select, Query], FieldsTree, RowReader]:
+    """
+    Checks the arguments, applies Filtering and the result mode
+    (shared by the sync and the async pagination)
+    """
+    if (filter_params or ordering_params or fields_params) and not model_class:
         raise ValueError(
-            "'model_class' is required when either filtering or ordering is applied"
+            "'model_class' is required when filtering, ordering "
+            "or fields selection is applied"
+        )
+
+    if isinstance(pagination_params, CursorPaginationParams) and not model_class:
+        raise ValueError(
+            "'model_class' is required for cursor pagination"
         )
 
     # Apply Filtering if params are provided
@@ -66,96 +557,500 @@ def paginate(
         stmt = apply_filters(
             model_class=model_class,
             stmt=stmt,
-            filters=filter_params
+            filters=filter_params,
+            named_params=named_params,
+            relationship_strategy=relationship_strategy
+        )
+
+    # Load only the selected fields if params are provided
+    return _apply_result_mode(
+        stmt=stmt,
+        model_class=model_class,
+        fields_params=fields_params,
+        result_mode=result_mode,
+        result_schema=result_schema
+    )
+
+
+def _prepare_result(
+        res: Dict[str, Any],
+        fields_tree: FieldsTree,
+        item_schema: Optional[Type[BaseModel]],
+        cursor: bool
+) -> Union[Dict[str, Any], Response]:
+    """
+    Projects the items to the selected fields, the response is prebuilt
+    when the item schema is set
+    """
+    res["items"] = project_items(
+        items=res["items"],
+        tree=fields_tree
+    )
+
+    if item_schema is not None:
+        return prepare_json_response(
+            response=res,
+            item_schema=item_schema,
+            cursor=cursor
         )
 
+    return res
+
+
+def _paginate_statement(
+        db: Session,
+        stmt: Union[Select, Query],
+        pagination_params: PaginationParams,
+        model_class: Optional[Any],
+        ordering_params: Optional[str],
+        ordering_fields: Optional[Collection[str]],
+        count_strategy: CountStrategy,
+        count_cap: Optional[int],
+        count_cache: Optional[CountCache],
+        get_all_limit: Optional[int],
+        get_all_chunk_size: int,
+        reader: RowReader
+) -> Dict[str, Any]:
+    """
+    Applies Ordering and Pagination to the filtered statement and fetches the page
+    """
     # Apply Ordering if params are provided
     if ordering_params:
         stmt = apply_ordering(
             model_class=model_class,
             stmt=stmt,
-            order_by=ordering_params
+            order_by=ordering_params,
+            allowed_fields=ordering_fields
+        )
+
+    if pagination_params.get_all:
+        result = db.execute(
+            _paginate_query_for_get_all(
+                stmt=stmt,
+                get_all_limit=get_all_limit,
+                chunk_size=get_all_chunk_size
+            )
         )
+        items = [
+            item
+            for partition in result.partitions()
+            for item in reader.read(partition)
+        ]
 
-    total_items = db.scalar(
-        select(func.count()).select_from(stmt.subquery())
+        return prepare_get_all_response(
+            items=items,
+            pagination_params=pagination_params,
+            get_all_limit=get_all_limit
+        )
+
+    plan = _PagePlan(
+        stmt=stmt,
+        params=pagination_params,
+        count_strategy=count_strategy,
+        count_cap=count_cap,
+        count_cache=count_cache,
+        dialect=db.get_bind().dialect
     )
 
-    if not pagination_params.get_all:
-        stmt = _paginate_query_with_page(
-            stmt=stmt,
-            params=pagination_params
+    if plan.window:
+        items, total_items = _split_window_count_rows(
+            rows=db.execute(plan.page_stmt).all(),
+            params=pagination_params,
+            reader=reader
         )
 
-    items = list(db.scalars(stmt).all())
+        if total_items is None:
+            total_items, _ = run_count(
+                db=db,
+                steps=plan.count_steps(CountStrategy.EXACT)
+            )
 
-    return prepare_response(
-        items=items,
-        total_items=total_items,
-        pagination_params=pagination_params
-    )
+        return plan.prepare(items=items, count_result=(total_items, True))
 
+    count_result = plan.cached_count
 
-async def paginate_async(
-        db: AsyncSession,
+    if count_result is None:
+        count_result = run_count(db=db, steps=plan.count_steps())
+
+    items = reader.read(db.execute(plan.page_stmt).all())
+
+    return plan.prepare(items=items, count_result=count_result)
+
+
+def paginate(
+        db: Session,
         stmt: Union[Select, Query],
-        pagination_params: PaginationParams,
+        pagination_params: Union[PaginationParams, CursorPaginationParams],
         model_class: Optional[Any] = None,
         filter_params: Optional[BaseFilterParams] = None,
-        ordering_params: Optional[str] = None
-) -> Dict[str, Any]:
+        ordering_params: Optional[str] = None,
+        ordering_fields: Optional[Collection[str]] = None,
+        named_params: bool = False,
+        relationship_strategy: Optional[RelationshipFilterStrategy] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        count_cap: Optional[int] = None,
+        count_cache: Optional[CountCache] = None,
+        fields_params: Optional[FieldsParams] = None,
+        result_mode: ResultMode = ResultMode.ORM,
+        result_schema: Optional[Type[BaseModel]] = None,
+        item_schema: Optional[Type[BaseModel]] = None,
+        get_all_limit: Optional[int] = DEFAULT_GET_ALL_LIMIT,
+        get_all_chunk_size: int = 1000
+) -> Union[Dict[str, Any], Response]:
     """
-    Applies Pagination for SQLAlchemy Asyncio Backend
+    Applies Pagination for SQLAlchemy Backend
 
     Parameters:
-        db (AsyncSession): SQLAlchemy Async Active Session
+        db (Session): SQLAlchemy Active Session
         stmt (Union[Select, Query]): Pre-constructed Select Statement
-        pagination_params (PaginationParams): Pagination Params
+        pagination_params (Union[PaginationParams, CursorPaginationParams]):
+            Pagination Params, keyset pagination is applied for cursor params
         model_class (Optional[Any]): SQLAlchemy Model Class
         filter_params (Optional[BaseFilterParams]): Filtering Params
         ordering_params (Optional[str]): OrderBy Params (comma-separated)
+        ordering_fields (Optional[Collection[str]]): Fields / field-paths allowed
+            for ordering, the other ones are ignored (all fields when None)
+        named_params (bool): Bind filter values to named parameters
+            (see `apply_filters`)
+        relationship_strategy (Optional[RelationshipFilterStrategy]): How the
+            nested filters are applied (see `apply_filters`)
+        count_strategy (CountStrategy): How the total number of items is counted
+        count_cap (Optional[int]): Max number of counted items (capped strategy)
+        count_cache (Optional[CountCache]): Cache of the total counts, the count
+            query is skipped while the count of the filtered statement is cached
+        fields_params (Optional[FieldsParams]): Fields Params, the items are
+            returned as dicts of the selected fields when fields are selected
+        result_mode (ResultMode): Items as ORM objects, or as mappings / tuples
+            of the columns, fetched without the ORM objects and the identity map
+        result_schema (Optional[Type[BaseModel]]): Response Schema, only its
+            fields are selected for the mappings and the tuples
+        item_schema (Optional[Type[BaseModel]]): Item Schema, the response is
+            validated once and returned as the prebuilt JSON Response when set
+        get_all_limit (Optional[int]): Max number of items returned with
+            `get_all` (`meta.truncated` is set when exceeded), None for no limit
+        get_all_chunk_size (int): Number of rows fetched from the cursor at once
+            with `get_all`, all the items are returned in a single list
+            (ORM objects stay in the session), `get_all_limit` bounds them
 
     Returns:
-        paginated_response (Dict[str, Any]): Paginated Result
+        paginated_response (Union[Dict[str, Any], Response]): Paginated Result
     """
 
-    if (filter_params or ordering_params) and not model_class:
-        raise ValueError(
-            "'model_class' is required when either filtering or ordering is applied"
-        )
+    stmt, fields_tree, reader = _prepare_statement(
+        stmt=stmt,
+        pagination_params=pagination_params,
+        model_class=model_class,
+        filter_params=filter_params,
+        ordering_params=ordering_params,
+        named_params=named_params,
+        relationship_strategy=relationship_strategy,
+        fields_params=fields_params,
+        result_mode=result_mode,
+        result_schema=result_schema
+    )
 
-    # Apply Filtering if params are provided
-    if filter_params:
-        stmt = apply_filters(
+    if isinstance(pagination_params, CursorPaginationParams):
+        stmt, columns_count, backwards = _paginate_statement_with_cursor(
+            stmt=stmt,
+            params=pagination_params,
             model_class=model_class,
+            ordering_params=ordering_params,
+            ordering_fields=ordering_fields
+        )
+        res = _prepare_cursor_page(
+            rows=db.execute(stmt).all(),
+            params=pagination_params,
+            columns_count=columns_count,
+            backwards=backwards,
+            reader=reader
+        )
+    else:
+        res = _paginate_statement(
+            db=db,
+            stmt=stmt,
+            pagination_params=pagination_params,
+            model_class=model_class,
+            ordering_params=ordering_params,
+            ordering_fields=ordering_fields,
+            count_strategy=count_strategy,
+            count_cap=count_cap,
+            count_cache=count_cache,
+            get_all_limit=get_all_limit,
+            get_all_chunk_size=get_all_chunk_size,
+            reader=reader
+        )
+    return _prepare_result(
+        res=res,
+        fields_tree=fields_tree,
+        item_schema=item_schema,
+        cursor=isinstance(pagination_params, CursorPaginationParams)
+    )
+
+
+async def _fetch_items_async(
+        db: AsyncSession,
+        stmt: Union[Select, Query],
+        reader: RowReader
+) -> List[Any]:
+    return reader.read(
+        (await db.execute(stmt)).all()
+    )
+
+
+async def _fetch_all_items_async(
+        db: AsyncSession,
+        stmt: Union[Select, Query],
+        reader: RowReader
+) -> List[Any]:
+    """
+    Fetches the rows in chunks (`yield_per`) with a server-side cursor,
+    the items are still collected in a single list
+    """
+    items = []
+    result = await db.stream(stmt)
+
+    async for partition in result.partitions():
+        items.extend(reader.read(partition))
+
+    return items
+
+
+async def _count_and_fetch_async(
+        db: AsyncSession,
+        stmt: Union[Select, Query],
+        steps: CountSteps,
+        count_bind: Optional[Union[AsyncEngine, Callable[[], AsyncSession]]],
+        reader: RowReader
+) -> Tuple[CountResult, List[Any]]:
+    """
+    Runs the count and fetches the page, concurrently when the count bind is set
+    """
+    if count_bind is None:
+        count_result = await run_count_async(
+            db=db,
+            steps=steps
+        )
+        items = await _fetch_items_async(
+            db=db,
             stmt=stmt,
-            filters=filter_params
+            reader=reader
         )
 
+        return count_result, items
+
+    # Count on a separate connection while the page is being fetched
+    count_result, items = await asyncio.gather(
+        run_count_with_bind_async(
+            bind=count_bind,
+            steps=steps
+        ),
+        _fetch_items_async(
+            db=db,
+            stmt=stmt,
+            reader=reader
+        )
+    )
+
+    return count_result, items
+
+
+async def _paginate_statement_async(
+        db: AsyncSession,
+        stmt: Union[Select, Query],
+        pagination_params: PaginationParams,
+        model_class: Optional[Any],
+        ordering_params: Optional[str],
+        ordering_fields: Optional[Collection[str]],
+        count_strategy: CountStrategy,
+        count_cap: Optional[int],
+        count_cache: Optional[CountCache],
+        count_bind: Optional[Union[AsyncEngine, Callable[[], AsyncSession]]],
+        get_all_limit: Optional[int],
+        get_all_chunk_size: int,
+        reader: RowReader
+) -> Dict[str, Any]:
+    """
+    Applies Ordering and Pagination to the filtered statement and fetches the page
+    """
     # Apply Ordering if params are provided
     if ordering_params:
         stmt = apply_ordering(
             model_class=model_class,
             stmt=stmt,
-            order_by=ordering_params
+            order_by=ordering_params,
+            allowed_fields=ordering_fields
         )
 
-    total_items = await db.scalar(
-        select(func.count()).select_from(stmt.subquery())
+    if pagination_params.get_all:
+        items = await _fetch_all_items_async(
+            db=db,
+            stmt=_paginate_query_for_get_all(
+                stmt=stmt,
+                get_all_limit=get_all_limit,
+                chunk_size=get_all_chunk_size
+            ),
+            reader=reader
+        )
+
+        return prepare_get_all_response(
+            items=items,
+            pagination_params=pagination_params,
+            get_all_limit=get_all_limit
+        )
+
+    plan = _PagePlan(
+        stmt=stmt,
+        params=pagination_params,
+        count_strategy=count_strategy,
+        count_cap=count_cap,
+        count_cache=count_cache,
+        dialect=db.get_bind().dialect
     )
 
-    if not pagination_params.get_all:
-        stmt = _paginate_query_with_page(
-            stmt=stmt,
-            params=pagination_params
+    if plan.window:
+        items, total_items = _split_window_count_rows(
+            rows=(await db.execute(plan.page_stmt)).all(),
+            params=pagination_params,
+            reader=reader
         )
 
-    items = list(
-        (await db.scalars(stmt)).all()
+        if total_items is None:
+            total_items, _ = await run_count_async(
+                db=db,
+                steps=plan.count_steps(CountStrategy.EXACT)
+            )
+
+        return plan.prepare(items=items, count_result=(total_items, True))
+
+    if plan.cached_count is not None:
+        count_result = plan.cached_count
+        items = await _fetch_items_async(
+            db=db,
+            stmt=plan.page_stmt,
+            reader=reader
+        )
+    else:
+        count_result, items = await _count_and_fetch_async(
+            db=db,
+            stmt=plan.page_stmt,
+            steps=plan.count_steps(),
+            count_bind=count_bind,
+            reader=reader
+        )
+
+    return plan.prepare(items=items, count_result=count_result)
+
+
+async def paginate_async(
+        db: AsyncSession,
+        stmt: Union[Select, Query],
+        pagination_params: Union[PaginationParams, CursorPaginationParams],
+        model_class: Optional[Any] = None,
+        filter_params: Optional[BaseFilterParams] = None,
+        ordering_params: Optional[str] = None,
+        ordering_fields: Optional[Collection[str]] = None,
+        named_params: bool = False,
+        relationship_strategy: Optional[RelationshipFilterStrategy] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        count_cap: Optional[int] = None,
+        count_cache: Optional[CountCache] = None,
+        count_bind: Optional[Union[AsyncEngine, Callable[[], AsyncSession]]] = None,
+        fields_params: Optional[FieldsParams] = None,
+        result_mode: ResultMode = ResultMode.ORM,
+        result_schema: Optional[Type[BaseModel]] = None,
+        item_schema: Optional[Type[BaseModel]] = None,
+        get_all_limit: Optional[int] = DEFAULT_GET_ALL_LIMIT,
+        get_all_chunk_size: int = 1000
+) -> Union[Dict[str, Any], Response]:
+    """
+    Applies Pagination for SQLAlchemy Asyncio Backend
+
+    Parameters:
+        db (AsyncSession): SQLAlchemy Async Active Session
+        stmt (Union[Select, Query]): Pre-constructed Select Statement
+        pagination_params (Union[PaginationParams, CursorPaginationParams]):
+            Pagination Params, keyset pagination is applied for cursor params
+        model_class (Optional[Any]): SQLAlchemy Model Class
+        filter_params (Optional[BaseFilterParams]): Filtering Params
+        ordering_params (Optional[str]): OrderBy Params (comma-separated)
+        ordering_fields (Optional[Collection[str]]): Fields / field-paths allowed
+            for ordering, the other ones are ignored (all fields when None)
+        named_params (bool): Bind filter values to named parameters
+            (see `apply_filters`)
+        relationship_strategy (Optional[RelationshipFilterStrategy]): How the
+            nested filters are applied (see `apply_filters`)
+        count_strategy (CountStrategy): How the total number of items is counted
+        count_cap (Optional[int]): Max number of counted items (capped strategy)
+        count_cache (Optional[CountCache]): Cache of the total counts, the count
+            query is skipped while the count of the filtered statement is cached
+        count_bind (Optional[Union[AsyncEngine, Callable[[], AsyncSession]]]):
+            Engine or session factory used to run the count concurrently with
+            the page query, the count runs on `db` sequentially when omitted
+        fields_params (Optional[FieldsParams]): Fields Params, the items are
+            returned as dicts of the selected fields when fields are selected
+        result_mode (ResultMode): Items as ORM objects, or as mappings / tuples
+            of the columns, fetched without the ORM objects and the identity map
+        result_schema (Optional[Type[BaseModel]]): Response Schema, only its
+            fields are selected for the mappings and the tuples
+        item_schema (Optional[Type[BaseModel]]): Item Schema, the response is
+            validated once and returned as the prebuilt JSON Response when set
+        get_all_limit (Optional[int]): Max number of items returned with
+            `get_all` (`meta.truncated` is set when exceeded), None for no limit
+        get_all_chunk_size (int): Number of rows fetched from the cursor at once
+            with `get_all`, all the items are returned in a single list
+            (ORM objects stay in the session), `get_all_limit` bounds them
+
+    Returns:
+        paginated_response (Union[Dict[str, Any], Response]): Paginated Result
+    """
+
+    stmt, fields_tree, reader = _prepare_statement(
+        stmt=stmt,
+        pagination_params=pagination_params,
+        model_class=model_class,
+        filter_params=filter_params,
+        ordering_params=ordering_params,
+        named_params=named_params,
+        relationship_strategy=relationship_strategy,
+        fields_params=fields_params,
+        result_mode=result_mode,
+        result_schema=result_schema
     )
 
-    return prepare_response(
-        items=items,
-        total_items=total_items,
-        pagination_params=pagination_params
+    if isinstance(pagination_params, CursorPaginationParams):
+        stmt, columns_count, backwards = _paginate_statement_with_cursor(
+            stmt=stmt,
+            params=pagination_params,
+            model_class=model_class,
+            ordering_params=ordering_params,
+            ordering_fields=ordering_fields
+        )
+        res = _prepare_cursor_page(
+            rows=(await db.execute(stmt)).all(),
+            params=pagination_params,
+            columns_count=columns_count,
+            backwards=backwards,
+            reader=reader
+        )
+    else:
+        res = await _paginate_statement_async(
+            db=db,
+            stmt=stmt,
+            pagination_params=pagination_params,
+            model_class=model_class,
+            ordering_params=ordering_params,
+            ordering_fields=ordering_fields,
+            count_strategy=count_strategy,
+            count_cap=count_cap,
+            count_cache=count_cache,
+            count_bind=count_bind,
+            get_all_limit=get_all_limit,
+            get_all_chunk_size=get_all_chunk_size,
+            reader=reader
+        )
+    return _prepare_result(
+        res=res,
+        fields_tree=fields_tree,
+        item_schema=item_schema,
+        cursor=isinstance(pagination_params, CursorPaginationParams)
     )
@@ -0,0 +1,119 @@
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel
+from sqlalchemy import Select, inspect
+from sqlalchemy.orm import Query
+
+from fastapi_query._compat import _get_model_fields
+from fastapi_query.fields.utils import FieldsTree, raise_invalid_field
+from fastapi_query.pagination.enums import ResultMode
+from .utils import get_select_statement
+
+
+class RowReader:
+    """
+    Turns the fetched rows to items: the ORM objects (first column),
+    the mappings or the tuples of the first `columns_count` columns.
+    The rows may contain more columns (window count, keyset values).
+    """
+
+    def __init__(
+            self,
+            result_mode: ResultMode = ResultMode.ORM,
+            columns_count: int = 1
+    ) -> None:
+        self.result_mode = result_mode
+        self.columns_count = columns_count
+
+    def read(self, rows: Sequence[Any]) -> List[Any]:
+        if self.result_mode == ResultMode.ORM:
+            return [row[0] for row in rows]
+
+        columns_count = self.columns_count
+
+        if self.result_mode == ResultMode.TUPLES:
+            return [tuple(row[:columns_count]) for row in rows]
+
+        if rows and len(rows[0]) > columns_count:
+            keys = rows[0]._fields[:columns_count]
+            return [
+                {key: row[i] for i, key in enumerate(keys)}
+                for row in rows
+            ]
+
+        return [row._mapping for row in rows]
+
+
+def _get_selected_keys(
+        mapper: Any,
+        result_schema: Optional[Type[BaseModel]],
+        fields_tree: Optional[FieldsTree]
+) -> List[str]:
+    """
+    Returns the columns to select: the selected fields, the fields of the
+    response schema or all the columns of the entity (in this order)
+    """
+    if fields_tree:
+        for name, subtree in fields_tree.items():
+            if subtree:
+                # Relationships can't be selected as plain rows
+                raise_invalid_field(name)
+
+        return list(fields_tree.keys())
+
+    if result_schema is not None:
+        return [
+            name
+            for name in _get_model_fields(result_schema)
+            if name in mapper.column_attrs
+        ]
+
+    return list(mapper.column_attrs.keys())
+
+
+def get_result_statement(
+        stmt: Union[Select, Query],
+        result_mode: ResultMode = ResultMode.ORM,
+        result_schema: Optional[Type[BaseModel]] = None,
+        fields_tree: Optional[FieldsTree] = None
+) -> Tuple[Union[Select, Query], RowReader]:
+    """
+    Prepares the statement for the result mode, the single selected ORM entity
+    is replaced by its columns for the mappings and the tuples, so the rows are
+    returned as plain data (no ORM objects, no identity map)
+
+    Parameters:
+        stmt (Union[Select, Query]): Pre-constructed Select Statement
+        result_mode (ResultMode): ORM objects, mappings or tuples
+        result_schema (Optional[Type[BaseModel]]): Response Schema, only its
+            fields are selected (mappings and tuples)
+        fields_tree (Optional[FieldsTree]): Selected fields (see `get_fields`)
+
+    Returns:
+        result (Tuple[Union[Select, Query], RowReader]): Result Statement
+            and its row reader
+    """
+    result_mode = ResultMode(result_mode)
+
+    if result_mode == ResultMode.ORM:
+        return stmt, RowReader()
+
+    stmt = get_select_statement(stmt)
+    descriptions = stmt.column_descriptions
+
+    if len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]:
+        entity = descriptions[0]["entity"]
+        keys = _get_selected_keys(
+            mapper=inspect(entity).mapper,
+            result_schema=result_schema,
+            fields_tree=fields_tree
+        )
+        stmt = stmt.with_only_columns(
+            *[getattr(entity, key) for key in keys],
+            maintain_column_froms=True
+        )
+
+    return stmt, RowReader(
+        result_mode=result_mode,
+        columns_count=len(stmt.selected_columns)
+    )
@@ -0,0 +1,173 @@
+import re
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Boolean, func, literal, literal_column, or_, select, table
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from fastapi_query.filtering.enums import SearchMode
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+LIKE_ESCAPE = "/"
+
+
+def escape_like(value: Any) -> str:
+    """
+    Escapes the LIKE wildcards of the value (used with `escape=LIKE_ESCAPE`)
+    """
+    return (
+        str(value)
+        .replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+class SearchOptions:
+    """
+    Search settings of the filter class (see `BaseFilterParams.Settings`)
+    """
+
+    def __init__(
+            self,
+            mode: SearchMode = SearchMode.ILIKE,
+            config: str = "simple",
+            vector_fields: Optional[Dict[str, str]] = None,
+            fts_tables: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.mode = mode
+        self.config = config
+        self.vector_fields = vector_fields or {}
+        self.fts_tables = fts_tables or {}
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "SearchOptions":
+        return cls(
+            mode=getattr(settings, "search_mode", SearchMode.ILIKE),
+            config=getattr(settings, "search_config", "simple"),
+            vector_fields=getattr(settings, "search_vector_fields", None),
+            fts_tables=getattr(settings, "search_fts_tables", None)
+        )
+
+
+def _as_expression(value: Any) -> Any:
+    return value if isinstance(value, ClauseElement) else literal(value)
+
+
+class FullTextMatch(ColumnElement[bool]):
+    """
+    Full-text match of the searchable columns of a single model.
+
+    Compiles to `to_tsvector(config, column) @@ plainto_tsquery(config, query)`
+    (or `vector @@ plainto_tsquery(...)` for the precomputed tsvector column)
+    for PostgreSQL, to `pk IN (SELECT rowid FROM fts WHERE fts MATCH query)`
+    for SQLite with the FTS5 table, and to `ilike` on the columns otherwise.
+    """
+    __visit_name__ = "full_text_match"
+    inherit_cache = True
+    type = Boolean()
+    _is_implicitly_boolean = True
+
+    _traverse_internals = [
+        ("columns", InternalTraversal.dp_clauseelement_list),
+        ("pattern", InternalTraversal.dp_clauseelement),
+        ("query", InternalTraversal.dp_clauseelement),
+        ("fts_query", InternalTraversal.dp_clauseelement),
+        ("config", InternalTraversal.dp_string),
+        ("vector", InternalTraversal.dp_clauseelement),
+        ("fts_table", InternalTraversal.dp_string),
+        ("key_column", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(
+            self,
+            columns: List[Any],
+            pattern: Any,
+            query: Any,
+            fts_query: Any,
+            config: str,
+            vector: Optional[Any] = None,
+            fts_table: Optional[str] = None,
+            primary_key: Optional[Any] = None
+    ) -> None:
+        self.columns = [column.expression for column in columns]
+        self.pattern = _as_expression(pattern)
+        self.query = _as_expression(query)
+        self.fts_query = _as_expression(fts_query)
+        self.config = config
+        self.vector = vector.expression if vector is not None else None
+        self.fts_table = fts_table
+        # Not `primary_key`, it is the flag of the column elements
+        self.key_column = primary_key
+
+
+def to_fts5_query(search_query: str) -> Optional[str]:
+    """
+    Turns the search query into the FTS5 query matching all the words
+    (as `plainto_tsquery` does), None when the query has no words
+    """
+    words = _WORD_PATTERN.findall(search_query)
+
+    if not words:
+        return None
+
+    return " ".join(f'"{word}"' for word in words)
+
+
+def _ilike_criteria(element: FullTextMatch) -> Any:
+    return or_(*[
+        column.ilike(element.pattern, escape=LIKE_ESCAPE)
+        for column in element.columns
+    ])
+
+
+@compiles(FullTextMatch)
+def _compile_full_text_match(element: FullTextMatch, compiler: Any, **kw: Any) -> str:
+    return compiler.process(_ilike_criteria(element), **kw)
+
+
+@compiles(FullTextMatch, "postgresql")
+def _compile_full_text_match_postgresql(
+        element: FullTextMatch,
+        compiler: Any,
+        **kw: Any
+) -> str:
+    # The config is rendered inline, so the expression matches
+    # the expression indexes, e.g. to_tsvector('simple', name)
+    config: ColumnElement[Any] = literal_column(
+        "'{}'::regconfig".format(element.config.replace("'", "''"))
+    )
+    query = func.plainto_tsquery(config, element.query)
+
+    if element.vector is not None:
+        criteria = element.vector.bool_op("@@")(query)
+    else:
+        criteria = or_(*[
+            func.to_tsvector(config, column).bool_op("@@")(query)
+            for column in element.columns
+        ])
+
+    return compiler.process(criteria, **kw)
+
+
+@compiles(FullTextMatch, "sqlite")
+def _compile_full_text_match_sqlite(
+        element: FullTextMatch,
+        compiler: Any,
+        **kw: Any
+) -> str:
+    if element.fts_table is None or element.key_column is None:
+        return compiler.process(_ilike_criteria(element), **kw)
+
+    fts_table = table(element.fts_table)
+    criteria = element.key_column.in_(
+        select(literal_column("rowid")).select_from(fts_table).where(
+            literal_column(
+                compiler.preparer.quote(element.fts_table)
+            ).bool_op("MATCH")(element.fts_query)
+        )
+    )
+
+    return compiler.process(criteria, **kw)
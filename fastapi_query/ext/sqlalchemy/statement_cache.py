@@ -0,0 +1,98 @@
+from threading import Lock
+from types import TracebackType
+from typing import Any, Optional, Type, Union
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class StatementCacheStats:
+    """
+    Counts SQLAlchemy compiled-statement cache hits and misses for an engine.
+    Statements that can't be cached (raw SQL, caching disabled) are counted
+    as `uncached`. The counting is stopped with `stop()` or on exiting
+    the `with` block.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None) -> None:
+        self._lock = Lock()
+        self._engine = engine
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.uncached = 0
+
+    def stop(self) -> None:
+        """
+        Removes the listener from the engine, the counters are kept
+        """
+        if self._engine is not None and event.contains(
+                self._engine, "after_cursor_execute", self
+        ):
+            event.remove(self._engine, "after_cursor_execute", self)
+
+    def __enter__(self) -> "StatementCacheStats":
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_val: Optional[BaseException],
+            exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.stop()
+
+    def __call__(
+            self,
+            conn: Any,
+            cursor: Any,
+            statement: str,
+            parameters: Any,
+            context: Any,
+            executemany: bool
+    ) -> None:
+        cache_hit = getattr(context, "cache_hit", None)
+
+        with self._lock:
+            if cache_hit is CACHE_HIT:
+                self.hits += 1
+            elif cache_hit is CACHE_MISS:
+                self.misses += 1
+            else:
+                self.uncached += 1
+
+
+def track_statement_cache(
+        engine: Union[Engine, AsyncEngine]
+) -> StatementCacheStats:
+    """
+    Starts counting compiled-statement cache hits / misses for the engine,
+    until `stop()` is called (or the `with` block is exited):
+
+        with track_statement_cache(engine) as stats:
+            ...
+
+    Parameters:
+        engine (Union[Engine, AsyncEngine]): SQLAlchemy Engine
+
+    Returns:
+        stats (StatementCacheStats): Live Cache Counters
+    """
+    if isinstance(engine, AsyncEngine):
+        engine = engine.sync_engine
+
+    stats = StatementCacheStats(engine=engine)
+    event.listen(engine, "after_cursor_execute", stats)
+
+    return stats
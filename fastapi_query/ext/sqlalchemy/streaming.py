@@ -0,0 +1,153 @@
+from typing import Any, AsyncIterator, Collection, Iterator, Optional, Union
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+
+from fastapi_query.filtering import BaseFilterParams
+from .filtering import apply_filters
+from .ordering import apply_ordering
+from .utils import get_select_statement
+
+
+def _prepare_stream_statement(
+        stmt: Union[Select, Query],
+        model_class: Optional[Any],
+        filter_params: Optional[BaseFilterParams],
+        ordering_params: Optional[str],
+        ordering_fields: Optional[Collection[str]],
+        named_params: bool,
+        chunk_size: int
+) -> Select:
+    """
+    Applies Filtering and Ordering to the statement and sets `yield_per`,
+    so the rows are fetched in chunks of the given size
+    """
+    if (filter_params or ordering_params) and not model_class:
+        raise ValueError(
+            "'model_class' is required when either filtering or ordering is applied"
+        )
+
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be positive")
+
+    # Apply Filtering if params are provided
+    if filter_params:
+        stmt = apply_filters(
+            model_class=model_class,
+            stmt=stmt,
+            filters=filter_params,
+            named_params=named_params
+        )
+
+    # Apply Ordering if params are provided
+    if ordering_params:
+        stmt = apply_ordering(
+            model_class=model_class,
+            stmt=stmt,
+            order_by=ordering_params,
+            allowed_fields=ordering_fields
+        )
+
+    return get_select_statement(stmt).execution_options(yield_per=chunk_size)
+
+
+def stream(
+        db: Session,
+        stmt: Select,
+        model_class: Optional[Any] = None,
+        filter_params: Optional[BaseFilterParams] = None,
+        ordering_params: Optional[str] = None,
+        ordering_fields: Optional[Collection[str]] = None,
+        named_params: bool = False,
+        chunk_size: int = 1000
+) -> Iterator[Any]:
+    """
+    Streams all the filtered items for SQLAlchemy Backend (bulk export),
+    without the count query and without loading the whole result in memory
+
+    Parameters:
+        db (Session): SQLAlchemy Active Session
+        stmt (Select): Pre-constructed Select Statement
+        model_class (Optional[Any]): SQLAlchemy Model Class
+        filter_params (Optional[BaseFilterParams]): Filtering Params
+        ordering_params (Optional[str]): OrderBy Params (comma-separated)
+        ordering_fields (Optional[Collection[str]]): Fields / field-paths allowed
+            for ordering, the other ones are ignored (all fields when None)
+        named_params (bool): Bind filter values to named parameters
+            (see `apply_filters`)
+        chunk_size (int): Number of rows fetched from the cursor at once
+
+    Returns:
+        items (Iterator[Any]): Items, fetched lazily
+    """
+    stmt = _prepare_stream_statement(
+        stmt=stmt,
+        model_class=model_class,
+        filter_params=filter_params,
+        ordering_params=ordering_params,
+        ordering_fields=ordering_fields,
+        named_params=named_params,
+        chunk_size=chunk_size
+    )
+
+    def _iterate() -> Iterator[Any]:
+        result = db.scalars(stmt)
+
+        try:
+            yield from result
+        finally:
+            result.close()
+
+    return _iterate()
+
+
+def stream_async(
+        db: AsyncSession,
+        stmt: Select,
+        model_class: Optional[Any] = None,
+        filter_params: Optional[BaseFilterParams] = None,
+        ordering_params: Optional[str] = None,
+        ordering_fields: Optional[Collection[str]] = None,
+        named_params: bool = False,
+        chunk_size: int = 1000
+) -> AsyncIterator[Any]:
+    """
+    Streams all the filtered items for SQLAlchemy Asyncio Backend (bulk export),
+    without the count query and without loading the whole result in memory
+
+    Parameters:
+        db (AsyncSession): SQLAlchemy Active Session
+        stmt (Select): Pre-constructed Select Statement
+        model_class (Optional[Any]): SQLAlchemy Model Class
+        filter_params (Optional[BaseFilterParams]): Filtering Params
+        ordering_params (Optional[str]): OrderBy Params (comma-separated)
+        ordering_fields (Optional[Collection[str]]): Fields / field-paths allowed
+            for ordering, the other ones are ignored (all fields when None)
+        named_params (bool): Bind filter values to named parameters
+            (see `apply_filters`)
+        chunk_size (int): Number of rows fetched from the cursor at once
+
+    Returns:
+        items (AsyncIterator[Any]): Items, fetched lazily
+    """
+    stmt = _prepare_stream_statement(
+        stmt=stmt,
+        model_class=model_class,
+        filter_params=filter_params,
+        ordering_params=ordering_params,
+        ordering_fields=ordering_fields,
+        named_params=named_params,
+        chunk_size=chunk_size
+    )
+
+    async def _iterate() -> AsyncIterator[Any]:
+        result = await db.stream_scalars(stmt)
+
+        try:
+            async for item in result:
+                yield item
+        finally:
+            await result.close()
+
+    return _iterate()
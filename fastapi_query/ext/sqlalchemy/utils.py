@@ -0,0 +1,16 @@
+from typing import Any, Union
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Query
+
+
+def get_select_statement(
+        stmt: Union[Select, Query]
+) -> Select:
+    """
+    Returns the Select Statement of the (legacy) ORM Query,
+    the Select Statement is returned as is
+    """
+    select_stmt: Any = stmt.statement if isinstance(stmt, Query) else stmt
+
+    return select_stmt
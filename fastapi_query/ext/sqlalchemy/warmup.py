@@ -0,0 +1,70 @@
+from typing import Any, FrozenSet, List, Optional, Type
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Mapper
+
+from fastapi_query.filtering import BaseFilterParams
+from .filtering import (
+    _FilterPlan,
+    _InvalidFieldPlan,
+    _RelationshipFieldPlan,
+    compile_filters
+)
+from .ordering import _resolve_ordering_terms
+
+
+def _get_plan_errors(plan: _FilterPlan) -> List[str]:
+    """
+    Returns the messages of the fields that can't be applied to the model
+    """
+    errors = []
+
+    for field in plan.fields:
+        if isinstance(field, _InvalidFieldPlan):
+            errors.append(
+                f"{plan.filter_class.__name__}.{field.name} - {field.message}"
+            )
+        elif isinstance(field, _RelationshipFieldPlan):
+            errors.extend(_get_plan_errors(field.nested_plan))
+
+    return errors
+
+
+def warmup_model(
+        model_class: Any,
+        filter_class: Optional[Type[BaseFilterParams]],
+        ordering_fields: FrozenSet[str]
+) -> Optional[List[str]]:
+    """
+    Compiles the filter plan and resolves the ordering fields of the model
+
+    Parameters:
+        model_class (Any): SQLAlchemy Model Class
+        filter_class (Optional[Type[BaseFilterParams]]): Filter Params Schema
+        ordering_fields (FrozenSet[str]): Fields / field-paths allowed for ordering
+
+    Returns:
+        errors (Optional[List[str]]): Errors, None when the model class
+            is not a SQLAlchemy Model Class
+    """
+    if not isinstance(inspect(model_class, raiseerr=False), Mapper):
+        return None
+
+    errors = []
+
+    if filter_class is not None:
+        errors.extend(_get_plan_errors(compile_filters(
+            model_class=model_class,
+            filter_class=filter_class
+        )))
+
+    for field in sorted(ordering_fields):
+        if not _resolve_ordering_terms(model_class=model_class, order_by=field):
+            errors.append(
+                f"{model_class.__name__} - Invalid Ordering Field - {field}"
+            )
+            continue
+
+        _resolve_ordering_terms(model_class=model_class, order_by=f"-{field}")
+
+    return errors
@@ -1,10 +1,19 @@
+from fastapi_query.registry import register_model_warmer
+from .fields import apply_fields
 from .filtering import apply_filters
 from .pagination import paginate
 from .ordering import apply_ordering
+from .streaming import stream
+from .warmup import warmup_model
+
+register_model_warmer(warmup_model)
 
 
 __all__ = [
     "paginate",
+    "apply_fields",
     "apply_filters",
-    "apply_ordering"
+    "apply_ordering",
+    "stream",
+    "warmup_model"
 ]
@@ -0,0 +1,144 @@
+from typing import Any, List, Optional, Tuple
+
+from tortoise.fields.relational import BackwardFKRelation, ForeignKeyFieldInstance
+from tortoise.query_utils import Prefetch
+from tortoise.queryset import QuerySet
+
+from fastapi_query.fields.schemas import FieldsParams
+from fastapi_query.fields.utils import (
+    FieldsTree,
+    get_fields_tree,
+    raise_invalid_field
+)
+
+
+def _resolve_fields_tree(
+        model: Any,
+        tree: FieldsTree,
+        path: str = ""
+) -> FieldsTree:
+    """
+    Validates the selected fields against the model, the relations
+    selected without nested fields are expanded to all their fields
+    """
+    res: FieldsTree = {}
+
+    for name, subtree in tree.items():
+        field_path = f"{path}{name}"
+
+        if name in model._meta.fields_db_projection and not subtree:
+            res[name] = {}
+        elif name in model._meta.fetch_fields:
+            related_model = model._meta.fields_map[name].related_model
+
+            if subtree:
+                res[name] = _resolve_fields_tree(
+                    model=related_model,
+                    tree=subtree,
+                    path=f"{field_path}__"
+                )
+            else:
+                res[name] = {
+                    key: {} for key in related_model._meta.fields_db_projection
+                }
+        else:
+            raise_invalid_field(field_path)
+
+    return res
+
+
+def _restrict_queryset(
+        queryset: QuerySet,
+        tree: FieldsTree,
+        required_fields: Tuple[str, ...] = ()
+) -> QuerySet:
+    """
+    Loads only the selected fields (`.only()`), the primary key and the keys
+    the relations are matched by, the selected relations are prefetched
+    """
+    meta = queryset.model._meta
+    only = [meta.pk_attr, *required_fields]
+    prefetches: List[Prefetch] = []
+
+    for name, subtree in tree.items():
+        if name not in meta.fetch_fields:
+            only.append(name)
+            continue
+
+        field = meta.fields_map[name]
+        related_fields: Tuple[str, ...] = ()
+
+        if isinstance(field, ForeignKeyFieldInstance):
+            # Also covers one-to-one fields
+            only.append(field.source_field)
+        elif isinstance(field, BackwardFKRelation):
+            related_fields = (field.relation_field,)
+
+        prefetches.append(Prefetch(
+            relation=name,
+            queryset=_restrict_queryset(
+                queryset=field.related_model.all(),
+                tree=subtree,
+                required_fields=related_fields
+            )
+        ))
+
+    queryset = queryset.only(*dict.fromkeys(only))
+
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+
+    return queryset
+
+
+def get_fields(
+        model: Any,
+        fields_params: Optional[FieldsParams]
+) -> FieldsTree:
+    """
+    Parses and validates the selected fields against the model
+
+    Parameters:
+        model (Any): Tortoise Model Class
+        fields_params (Optional[FieldsParams]): Fields Params
+
+    Returns:
+        tree (FieldsTree): Selected fields, empty when all the fields are loaded
+    """
+    if fields_params is None:
+        return {}
+
+    return _resolve_fields_tree(
+        model=model,
+        tree=get_fields_tree(fields_params.fields)
+    )
+
+
+def apply_fields(
+        queryset: QuerySet,
+        fields_params: Optional[FieldsParams]
+) -> Tuple[QuerySet, FieldsTree]:
+    """
+    Restricts the loaded fields to the selected ones (`.only()`) and prefetches
+    the selected relations, the items should be read with `project_items`
+
+    Parameters:
+        queryset (QuerySet): Pre-constructed QuerySet
+        fields_params (Optional[FieldsParams]): Fields Params
+
+    Returns:
+        result (Tuple[QuerySet, FieldsTree]): Result QuerySet
+            and the selected fields
+    """
+    tree = get_fields(
+        model=queryset.model,
+        fields_params=fields_params
+    )
+
+    if tree:
+        queryset = _restrict_queryset(
+            queryset=queryset,
+            tree=tree
+        )
+
+    return queryset, tree
@@ -1,4 +1,4 @@
-from typing import Optional, Type, List
+from typing import Dict, Optional, Type, List
 
 from tortoise.expressions import Q
 from tortoise.models import Model
@@ -8,6 +8,8 @@ from fastapi_query._compat import _model_dump
 from fastapi_query.ext.tortoise.utils import is_field_relationship, check_model_field
 from fastapi_query.filtering import BaseFilterParams
 from fastapi_query.filtering.enums import FilterOperators
+from fastapi_query.filtering.utils import get_prefix_upper_bound
+from fastapi_query.registry import register
 from fastapi_query.utils import flatten_dict
 
 _orm_operator_transformer = {
@@ -30,6 +32,23 @@ _orm_operator_transformer = {
 }
 
 
+def _startswith_range(field: str, value: str) -> Dict[str, str]:
+    res = {f"{field}__gte": value}
+    upper_bound = get_prefix_upper_bound(value)
+
+    if upper_bound is not None:
+        res[f"{field}__lt"] = upper_bound
+
+    return res
+
+
+# `startswith` as the range predicate (`Settings.startswith_as_range`),
+# Tortoise can't range over `lower(field)`, so `istartswith` stays LIKE
+_range_operator_transformer = {
+    FilterOperators.STARTSWITH: _startswith_range,
+}
+
+
 def _check_filter_fields(
         model_class: Type[Model],
         filters: BaseFilterParams
@@ -120,6 +139,16 @@ def _get_orm_filters(
             operator = parts[-1]
             field_name = "__".join(parts[:-1])
 
+        if (
+                operator in _range_operator_transformer and
+                getattr(filters.Settings, "startswith_as_range", False)
+        ):
+            res_filters.update(_range_operator_transformer[operator](
+                field=field_name,
+                value=value
+            ))
+            continue
+
         filter_field_name, filter_value = _orm_operator_transformer[operator](
             field=field_name,
             value=value
@@ -168,6 +197,8 @@ def apply_filters(
     if not filters:
         return queryset
 
+    register(filter_class=type(filters), model_class=model_class)
+
     filter_expression = _get_orm_filters(
         model_class=model_class,
         filters=filters
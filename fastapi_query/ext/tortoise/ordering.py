@@ -1,17 +1,22 @@
-from typing import Optional, Type
+from functools import lru_cache
+from typing import Any, Collection, Optional, Tuple, Type
 
 from tortoise import Model
 from tortoise.queryset import QuerySet
 
+from fastapi_query.registry import register
+from fastapi_query.utils import filter_ordering_fields
 from .utils import check_is_model_field_valid
 
+# Max number of resolved (model, order by) pairs kept in the cache
+ORDERING_CACHE_SIZE = 256
+
 
 def _check_is_field_valid(
         model_class: Type[Model],
         field: str
 ) -> bool:
     field_name = field
-    model_fields_map = model_class._meta.fields_map  # noqa
 
     if field.startswith("+") or field.startswith("-"):
         field_name = field[1:]
@@ -22,9 +27,28 @@ def _check_is_field_valid(
     )
 
 
+@lru_cache(maxsize=ORDERING_CACHE_SIZE)
+def _resolve_ordering_fields(
+        model_class: Type[Model],
+        order_by: str
+) -> Tuple[str, ...]:
+    """
+    Returns the valid fields of the order by string (cached)
+    """
+    return tuple(
+        field
+        for field in (field.strip() for field in order_by.split(","))
+        if _check_is_field_valid(
+            model_class=model_class,
+            field=field
+        )
+    )
+
+
 def apply_ordering(
         queryset: QuerySet,
-        order_by: Optional[str]
+        order_by: Optional[str],
+        allowed_fields: Optional[Collection[str]] = None
 ) -> QuerySet:
     """
     Function for applying order by on the query object
@@ -32,28 +56,29 @@ def apply_ordering(
     Parameters:
         queryset (QuerySet): Pre-constructed Select Statement
         order_by (Optional[str]): Comma-separated fields / field-paths
+        allowed_fields (Optional[Collection[str]]): Fields / field-paths allowed
+            for ordering, the other ones are ignored (all fields when None)
 
     Returns:
         result_queryset (QuerySet): Result QuerySet
     """
+    if allowed_fields is not None:
+        register(model_class=queryset.model, ordering_fields=allowed_fields)
+
+    if order_by and allowed_fields is not None:
+        order_by = filter_ordering_fields(
+            order_by=order_by,
+            allowed_fields=allowed_fields
+        )
 
     if not order_by:
         return queryset
 
-    fields = order_by.split(",")
-
-    model_class = queryset.model
-
-    fields = list(
-        filter(
-            lambda field: _check_is_field_valid(
-                model_class=model_class,
-                field=field
-            ),
-            fields
-        )
+    # Typed as Any, mypy doesn't consider the model classes hashable
+    model_class: Any = queryset.model
+    fields = _resolve_ordering_fields(
+        model_class=model_class,
+        order_by=order_by
     )
 
-    print(fields)
-
     return queryset.order_by(*fields)
@@ -1,10 +1,17 @@
-from typing import Any, TypeVar, Dict, Optional
+from typing import Any, Collection, TypeVar, Dict, Optional, Type, Union
 
+from fastapi.responses import Response
+from pydantic import BaseModel
 from tortoise.queryset import QuerySet
 
+from fastapi_query.fields.schemas import FieldsParams
+from fastapi_query.fields.utils import project_items
 from fastapi_query.filtering import BaseFilterParams
-from fastapi_query.pagination.schemas import PaginationParams
-from fastapi_query.pagination.utils import prepare_response
+from fastapi_query.pagination.cache import CountCache
+from fastapi_query.pagination.responses import prepare_json_response
+from fastapi_query.pagination.schemas import DEFAULT_GET_ALL_LIMIT, PaginationParams
+from fastapi_query.pagination.utils import prepare_get_all_response, prepare_response
+from .fields import apply_fields
 from .filtering import apply_filters
 from .ordering import apply_ordering
 
@@ -29,12 +36,30 @@ def _paginate_query_with_page(
     return queryset
 
 
+def _prebuild_response(
+        response: Dict[str, Any],
+        item_schema: Optional[Type[BaseModel]]
+) -> Union[Dict[str, Any], Response]:
+    if item_schema is None:
+        return response
+
+    return prepare_json_response(
+        response=response,
+        item_schema=item_schema
+    )
+
+
 async def paginate(
         queryset: QuerySet,
         pagination_params: PaginationParams,
         filter_params: Optional[BaseFilterParams] = None,
-        ordering_params: Optional[str] = None
-) -> Dict[str, Any]:
+        ordering_params: Optional[str] = None,
+        ordering_fields: Optional[Collection[str]] = None,
+        count_cache: Optional[CountCache] = None,
+        fields_params: Optional[FieldsParams] = None,
+        item_schema: Optional[Type[BaseModel]] = None,
+        get_all_limit: Optional[int] = DEFAULT_GET_ALL_LIMIT
+) -> Union[Dict[str, Any], Response]:
     """
     Applies Pagination for SQLAlchemy Asyncio Backend
 
@@ -43,9 +68,19 @@ async def paginate(
         pagination_params (PaginationParams): Pagination Params
         filter_params (Optional[BaseFilterParams]): Filtering Params
         ordering_params (Optional[str]): OrderBy Params (comma-separated)
+        ordering_fields (Optional[Collection[str]]): Fields / field-paths allowed
+            for ordering, the other ones are ignored (all fields when None)
+        count_cache (Optional[CountCache]): Cache of the total counts, the count
+            query is skipped while the count of the filtered queryset is cached
+        fields_params (Optional[FieldsParams]): Fields Params, the items are
+            returned as dicts of the selected fields when fields are selected
+        item_schema (Optional[Type[BaseModel]]): Item Schema, the response is
+            validated once and returned as the prebuilt JSON Response when set
+        get_all_limit (Optional[int]): Max number of items returned with
+            `get_all` (`meta.truncated` is set when exceeded), None for no limit
 
     Returns:
-        paginated_response (Dict[str, Any]): Paginated Result
+        paginated_response (Union[Dict[str, Any], Response]): Paginated Result
     """
 
     # Apply Filtering if params are provided
@@ -59,21 +94,73 @@ async def paginate(
     if ordering_params:
         queryset = apply_ordering(
             queryset=queryset,
-            order_by=ordering_params
+            order_by=ordering_params,
+            allowed_fields=ordering_fields
         )
 
-    total_items = await queryset.count()
+    # Load only the selected fields if params are provided
+    queryset, fields_tree = apply_fields(
+        queryset=queryset,
+        fields_params=fields_params
+    )
 
-    if not pagination_params.get_all:
-        queryset = _paginate_query_with_page(
-            queryset=queryset,
-            params=pagination_params
+    if pagination_params.get_all:
+        if get_all_limit is not None:
+            queryset = queryset.limit(limit=get_all_limit + 1)
+
+        items = project_items(
+            items=await queryset.all(),
+            tree=fields_tree
+        )
+
+        res = prepare_get_all_response(
+            items=items,
+            pagination_params=pagination_params,
+            get_all_limit=get_all_limit
+        )
+
+        return _prebuild_response(
+            response=res,
+            item_schema=item_schema
         )
 
-    items = await queryset.all()
+    count_query = queryset.count()
+    cache_key, cached_count = None, None
+    total_items: Optional[int]
+
+    if count_cache is not None:
+        cache_key = count_cache.make_key(count_query.sql())
+        cached_count = count_cache.get(cache_key)
+
+    if cached_count is None:
+        total_items = await count_query
+
+        if count_cache is not None and cache_key is not None:
+            count_cache.set(
+                key=cache_key,
+                total_items=total_items,
+                total_items_exact=True
+            )
+    else:
+        total_items, _ = cached_count
+
+    queryset = _paginate_query_with_page(
+        queryset=queryset,
+        params=pagination_params
+    )
+
+    items = project_items(
+        items=await queryset.all(),
+        tree=fields_tree
+    )
 
-    return prepare_response(
+    res = prepare_response(
         items=items,
         total_items=total_items,
         pagination_params=pagination_params
     )
+
+    return _prebuild_response(
+        response=res,
+        item_schema=item_schema
+    )
@@ -0,0 +1,269 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type
+)
+
+from pypika.enums import Order
+from tortoise.expressions import Case, Q, When
+from tortoise.fields.relational import (
+    BackwardOneToOneRelation,
+    ForeignKeyFieldInstance
+)
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+from fastapi_query.filtering import BaseFilterParams
+from .filtering import apply_filters
+from .ordering import apply_ordering
+
+
+def _is_keyset_field_nullable(
+        model_class: Type[Model],
+        field: str
+) -> Optional[bool]:
+    """
+    Returns whether the values of the ordering field (path) can be NULL,
+    None when the path goes through a to-many relationship (or is unknown)
+    """
+    *relationship_names, field_name = field.split("__")
+    nullable = False
+
+    for name in relationship_names:
+        relationship = model_class._meta.fields_map.get(name)  # noqa
+
+        if isinstance(relationship, BackwardOneToOneRelation):
+            nullable = True
+        elif isinstance(relationship, ForeignKeyFieldInstance):
+            nullable = nullable or relationship.null
+        else:
+            return None
+
+        model_class = relationship.related_model
+
+    model_field = model_class._meta.fields_map.get(field_name)  # noqa
+
+    if model_field is None:
+        return None
+
+    return nullable or model_field.null
+
+
+def _prepare_keyset_queryset(
+        queryset: QuerySet
+) -> Optional[Tuple[QuerySet, List[Tuple[str, bool]]]]:
+    """
+    Orders the queryset by the ordering fields and the primary key. The NULLs
+    of the nullable fields are ordered by the annotated flag (last, first
+    when desc), so the order does not depend on the database.
+
+    Returns:
+        result (Optional[Tuple[QuerySet, List[Tuple[str, bool]]]]): Ordered
+            QuerySet and Pairs of keyset field and desc flag, None when
+            the queryset is ordered through a to-many relationship
+    """
+    model_class = queryset.model
+    pk_attr = model_class._meta.pk_attr  # noqa
+    annotations: Dict[str, Any] = {}
+    keyset: List[Tuple[str, bool]] = []
+
+    for field, order in queryset._orderings:  # noqa
+        desc = order == Order.desc
+
+        if field in queryset._annotations:  # noqa
+            keyset.append((field, desc))
+            continue
+
+        nullable = _is_keyset_field_nullable(
+            model_class=model_class,
+            field=field
+        )
+
+        if nullable is None:
+            return None
+
+        if nullable:
+            flag = f"_keyset_null_{len(annotations)}"
+            annotations[flag] = Case(
+                When(**{f"{field}__isnull": True}, then=1),
+                default=0
+            )
+            keyset.append((flag, desc))
+
+        keyset.append((field, desc))
+
+    if all(field not in (pk_attr, "pk") for field, _ in keyset):
+        keyset.append((pk_attr, False))
+
+    queryset = queryset.annotate(**annotations).order_by(*[
+        f"-{field}" if desc else field
+        for field, desc in keyset
+    ])
+
+    return queryset, keyset
+
+
+async def _get_keyset_values(
+        queryset: QuerySet,
+        item: Any,
+        keyset: List[Tuple[str, bool]]
+) -> List[Any]:
+    """
+    Returns the keyset values of the item, the values of the relationship
+    paths are selected by the primary key
+    """
+    paths = [
+        field for field, _ in keyset
+        if "__" in field and field not in queryset._annotations  # noqa
+    ]
+    values = {}
+
+    if paths:
+        rows = await queryset.model.filter(pk=item.pk).values_list(*paths)
+        values = dict(zip(paths, rows[0]))  # noqa: B905
+
+    return [
+        values[field] if field in values else getattr(item, field)
+        for field, _ in keyset
+    ]
+
+
+def _get_keyset_criteria(
+        keyset: List[Tuple[str, bool]],
+        values: List[Any]
+) -> Q:
+    """
+    Returns the criteria selecting the rows after the keyset values,
+    (a, b) > (x, y) is expanded to a > x OR (a = x AND b > y).
+    NULL values are matched by the equal NULL flags.
+    """
+    branches = []
+    equal: List[Q] = []
+
+    for (field, desc), value in zip(keyset, values):  # noqa: B905
+        if value is None:
+            continue
+
+        operator = "lt" if desc else "gt"
+        branches.append(Q(*equal, Q(**{f"{field}__{operator}": value})))
+        equal.append(Q(**{field: value}))
+
+    return Q(*branches, join_type=Q.OR)
+
+
+async def _stream_by_keyset(
+        queryset: QuerySet,
+        keyset: List[Tuple[str, bool]],
+        chunk_size: int
+) -> AsyncIterator[Any]:
+    """
+    Fetches the chunks ordered by the keyset (ordering fields and the
+    primary key), every chunk starts after the last item of the previous one
+    """
+    criteria = None
+
+    while True:
+        chunk_queryset = queryset
+
+        if criteria is not None:
+            chunk_queryset = chunk_queryset.filter(criteria)
+
+        items = await chunk_queryset.limit(chunk_size)
+
+        for item in items:
+            yield item
+
+        if len(items) < chunk_size:
+            break
+
+        criteria = _get_keyset_criteria(
+            keyset=keyset,
+            values=await _get_keyset_values(
+                queryset=queryset,
+                item=items[-1],
+                keyset=keyset
+            )
+        )
+
+
+async def _stream_by_offset(
+        queryset: QuerySet,
+        chunk_size: int
+) -> AsyncIterator[Any]:
+    offset = 0
+
+    while True:
+        items = await queryset.offset(offset).limit(chunk_size)
+
+        for item in items:
+            yield item
+
+        if len(items) < chunk_size:
+            break
+
+        offset += chunk_size
+
+
+def stream(
+        queryset: QuerySet,
+        filter_params: Optional[BaseFilterParams] = None,
+        ordering_params: Optional[str] = None,
+        ordering_fields: Optional[Collection[str]] = None,
+        chunk_size: int = 1000
+) -> AsyncIterator[Any]:
+    """
+    Streams all the filtered items for Tortoise Backend (bulk export) in
+    chunks, without the count query and without loading the whole result
+    in memory. The chunks are read by the keyset (the ordering fields and
+    the primary key), the querysets ordered through a to-many relationship
+    chunk by chunk with offset.
+
+    Parameters:
+        queryset (QuerySet): Pre-constructed QuerySet
+        filter_params (Optional[BaseFilterParams]): Filtering Params
+        ordering_params (Optional[str]): OrderBy Params (comma-separated)
+        ordering_fields (Optional[Collection[str]]): Fields / field-paths allowed
+            for ordering, the other ones are ignored (all fields when None)
+        chunk_size (int): Number of items fetched at once
+
+    Returns:
+        items (AsyncIterator[Any]): Items, fetched lazily
+    """
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be positive")
+
+    # Apply Filtering if params are provided
+    if filter_params:
+        queryset = apply_filters(
+            queryset=queryset,
+            filters=filter_params
+        )
+
+    # Apply Ordering if params are provided
+    if ordering_params:
+        queryset = apply_ordering(
+            queryset=queryset,
+            order_by=ordering_params,
+            allowed_fields=ordering_fields
+        )
+
+    prepared = _prepare_keyset_queryset(queryset)
+
+    if prepared is None:
+        return _stream_by_offset(
+            queryset=queryset,
+            chunk_size=chunk_size
+        )
+
+    queryset, keyset = prepared
+
+    return _stream_by_keyset(
+        queryset=queryset,
+        keyset=keyset,
+        chunk_size=chunk_size
+    )
@@ -0,0 +1,115 @@
+from typing import Any, FrozenSet, List, Optional, Type
+
+from tortoise.fields.relational import RelationalField
+from tortoise.models import Model
+
+from fastapi_query.filtering import BaseFilterParams
+from fastapi_query.filtering.utils import get_filter_fields_info
+from .filtering import _orm_operator_transformer
+from .ordering import _resolve_ordering_fields
+from .utils import check_is_model_field_valid, is_field_relationship
+
+
+def _get_filter_class_errors(
+        model_class: Type[Model],
+        filter_class: Type[BaseFilterParams]
+) -> List[str]:
+    """
+    Returns the messages of the fields that can't be applied to the model
+    (the checks `apply_filters` makes for the fields in use)
+    """
+    errors: List[str] = []
+    model_fields_map = model_class._meta.fields_map  # noqa
+    settings = filter_class.Settings
+
+    for field_info in get_filter_fields_info(filter_class):
+        name = f"{filter_class.__name__}.{field_info.name}"
+        field_name = field_info.name
+
+        if field_name == settings.search_field:
+            errors.extend(
+                f"{name} - {field} is not valid field "
+                f"for [{model_class.__name__}] model!"
+                for field in settings.searchable_fields or []
+                if not check_is_model_field_valid(
+                    model_class=model_class,
+                    field_name=field
+                )
+            )
+            continue
+
+        if "__" in field_name:
+            *parts, operator = field_name.split("__")
+            field_name = "__".join(parts)
+
+            if operator not in _orm_operator_transformer:
+                errors.append(f"{name} - Invalid Filter Operator - {operator}")
+                continue
+
+        if field_name not in model_fields_map:
+            errors.append(
+                f"{name} - {model_class.__name__} does not contain "
+                f"[{field_name}] field"
+            )
+            continue
+
+        is_relationship = is_field_relationship(
+            model_class=model_class,
+            field_name=field_name
+        )
+
+        if is_relationship != (field_info.nested_filter_type is not None):
+            errors.append(
+                f"{name} - nested filters must be applied to the relationships "
+                f"of {model_class.__name__}"
+            )
+        elif field_info.nested_filter_type is not None:
+            related_field = model_fields_map[field_name]
+
+            if isinstance(related_field, RelationalField):
+                errors.extend(_get_filter_class_errors(
+                    model_class=related_field.related_model,
+                    filter_class=field_info.nested_filter_type
+                ))
+
+    return errors
+
+
+def warmup_model(
+        model_class: Any,
+        filter_class: Optional[Type[BaseFilterParams]],
+        ordering_fields: FrozenSet[str]
+) -> Optional[List[str]]:
+    """
+    Checks the filter class and resolves the ordering fields of the model
+
+    Parameters:
+        model_class (Any): Tortoise Model Class
+        filter_class (Optional[Type[BaseFilterParams]]): Filter Params Schema
+        ordering_fields (FrozenSet[str]): Fields / field-paths allowed for ordering
+
+    Returns:
+        errors (Optional[List[str]]): Errors, None when the model class
+            is not a Tortoise Model Class
+    """
+    if not (isinstance(model_class, type) and issubclass(model_class, Model)):
+        return None
+
+    errors = []
+
+    if filter_class is not None:
+        errors.extend(_get_filter_class_errors(
+            model_class=model_class,
+            filter_class=filter_class
+        ))
+
+    for field in sorted(ordering_fields):
+        if not _resolve_ordering_fields(model_class=model_class, order_by=field):
+            errors.append(
+                f"{model_class.__name__} - Invalid Ordering Field - {field}"
+            )
+            continue
+
+        _resolve_ordering_fields(model_class=model_class, order_by=f"-{field}")
+
+    return errors
@@ -0,0 +1,10 @@
+from .deps import Fields
+from .schemas import FieldsParams
+from .utils import project_items
+
+
+__all__ = [
+    "Fields",
+    "FieldsParams",
+    "project_items"
+]
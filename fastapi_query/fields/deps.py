@@ -0,0 +1,7 @@
+from fastapi import Depends
+
+from .schemas import FieldsParams
+
+
+def Fields() -> FieldsParams: # noqa
+    return Depends(FieldsParams)
@@ -0,0 +1,7 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class FieldsParams(BaseModel):
+    fields: Optional[str] = Field(default=None)
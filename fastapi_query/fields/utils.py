@@ -0,0 +1,100 @@
+from collections.abc import Iterable, Mapping, Sized
+from typing import Any, Dict, List, Optional
+
+from fastapi.exceptions import RequestValidationError
+
+FieldsTree = Dict[str, "FieldsTree"]
+
+
+def get_fields_tree(fields: Optional[str]) -> FieldsTree:
+    """
+    Parses the comma-separated fields / field-paths to the tree of fields,
+    e.g. `id,name,tags__name` to `{"id": {}, "name": {}, "tags": {"name": {}}}`
+
+    Parameters:
+        fields (Optional[str]): Comma-separated fields / field-paths
+
+    Returns:
+        tree (FieldsTree): Nested fields, empty when no fields are selected
+    """
+    tree: FieldsTree = {}
+
+    if not fields:
+        return tree
+
+    for field in fields.split(","):
+        path = [name.strip() for name in field.split("__")]
+
+        if not all(path):
+            if any(path):
+                raise_invalid_field(field.strip())
+            continue
+
+        node = tree
+        for name in path:
+            node = node.setdefault(name, {})
+
+    return tree
+
+
+def raise_invalid_field(field_path: str) -> None:
+    raise RequestValidationError(errors=[{
+        "loc": ("query", "fields"),
+        "msg": f"Unknown field '{field_path}'",
+        "type": "value_error"
+    }])
+
+
+def _is_collection(value: Any) -> bool:
+    # ORM objects may be iterable (Tortoise models), but they are not sized
+    return (
+        isinstance(value, Sized) and
+        isinstance(value, Iterable) and
+        not isinstance(value, (str, bytes, Mapping))
+    )
+
+
+def project_item(
+        item: Any,
+        tree: FieldsTree
+) -> Dict[str, Any]:
+    """
+    Reads only the selected fields of the item (ORM object), so the
+    attributes that were not loaded are never accessed
+
+    Parameters:
+        item (Any): ORM Object
+        tree (FieldsTree): Selected fields (see `get_fields_tree`),
+            relationships have to be expanded to their fields
+
+    Returns:
+        projected_item (Dict[str, Any]): Selected fields of the item
+    """
+    res = {}
+
+    for name, subtree in tree.items():
+        value = getattr(item, name)
+
+        if subtree and value is not None:
+            if _is_collection(value):
+                value = [project_item(obj, subtree) for obj in value]
+            else:
+                value = project_item(value, subtree)
+
+        res[name] = value
+
+    return res
+
+
+def project_items(
+        items: List[Any],
+        tree: FieldsTree
+) -> List[Any]:
+    """
+    Projects the items to the selected fields (see `project_item`),
+    the items are returned as they are when no fields are selected
+    """
+    if not tree:
+        return items
+
+    return [project_item(item, tree) for item in items]
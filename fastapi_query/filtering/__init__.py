@@ -1,9 +1,12 @@
 from .base_params import BaseFilterParams, WithPrefix
 from .deps import Filter
+from .enums import RelationshipFilterStrategy, SearchMode
 
 
 __all__ = [
     "BaseFilterParams",
     "WithPrefix",
-    "Filter"
+    "Filter",
+    "RelationshipFilterStrategy",
+    "SearchMode"
 ]
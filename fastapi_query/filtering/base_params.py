@@ -1,31 +1,82 @@
-from typing import List, Optional, Type, Dict, Any
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Type
 
 from pydantic import BaseModel
 
 from fastapi_query._compat import _model_validator
 
-from .enums import FilterOperators
+from .enums import FilterOperators, RelationshipFilterStrategy, SearchMode
 
 OPERATORS_WITH_SEQ_ARG = {FilterOperators.IN, FilterOperators.NOT_IN}
 
 
+def _split_list_value(
+        field: str,
+        value: Any,
+        max_list_length: Optional[int]
+) -> Any:
+    """
+    Splits the comma-separated value (or each of the repeated values)
+    to the list of values, the split is bounded by `max_list_length`
+    """
+    if isinstance(value, str):
+        value = [value]
+    elif not isinstance(value, (list, tuple)):
+        return value
+
+    res: List[Any] = []
+
+    for item in value:
+        if isinstance(item, str):
+            # Bounded split, the values over the limit are not split
+            res.extend(item.split(
+                ",",
+                max_list_length if max_list_length is not None else -1
+            ))
+        else:
+            res.append(item)
+
+        if max_list_length is not None and len(res) > max_list_length:
+            raise ValueError(
+                f"[{field}] accepts at most {max_list_length} values"
+            )
+
+    return res
+
+
 class BaseFilterParams(BaseModel):
+    # Fields accepting the comma-separated lists, computed per subclass
+    _list_fields: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls._list_fields = frozenset(
+            field
+            for klass in cls.__mro__
+            for field in klass.__dict__.get("__annotations__", {})
+            if "__" in field and field.split("__")[-1] in OPERATORS_WITH_SEQ_ARG
+        )
 
     @_model_validator(mode="before")
     def parse_raw_values(cls, values: Dict[str, Any]) -> Dict[str, Any]:
 
-        res = {}
+        list_fields = [
+            field for field in cls._list_fields
+            if values.get(field) is not None
+        ]
+
+        if not list_fields:
+            return values
 
-        for field, value in values.items():
-            if (
-                    value is not None and
-                    "__" in field and
-                    field.split("__")[-1] in OPERATORS_WITH_SEQ_ARG
+        res = dict(values)
+        max_list_length = getattr(cls.Settings, "max_list_length", None)
 
-            ):
-                res[field] = value.split(",")
-            else:
-                res[field] = value
+        for field in list_fields:
+            res[field] = _split_list_value(
+                field=field,
+                value=values[field],
+                max_list_length=max_list_length
+            )
 
         return res
 
@@ -33,6 +84,20 @@ class BaseFilterParams(BaseModel):
         prefix: Optional[str] = None
         search_field: str = "search"
         searchable_fields: List[str] = []
+        relationship_strategy: RelationshipFilterStrategy = (
+            RelationshipFilterStrategy.EXISTS
+        )
+        startswith_as_range: bool = False
+        # Max number of values of the list (`__in` / `__not_in`) fields,
+        # not limited by default
+        max_list_length: Optional[int] = None
+        search_mode: SearchMode = SearchMode.ILIKE
+        # Full-text search: PostgreSQL text search config, precomputed
+        # tsvector columns and SQLite FTS5 tables (rowid = primary key)
+        # by the relationship path of the searchable fields ("" for the model)
+        search_config: str = "simple"
+        search_vector_fields: Dict[str, str] = {}
+        search_fts_tables: Dict[str, str] = {}
 
 
 def WithPrefix( # noqa
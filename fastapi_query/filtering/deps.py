@@ -1,44 +1,94 @@
-from typing import Type, TypeVar
+import inspect
+from typing import Any, Collection, Optional, Type, TypeVar
 
-from fastapi import Depends
-from pydantic import create_model
+from fastapi import Depends, Query
 from typing_extensions import Annotated
 
-from fastapi_query._compat import _model_dump
+from fastapi_query._compat import (
+    Undefined,
+    _get_query_field_params,
+    _skip_validation
+)
+from fastapi_query.registry import register
 from .base_params import BaseFilterParams
-from .utils import flatten_filter_fields, pack_values
+from .utils import flatten_filter_fields, get_values_packer
 
 FilterParamsType = TypeVar("FilterParamsType", bound=BaseFilterParams)
 
 
+def _get_query_parameter(
+        name: str,
+        field_type: Any,
+        field_info: Any
+) -> inspect.Parameter:
+    default = field_info.default
+
+    if default is Undefined or default is Ellipsis:
+        default = inspect.Parameter.empty
+
+    constraints, query_params = _get_query_field_params(field_info)
+
+    for constraint in constraints:
+        # Nested Annotated types are flattened
+        field_type = Annotated[field_type, constraint]
+
+    # FastAPI only collects the raw query values (the types and the
+    # constraints are kept for the docs), they are coerced and validated
+    # once, when packed to the filter class
+    return inspect.Parameter(
+        name=name,
+        kind=inspect.Parameter.KEYWORD_ONLY,
+        default=default,
+        annotation=Annotated[
+            _skip_validation(field_type),
+            Query(**query_params)
+        ]
+    )
+
+
 def Filter(  # noqa
-        model: Type[FilterParamsType]
+        model: Type[FilterParamsType],
+        model_class: Optional[Any] = None,
+        ordering_fields: Optional[Collection[str]] = None
 ) -> FilterParamsType:
     """
     Filter Dependency
 
     Parameters:
         model (Type[BaseFilterParams]): Filter Params Schema
+        model_class (Optional[Any]): Model Class the filters are applied to,
+            recorded so `warmup` checks the filters against it at startup
+        ordering_fields (Optional[Collection[str]]): Fields / field-paths
+            allowed for ordering the model class (recorded for `warmup`)
 
     Returns:
         dependency_result (BaseFilterParams): Filter Object
     """
-    fields = flatten_filter_fields(model)
-
-    GeneratedFilterModel: Type[BaseFilterParams] = create_model(
-        model.__class__.__name__,
-        **fields
+    packer = get_values_packer(model)
+    register(
+        filter_class=model,
+        model_class=model_class,
+        ordering_fields=ordering_fields
     )
 
-    InnerFilters = Annotated[GeneratedFilterModel, Depends(GeneratedFilterModel)]
+    def wrapped_func(**values: Any) -> FilterParamsType:
+        return packer(values)
 
-    def wrapped_func(
-            inner_filters: InnerFilters
-    ) -> FilterParamsType:
-        values = _model_dump(inner_filters)
-        return pack_values(
-            filter_class=model,
-            values=values
-        )
+    wrapped_func.filter_class = model  # type: ignore
+    wrapped_func.model_class = model_class  # type: ignore
+    wrapped_func.ordering_fields = ordering_fields  # type: ignore
+
+    # Query parameters declared explicitly, so the list fields
+    # accept the repeated parameters
+    wrapped_func.__signature__ = inspect.Signature(  # type: ignore
+        parameters=[
+            _get_query_parameter(
+                name=name,
+                field_type=field_type,
+                field_info=field_info
+            )
+            for name, (field_type, field_info) in flatten_filter_fields(model).items()
+        ]
+    )
 
     return Depends(wrapped_func)
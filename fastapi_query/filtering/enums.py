@@ -18,3 +18,14 @@ class FilterOperators(str, Enum):
     CONTAINS = "contains"
     ICONTAINS = "icontains"
     IEXACT = "iexact"
+
+
+class RelationshipFilterStrategy(str, Enum):
+    EXISTS = "exists"
+    IN = "in"
+    JOIN = "join"
+
+
+class SearchMode(str, Enum):
+    ILIKE = "ilike"
+    FULL_TEXT = "full_text"
@@ -1,6 +1,8 @@
 import inspect
+import sys
 from collections import deque
 from copy import deepcopy
+from functools import lru_cache, partial
 from typing import (
     Type,
     Dict,
@@ -15,7 +17,9 @@ from typing import (
     List,
     Set,
     FrozenSet,
-    Deque
+    Deque,
+    NamedTuple,
+    Callable
 )
 
 from fastapi.exceptions import RequestValidationError
@@ -141,6 +145,81 @@ def check_nested_filter_type(
     return is_nester_filter or (include_optional and is_optional_nester_filter)
 
 
+def get_prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Returns the smallest string greater than all the strings starting with
+    the prefix, so `startswith` can be applied as the range
+    `prefix <= value < upper_bound` (binary / "C" collation order).
+
+    Parameters:
+        prefix (str): Prefix
+
+    Returns:
+        upper_bound (Optional[str]): Exclusive upper bound, None when unbounded
+    """
+    while prefix:
+        code_point = ord(prefix[-1]) + 1
+
+        # Surrogates can't be encoded, so they are skipped
+        if 0xD800 <= code_point <= 0xDFFF:
+            code_point = 0xE000
+
+        if code_point <= sys.maxunicode:
+            return prefix[:-1] + chr(code_point)
+
+        prefix = prefix[:-1]
+
+    return None
+
+
+class FilterFieldInfo(NamedTuple):
+    name: str
+    field: Any
+    field_type: Any
+    # Set for the nested filter fields only
+    nested_filter_type: Optional[Type[BaseFilterParams]] = None
+    prefix: Optional[str] = None
+
+
+@lru_cache(maxsize=None)
+def get_filter_fields_info(
+        filter_class: Type[BaseFilterParams]
+) -> Tuple[FilterFieldInfo, ...]:
+    """
+    Returns (and caches) the fields metadata of the Filter Params Schema,
+    so the annotations are not inspected on each request
+
+    Parameters:
+        filter_class (Type[BaseFilterParams]): Filter Params Schema
+
+    Returns:
+        fields_info (Tuple[FilterFieldInfo, ...]): Fields Metadata
+    """
+    res = []
+
+    for field_name, f in _get_model_fields(filter_class).items():
+        field_type = filter_class.__annotations__.get(field_name, f.type_)
+
+        if check_nested_filter_type(field_type):
+            nested_filter_type = get_optional_subtype(field_type) or field_type
+
+            res.append(FilterFieldInfo(
+                name=field_name,
+                field=f,
+                field_type=field_type,
+                nested_filter_type=nested_filter_type,
+                prefix=nested_filter_type.Settings.prefix or field_name
+            ))
+        else:
+            res.append(FilterFieldInfo(
+                name=field_name,
+                field=f,
+                field_type=field_type
+            ))
+
+    return tuple(res)
+
+
 def flatten_filter_fields(
         filter_class: Type[BaseFilterParams]
 ) -> Dict[str, Tuple[Union[object, Type], FieldInfo]]:
@@ -154,25 +233,24 @@ def flatten_filter_fields(
         flattened_schema_fields (Dict): Transformed Schema Fields Dictionary
     """
 
-    ret = {}
-    model_fields = _get_model_fields(filter_class)
+    ret: Dict[str, Tuple[Union[object, Type], FieldInfo]] = {}
 
-    for field_name, f in model_fields.items():
+    for field_name, f, field_type, nested_filter_type, prefix in (
+            get_filter_fields_info(filter_class)
+    ):
         field_info = deepcopy(f.field_info)
 
-        field_type = filter_class.__annotations__.get(field_name, f.type_)
-
         if check_sequence_type(field_type):
-            if isinstance(f.default, Iterable):
-                field_info.default = ",".join(map(str, f.default))
+            # Comma-separated and / or repeated query parameter
+            if isinstance(f.default, str):
+                field_info.default = [f.default]
+            elif isinstance(f.default, Iterable):
+                field_info.default = list(map(str, f.default))
 
-            res_field_type = str if f.required else Optional[str]
+            res_field_type = List[str] if f.required else Optional[List[str]]
             ret[field_name] = (res_field_type, field_info)
 
-        elif check_nested_filter_type(field_type):
-            nested_filter_type = get_optional_subtype(field_type) or field_type
-
-            prefix = nested_filter_type.Settings.prefix or field_name
+        elif nested_filter_type is not None:
             nested_fields = flatten_filter_fields(nested_filter_type)
 
             ret.update({
@@ -188,54 +266,127 @@ def flatten_filter_fields(
     return ret
 
 
-def pack_values(
+def _get_error_location(
+        loc: Tuple[Any, ...],
+        flat_keys: Dict[Tuple[str, ...], str]
+) -> Tuple[Any, ...]:
+    """
+    Returns the location of the error with the path of the nested field
+    replaced by its query parameter name
+    """
+    for i in range(len(loc), 0, -1):
+        flat_key = flat_keys.get(tuple(loc[:i]))
+
+        if flat_key is not None:
+            return ("query", flat_key, *loc[i:])
+
+    return ("query", *loc)
+
+
+def _validate_filter_values(
         filter_class: Type[BaseFilterParams],
-        values: Dict[str, Any]
+        values: Dict[str, Any],
+        flat_keys: Dict[Tuple[str, ...], str]
 ) -> BaseFilterParams:
+    try:
+        return _validate(filter_class, values)
+    except ValidationError as err:
+        errors = [
+            {
+                **error,
+                "loc": _get_error_location(
+                    loc=error["loc"],
+                    flat_keys=flat_keys
+                )
+            } for error in err.errors()
+        ]
+        raise RequestValidationError(errors=errors) from None
+
+
+def _get_packer_expression(
+        filter_class: Type[BaseFilterParams],
+        key_prefix: str,
+        path: Tuple[str, ...],
+        flat_keys: Dict[Tuple[str, ...], str]
+) -> str:
     """
-    Transforms the values from flattened schema to original schema.
+    Returns the source of the dict expression nesting the flat values,
+    the flat key of each field is collected to `flat_keys` by its path
+    """
+    items = []
+
+    for field_info in get_filter_fields_info(filter_class):
+        if field_info.nested_filter_type is not None:
+            value = _get_packer_expression(
+                filter_class=field_info.nested_filter_type,
+                key_prefix=f"{key_prefix}{field_info.prefix}__",
+                path=(*path, field_info.name),
+                flat_keys=flat_keys
+            )
+        else:
+            flat_key = f"{key_prefix}{field_info.name}"
+            flat_keys[path + (field_info.name,)] = flat_key
+            value = f"get({flat_key!r})"
+
+        items.append(f"{field_info.name!r}: {value}")
+
+    return f"{{{', '.join(items)}}}"
+
+
+@lru_cache(maxsize=None)
+def get_values_packer(
+        filter_class: Type[BaseFilterParams]
+) -> Callable[[Dict[str, Any]], BaseFilterParams]:
+    """
+    Generates (and caches) the function transforming the values from
+    flattened schema to original schema. The flat keys of each field are
+    resolved at generation time, so the values are looked up in a single pass,
+    and the nested values are validated at once with the filter class.
 
     Parameters:
         filter_class (Type[BaseFilterParams]): Original Filter Params Schema
-        values: (dict[str, Any]): Values
 
     Returns:
-        transformed_values (BaseFilterParams): Transformed Values
+        packer (Callable): Function accepting the flat values
     """
+    flat_keys: Dict[Tuple[str, ...], str] = {}
+    expression = _get_packer_expression(
+        filter_class=filter_class,
+        key_prefix="",
+        path=(),
+        flat_keys=flat_keys
+    )
+    source = (
+        "def pack(values):\n"
+        "    get = values.get\n"
+        f"    return validate({expression})\n"
+    )
+    namespace: Dict[str, Any] = {
+        "validate": partial(
+            _validate_filter_values,
+            filter_class,
+            flat_keys=flat_keys
+        )
+    }
 
-    model_fields = _get_model_fields(filter_class)
-    construction_dict = {}
+    exec(compile(source, f"<packer {filter_class.__name__}>", "exec"), namespace)  # noqa: S102
 
-    for field_name, f in model_fields.items():
-        field_type = filter_class.__annotations__.get(field_name, f.type_)
+    return namespace["pack"]
 
-        if check_nested_filter_type(field_type):
-            nested_filter_type = get_optional_subtype(field_type) or field_type
 
-            prefix = nested_filter_type.Settings.prefix or field_name
-
-            nested_values = {
-                "__".join(key.split("__")[1:]): value
-                for key, value in values.items()
-                if key.startswith(f"{prefix}__")
-            }
+def pack_values(
+        filter_class: Type[BaseFilterParams],
+        values: Dict[str, Any]
+) -> BaseFilterParams:
+    """
+    Transforms the values from flattened schema to original schema.
 
-            construction_dict[field_name] = pack_values(
-                filter_class=nested_filter_type,
-                values=nested_values
-            )
-        else:
-            construction_dict[field_name] = values.get(field_name)
+    Parameters:
+        filter_class (Type[BaseFilterParams]): Original Filter Params Schema
+        values: (dict[str, Any]): Values
 
-    try:
-        res = _validate(filter_class, construction_dict)
-    except ValidationError as err:
-        errors = [
-            {
-                **error,
-                "loc": ("query", *error["loc"])
-            } for error in err.errors()
-        ]
-        raise RequestValidationError(errors=errors) from None
+    Returns:
+        transformed_values (BaseFilterParams): Transformed Values
+    """
 
-    return res
+    return get_values_packer(filter_class)(values)
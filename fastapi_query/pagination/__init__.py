@@ -1,13 +1,32 @@
-from .deps import Paginate
+from .cache import CountCache, CountCacheBackend, InMemoryCountCacheBackend
+from .deps import Paginate, CursorPaginate
+from .enums import CountStrategy, ExportFormat, ResultMode
 from .schemas import (
     Paginated,
     PaginatedMeta,
-    PaginationParams
+    PaginationParams,
+    CursorPaginated,
+    CursorPaginatedMeta,
+    CursorPaginationParams
 )
+from .responses import prepare_json_response
+from .streaming import streaming_response
 
 __all__ = [
+    "CountCache",
+    "CountCacheBackend",
+    "InMemoryCountCacheBackend",
+    "CountStrategy",
+    "ExportFormat",
+    "ResultMode",
     "Paginate",
     "Paginated",
     "PaginatedMeta",
-    "PaginationParams"
+    "PaginationParams",
+    "CursorPaginate",
+    "CursorPaginated",
+    "CursorPaginatedMeta",
+    "CursorPaginationParams",
+    "prepare_json_response",
+    "streaming_response"
 ]
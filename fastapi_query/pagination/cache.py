@@ -0,0 +1,110 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Optional, Tuple
+
+
+class CountCacheBackend(ABC):
+    """
+    Storage used by the count cache. Values are JSON-serializable lists,
+    so a Redis-like store can implement it with GET / SET EX.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+
+class InMemoryCountCacheBackend(CountCacheBackend):
+    """
+    In-process backend with TTL expiration and LRU eviction
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._lock = Lock()
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (monotonic() + ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CountCache:
+    """
+    Cache of the total counts, keyed by the fingerprint of the filtered
+    statement (pagination excluded), so paging through the same result set
+    doesn't repeat the count query.
+
+    Parameters:
+        ttl (float): Seconds the cached count stays valid
+        backend (Optional[CountCacheBackend]): Storage, in-process by default
+        key_prefix (str): Prefix of the generated keys
+    """
+
+    def __init__(
+            self,
+            ttl: float = 60.0,
+            backend: Optional[CountCacheBackend] = None,
+            key_prefix: str = "fastapi_query:count:"
+    ) -> None:
+        self.ttl = ttl
+        self.backend = (
+            backend if backend is not None else InMemoryCountCacheBackend()
+        )
+        self.key_prefix = key_prefix
+
+    def make_key(self, fingerprint: str, *parts: Any) -> str:
+        raw = json.dumps([fingerprint, *parts], default=repr, sort_keys=True)
+        digest = hashlib.sha1(raw.encode()).hexdigest()
+
+        return f"{self.key_prefix}{digest}"
+
+    def get(self, key: str) -> Optional[Tuple[Optional[int], bool]]:
+        value = self.backend.get(key)
+
+        if value is None:
+            return None
+
+        total_items, total_items_exact = value
+
+        return total_items, total_items_exact
+
+    def set(
+            self,
+            key: str,
+            total_items: Optional[int],
+            total_items_exact: bool
+    ) -> None:
+        self.backend.set(key, [total_items, total_items_exact], self.ttl)
@@ -1,7 +1,11 @@
 from fastapi import Depends
 
-from .schemas import PaginationParams
+from .schemas import PaginationParams, CursorPaginationParams
 
 
 def Paginate() -> PaginationParams: # noqa
     return Depends(PaginationParams)
+
+
+def CursorPaginate() -> CursorPaginationParams: # noqa
+    return Depends(CursorPaginationParams)
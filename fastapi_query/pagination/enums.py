@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class CountStrategy(str, Enum):
+    EXACT = "exact"
+    NONE = "none"
+    CAPPED = "capped"
+    ESTIMATED = "estimated"
+    WINDOW = "window"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ResultMode(str, Enum):
+    ORM = "orm"
+    MAPPINGS = "mappings"
+    TUPLES = "tuples"
@@ -0,0 +1,39 @@
+from typing import Any, Dict, Type
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from fastapi_query._compat import _dump_json_from_attributes
+from fastapi_query.registry import register
+from .schemas import CursorPaginated, Paginated
+
+
+def prepare_json_response(
+        response: Dict[str, Any],
+        item_schema: Type[BaseModel],
+        cursor: bool = False
+) -> Response:
+    """
+    Validates the paginated response against `Paginated[item_schema]` once
+    (with the cached validator) and serializes it straight to JSON bytes,
+    the returned response is not validated again by the route response model
+
+    Parameters:
+        response (Dict[str, Any]): Paginated Response (items are ORM objects,
+            mappings or dicts)
+        item_schema (Type[BaseModel]): Item Schema
+        cursor (bool): Whether the response is cursor-paginated
+
+    Returns:
+        response (Response): JSON Response
+    """
+    response_class = CursorPaginated if cursor else Paginated
+    register(item_schema=item_schema)
+
+    return Response(
+        content=_dump_json_from_attributes(
+            response_class[item_schema],
+            response
+        ),
+        media_type="application/json"
+    )
@@ -1,15 +1,22 @@
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Optional
 
 from pydantic import BaseModel, Field
 
 DataT = TypeVar("DataT")
 
+# Max number of items returned with `get_all`, not limited by default
+# (pass `get_all_limit` to cap the items and report `meta.truncated`)
+DEFAULT_GET_ALL_LIMIT: Optional[int] = None
+
 
 class PaginatedMeta(BaseModel):
     current_page: int
     items_per_page: int
-    total_pages: int
-    total_items: int
+    total_pages: Optional[int] = None
+    total_items: Optional[int] = None
+    total_items_exact: bool = True
+    has_next: bool = False
+    truncated: bool = False
 
 
 class Paginated(BaseModel, Generic[DataT]):
@@ -21,3 +28,19 @@ class PaginationParams(BaseModel):
     page: int = Field(default=1, ge=1)
     size: int = Field(default=50, ge=1, le=200)
     get_all: bool = Field(default=False)
+
+
+class CursorPaginatedMeta(BaseModel):
+    items_per_page: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class CursorPaginated(BaseModel, Generic[DataT]):
+    items: List[DataT]
+    meta: CursorPaginatedMeta
+
+
+class CursorPaginationParams(BaseModel):
+    size: int = Field(default=50, ge=1, le=200)
+    cursor: Optional[str] = Field(default=None)
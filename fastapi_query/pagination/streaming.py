@@ -0,0 +1,225 @@
+import csv
+import inspect
+import json
+from functools import lru_cache
+from io import StringIO
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin
+)
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from fastapi_query._compat import (
+    _get_model_fields,
+    _model_dump,
+    _model_dump_json,
+    _validate_from_attributes
+)
+from .enums import ExportFormat
+
+_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+class _NdjsonEncoder:
+
+    def __init__(self, schema: Type[BaseModel]) -> None:
+        self.schema = schema
+
+    def __call__(self, item: Any) -> str:
+        model = _validate_from_attributes(self.schema, item)
+
+        return _model_dump_json(model) + "\n"
+
+
+def _get_nested_schema(field_type: Any) -> Optional[Type[BaseModel]]:
+    if get_origin(field_type) is Union:
+        args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        field_type = args[0] if len(args) == 1 else None
+
+    if inspect.isclass(field_type) and issubclass(field_type, BaseModel):
+        return field_type
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_csv_columns(
+        schema: Type[BaseModel],
+        parents: Tuple[Type[BaseModel], ...] = ()
+) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Returns the paths of the CSV columns, the fields of the nested schemas
+    are flattened (the recursive ones are written as JSON)
+    """
+    columns: List[Tuple[str, ...]] = []
+
+    for name, field in _get_model_fields(schema).items():
+        nested_schema = _get_nested_schema(
+            getattr(field, "outer_type_", field.type_)
+        )
+
+        if nested_schema is None or nested_schema in (schema, *parents):
+            columns.append((name,))
+        else:
+            columns.extend(
+                (name, *path)
+                for path in _get_csv_columns(nested_schema, (schema, *parents))
+            )
+
+    return tuple(columns)
+
+
+class _CsvEncoder:
+    """
+    Encodes the items as CSV rows, nested objects are flattened to
+    `field__nested_field` columns and lists are written as JSON.
+    The header (from the schema) is written before the first row.
+    """
+
+    def __init__(self, schema: Type[BaseModel]) -> None:
+        self.schema = schema
+        self.columns = _get_csv_columns(schema)
+        self.header_written = False
+
+    def __call__(self, item: Any) -> str:
+        model = _validate_from_attributes(self.schema, item)
+        data = _model_dump(model, mode="json")
+
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+
+        if not self.header_written:
+            writer.writerow(["__".join(column) for column in self.columns])
+            self.header_written = True
+
+        writer.writerow([
+            _get_csv_value(_get_path_value(data, column))
+            for column in self.columns
+        ])
+
+        return buffer.getvalue()
+
+
+def _get_path_value(data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    value: Any = data
+
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+
+        value = value.get(key)
+
+    return value
+
+
+def _get_csv_value(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+
+    return value
+
+
+def _encode_batches(
+        items: Iterable[Any],
+        encode: Callable[[Any], str],
+        batch_size: int
+) -> Iterator[str]:
+    batch = []
+
+    for item in items:
+        batch.append(encode(item))
+
+        if len(batch) >= batch_size:
+            yield "".join(batch)
+            batch = []
+
+    if batch:
+        yield "".join(batch)
+
+
+async def _encode_batches_async(
+        items: AsyncIterable[Any],
+        encode: Callable[[Any], str],
+        batch_size: int
+) -> AsyncIterator[str]:
+    batch = []
+
+    async for item in items:
+        batch.append(encode(item))
+
+        if len(batch) >= batch_size:
+            yield "".join(batch)
+            batch = []
+
+    if batch:
+        yield "".join(batch)
+
+
+def streaming_response(
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        schema: Type[BaseModel],
+        export_format: ExportFormat = ExportFormat.NDJSON,
+        filename: Optional[str] = None,
+        batch_size: int = 100
+) -> StreamingResponse:
+    """
+    Creates the response streaming the items (e.g. from `stream` / `stream_async`)
+    as NDJSON or CSV, the items are serialized one batch at a time
+
+    Parameters:
+        items (Union[Iterable[Any], AsyncIterable[Any]]): Items (ORM objects)
+        schema (Type[BaseModel]): Schema the items are serialized with
+        export_format (ExportFormat): NDJSON or CSV
+        filename (Optional[str]): Download filename (Content-Disposition)
+        batch_size (int): Number of items sent in one chunk
+
+    Returns:
+        response (StreamingResponse): Streaming Response
+    """
+    export_format = ExportFormat(export_format)
+
+    if export_format == ExportFormat.CSV:
+        encode: Callable[[Any], str] = _CsvEncoder(schema)
+    else:
+        encode = _NdjsonEncoder(schema)
+
+    if isinstance(items, AsyncIterable):
+        content: Union[Iterator[str], AsyncIterator[str]] = _encode_batches_async(
+            items=items,
+            encode=encode,
+            batch_size=batch_size
+        )
+    else:
+        content = _encode_batches(
+            items=items,
+            encode=encode,
+            batch_size=batch_size
+        )
+
+    headers: Dict[str, str] = {}
+
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    return StreamingResponse(
+        content=content,
+        media_type=_MEDIA_TYPES[export_format],
+        headers=headers
+    )
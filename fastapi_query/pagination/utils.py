@@ -1,23 +1,152 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
 from math import ceil
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from uuid import UUID
 
-from .schemas import PaginationParams
+from fastapi.exceptions import RequestValidationError
+
+from .schemas import PaginationParams, CursorPaginationParams
+
+_cursor_value_encoders: Dict[type, Tuple[str, Callable[[Any], str]]] = {
+    datetime: ("dt", lambda value: value.isoformat()),
+    date: ("d", lambda value: value.isoformat()),
+    time: ("t", lambda value: value.isoformat()),
+    Decimal: ("dec", str),
+    UUID: ("uuid", str),
+}
+
+_cursor_value_decoders = {
+    "dt": datetime.fromisoformat,
+    "d": date.fromisoformat,
+    "t": time.fromisoformat,
+    "dec": Decimal,
+    "uuid": UUID,
+}
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        value = value.value
+
+    encoder = _cursor_value_encoders.get(type(value))
+    if encoder is None:
+        return value
+
+    tag, func = encoder
+    return {tag: func(value)}
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+
+    (tag, raw_value), = value.items()
+    return _cursor_value_decoders[tag](raw_value)
+
+
+def encode_cursor(
+        values: List[Any],
+        backwards: bool = False
+) -> str:
+    """
+    Encodes the keyset values of a row into an opaque cursor
+
+    Parameters:
+        values (List[Any]): Values of the ordering columns for the row
+        backwards (bool): Whether the cursor points to the previous page
+
+    Returns:
+        cursor (str): Opaque Cursor
+    """
+    payload = {
+        "v": [_encode_cursor_value(value) for value in values],
+        "b": backwards
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+        cursor: str,
+        size: Optional[int] = None
+) -> Tuple[List[Any], bool]:
+    """
+    Decodes the cursor created by `encode_cursor`
+
+    Parameters:
+        cursor (str): Opaque Cursor
+        size (Optional[int]): Expected number of values
+
+    Returns:
+        decoded_cursor (Tuple[List[Any], bool]): Values and backwards flag
+    """
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [_decode_cursor_value(value) for value in payload["v"]]
+        backwards = bool(payload["b"])
+    except (ValueError, TypeError, KeyError, ArithmeticError):
+        # ArithmeticError: decimal.InvalidOperation of the malformed Decimal
+        values, backwards = None, False
+
+    if values is None or (size is not None and len(values) != size):
+        raise RequestValidationError(errors=[{
+            "loc": ("query", "cursor"),
+            "msg": "Invalid cursor",
+            "type": "value_error"
+        }])
+
+    return values, backwards
 
 
 def prepare_response(
         items: List[Any],
-        total_items: int,
-        pagination_params: PaginationParams
+        total_items: Optional[int],
+        pagination_params: PaginationParams,
+        total_items_exact: bool = True,
+        has_next: Optional[bool] = None,
+        truncated: bool = False
 ) -> Dict[str, Any]:
+    """
+    Prepares the paginated response
+
+    Parameters:
+        items (List[Any]): Page Items
+        total_items (Optional[int]): Total number of items, None when not counted
+        pagination_params (PaginationParams): Pagination Params
+        total_items_exact (bool): False when total_items is an estimate
+            or a lower bound (capped count)
+        has_next (Optional[bool]): Whether the next page exists,
+            derived from total_items when not provided
+        truncated (bool): Whether `get_all` items were cut at the limit
+
+    Returns:
+        response (Dict[str, Any]): Paginated Response
+    """
 
     if pagination_params.get_all:
         current_page = 1
-        items_per_page = total_items
+        items_per_page = total_items if total_items is not None else len(items)
         total_pages = 1
+        has_next = False
     else:
         current_page = pagination_params.page
         items_per_page = pagination_params.size
-        total_pages = ceil(total_items / pagination_params.size)
+        total_pages = None
+
+        if total_items is not None:
+            total_pages = ceil(total_items / pagination_params.size)
+
+        if has_next is None:
+            has_next = (
+                    total_items is not None and
+                    current_page * items_per_page < total_items
+            )
 
     return {
         "items": items,
@@ -25,6 +154,58 @@ def prepare_response(
             "current_page": current_page,
             "items_per_page": items_per_page,
             "total_pages": total_pages,
-            "total_items": total_items
+            "total_items": total_items,
+            "total_items_exact": total_items_exact,
+            "has_next": has_next,
+            "truncated": truncated
+        }
+    }
+
+
+def prepare_get_all_response(
+        items: List[Any],
+        pagination_params: PaginationParams,
+        get_all_limit: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Prepares the `get_all` response, the items are expected to be fetched
+    with one row over the limit, which tells that the result was truncated
+
+    Parameters:
+        items (List[Any]): Items (at most `get_all_limit + 1`)
+        pagination_params (PaginationParams): Pagination Params
+        get_all_limit (Optional[int]): Max number of items, None for no limit
+
+    Returns:
+        response (Dict[str, Any]): Paginated Response
+    """
+    truncated = get_all_limit is not None and len(items) > get_all_limit
+
+    if truncated:
+        items = items[:get_all_limit]
+
+    # The total is a lower bound when the items were truncated
+    return prepare_response(
+        items=items,
+        total_items=len(items),
+        pagination_params=pagination_params,
+        total_items_exact=not truncated,
+        truncated=truncated
+    )
+
+
+def prepare_cursor_response(
+        items: List[Any],
+        pagination_params: CursorPaginationParams,
+        next_cursor: Optional[str],
+        prev_cursor: Optional[str]
+) -> Dict[str, Any]:
+
+    return {
+        "items": items,
+        "meta": {
+            "items_per_page": pagination_params.size,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor
         }
     }
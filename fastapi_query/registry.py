@@ -0,0 +1,71 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type
+)
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from fastapi_query.filtering import BaseFilterParams
+
+# Warms up the (model class, filter class, ordering fields) of a single ORM,
+# returns None for the model classes of the other ORMs, the errors otherwise
+ModelWarmer = Callable[
+    [Any, Optional[Type["BaseFilterParams"]], FrozenSet[str]],
+    Optional[List[str]]
+]
+
+_registry: Dict[Tuple[Optional[Type["BaseFilterParams"]], Any], FrozenSet[str]] = {}
+_item_schemas: Dict[Type[BaseModel], None] = {}
+_model_warmers: List[ModelWarmer] = []
+
+
+def register(
+        filter_class: Optional[Type["BaseFilterParams"]] = None,
+        model_class: Optional[Any] = None,
+        ordering_fields: Optional[Collection[str]] = None,
+        item_schema: Optional[Type[BaseModel]] = None
+) -> None:
+    """
+    Records the filter class (and the model class it is applied to),
+    the ordering fields of the model class and the item schema of the
+    prebuilt responses, so they are compiled by `warmup` at startup.
+    `Filter()` records the classes it is declared with, `apply_filters`
+    and `apply_ordering` the ones they are used with (on the first request),
+    call it at import time to record the others before any request.
+
+    Parameters:
+        filter_class (Optional[Type[BaseFilterParams]]): Filter Params Schema
+        model_class (Optional[Any]): Model Class
+        ordering_fields (Optional[Collection[str]]): Fields / field-paths
+            allowed for ordering the model class
+        item_schema (Optional[Type[BaseModel]]): Item Schema
+            of the prebuilt JSON responses
+    """
+    if filter_class is not None or model_class is not None:
+        key = (filter_class, model_class)
+        ordering_fields = ordering_fields or ()
+        fields = _registry.get(key, frozenset())
+
+        if key not in _registry or not fields.issuperset(ordering_fields):
+            _registry[key] = fields.union(ordering_fields)
+
+    if item_schema is not None:
+        _item_schemas[item_schema] = None
+
+
+def register_model_warmer(warmer: ModelWarmer) -> None:
+    """
+    Registers the function warming up the model classes of an ORM
+    (called by the ext modules)
+    """
+    if warmer not in _model_warmers:
+        _model_warmers.append(warmer)
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Collection, Dict, Any
 
 
 def flatten_dict(
@@ -21,3 +21,29 @@ def flatten_dict(
             res[key] = val
 
     return res
+
+
+def filter_ordering_fields(
+        order_by: str,
+        allowed_fields: Collection[str]
+) -> str:
+    """
+    Removes the fields / field-paths that are not allowed from the order by string
+
+    Parameters:
+        order_by (str): Comma-separated fields / field-paths (with +/- prefix)
+        allowed_fields (Collection[str]): Allowed fields / field-paths
+
+    Returns:
+        order_by (str): Comma-separated allowed fields / field-paths
+    """
+    res = []
+
+    for field in order_by.split(","):
+        field = field.strip()
+        field_name = field[1:] if field.startswith(("-", "+")) else field
+
+        if field_name in allowed_fields:
+            res.append(field)
+
+    return ",".join(res)
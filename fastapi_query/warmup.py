@@ -0,0 +1,262 @@
+from functools import partial
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type
+)
+
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_query._compat import _get_response_validator
+from fastapi_query.filtering.base_params import BaseFilterParams
+from fastapi_query.filtering.utils import (
+    check_sequence_type,
+    flatten_filter_fields,
+    get_filter_fields_info,
+    get_optional_subtype,
+    get_values_packer
+)
+from fastapi_query.pagination.schemas import CursorPaginated, Paginated
+from fastapi_query.registry import (
+    _item_schemas,
+    _model_warmers,
+    _registry,
+    register,
+    register_model_warmer
+)
+
+
+class WarmupReport(NamedTuple):
+    name: str
+    build_time: float
+    errors: Tuple[str, ...]
+
+
+def _get_route_filters(
+        app: FastAPI
+) -> List[Tuple[Type[BaseFilterParams], Any, Any]]:
+    """
+    Returns the filter classes (with the model classes and ordering fields)
+    of the `Filter()` dependencies of the app routes
+    """
+    res = []
+    dependants = [
+        route.dependant  # type: ignore
+        for route in app.routes
+        if hasattr(route, "dependant")
+    ]
+
+    while dependants:
+        dependant = dependants.pop()
+        filter_class = getattr(dependant.call, "filter_class", None)
+
+        if filter_class is not None:
+            res.append((
+                filter_class,
+                getattr(dependant.call, "model_class", None),
+                getattr(dependant.call, "ordering_fields", None)
+            ))
+
+        dependants.extend(dependant.dependencies)
+
+    return res
+
+
+def _check_nested_types(filter_class: Type[BaseFilterParams]) -> List[str]:
+    errors = []
+
+    for field_info in get_filter_fields_info(filter_class):
+        field_type = field_info.field_type
+
+        if field_info.nested_filter_type is not None:
+            errors.extend(_check_nested_types(field_info.nested_filter_type))
+            continue
+
+        if check_sequence_type(field_type):
+            continue
+
+        field_type = get_optional_subtype(field_type) or field_type
+
+        if isinstance(field_type, type) and issubclass(field_type, BaseModel):
+            errors.append(
+                f"{filter_class.__name__}.{field_info.name} - nested filters "
+                f"must subclass BaseFilterParams, got {field_type.__name__}"
+            )
+
+    return errors
+
+
+def _warmup_filter_class(filter_class: Type[BaseFilterParams]) -> List[str]:
+    errors = _check_nested_types(filter_class)
+
+    flatten_filter_fields(filter_class)
+    packer = get_values_packer(filter_class)
+
+    try:
+        # Builds the validators that are built lazily
+        packer({})
+    except RequestValidationError:
+        # Required fields
+        pass
+    except (ValueError, TypeError) as err:
+        errors.append(f"{filter_class.__name__} - {err}")
+
+    return errors
+
+
+def _warmup_model_class(
+        model_class: Any,
+        filter_class: Optional[Type[BaseFilterParams]],
+        ordering_fields: FrozenSet[str]
+) -> List[str]:
+    for warmer in _model_warmers:
+        errors = warmer(model_class, filter_class, ordering_fields)
+
+        if errors is not None:
+            return errors
+
+    return [
+        f"{getattr(model_class, '__name__', model_class)} - unsupported model "
+        "class (the ext module of its ORM is not imported)"
+    ]
+
+
+def _warmup_item_schema(item_schema: Type[BaseModel]) -> None:
+    # The validators of the prebuilt JSON responses
+    for response_class in (Paginated, CursorPaginated):
+        _get_response_validator(response_class[item_schema])
+
+
+def _get_name(
+        filter_class: Optional[Type[BaseFilterParams]],
+        model_class: Optional[Any]
+) -> str:
+    names = [
+        getattr(item, "__name__", str(item))
+        for item in (filter_class, model_class)
+        if item is not None
+    ]
+
+    return " -> ".join(names)
+
+
+def _measure(name: str, func: Callable[[], Optional[List[str]]]) -> WarmupReport:
+    start = perf_counter()
+
+    try:
+        errors = func() or []
+    except Exception as err:  # noqa: BLE001
+        errors = [f"{name} - {err}"]
+
+    return WarmupReport(
+        name=name,
+        build_time=perf_counter() - start,
+        errors=tuple(errors)
+    )
+
+
+def warmup_sync(
+        app: Optional[FastAPI] = None,
+        raise_errors: bool = True
+) -> List[WarmupReport]:
+    """
+    Compiles the registered filter classes (filter plans and packers),
+    ordering maps and response validators, so the first requests don't
+    pay the compilation costs, and checks the filter classes against
+    the models they are applied to
+
+    Parameters:
+        app (Optional[FastAPI]): Application, the filter classes
+            of its `Filter()` dependencies are compiled too
+        raise_errors (bool): Raise ValueError when any of the classes is invalid
+
+    Returns:
+        reports (List[WarmupReport]): Build Time and Errors per class
+    """
+    if app is not None:
+        for filter_class, model_class, ordering_fields in _get_route_filters(app):
+            register(
+                filter_class=filter_class,
+                model_class=model_class,
+                ordering_fields=ordering_fields
+            )
+
+    reports = []
+    filter_classes = {
+        filter_class: None
+        for filter_class, _ in list(_registry)
+        if filter_class is not None
+    }
+
+    for filter_class in filter_classes:
+        reports.append(_measure(
+            name=_get_name(filter_class, None),
+            func=partial(_warmup_filter_class, filter_class)
+        ))
+
+    for (model_filter_class, model_class), ordering_fields in list(_registry.items()):
+        if model_class is None:
+            continue
+
+        reports.append(_measure(
+            name=_get_name(model_filter_class, model_class),
+            func=partial(
+                _warmup_model_class,
+                model_class,
+                model_filter_class,
+                ordering_fields
+            )
+        ))
+
+    for item_schema in list(_item_schemas):
+        reports.append(_measure(
+            name=item_schema.__name__,
+            func=partial(_warmup_item_schema, item_schema)
+        ))
+
+    errors = [error for report in reports for error in report.errors]
+
+    if raise_errors and errors:
+        raise ValueError("Invalid filter classes:\n" + "\n".join(errors))
+
+    return reports
+
+
+async def warmup(
+        app: Optional[FastAPI] = None,
+        raise_errors: bool = True
+) -> List[WarmupReport]:
+    """
+    `warmup_sync` run in the threadpool, to be awaited in the app lifespan
+
+    Parameters:
+        app (Optional[FastAPI]): Application, the filter classes
+            of its `Filter()` dependencies are compiled too
+        raise_errors (bool): Raise ValueError when any of the classes is invalid
+
+    Returns:
+        reports (List[WarmupReport]): Build Time and Errors per class
+    """
+    return await run_in_threadpool(
+        warmup_sync,
+        app=app,
+        raise_errors=raise_errors
+    )
+
+
+__all__ = [
+    "WarmupReport",
+    "register",
+    "register_model_warmer",
+    "warmup",
+    "warmup_sync"
+]
@@ -0,0 +1,109 @@
+from unittest import mock
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, selectinload, joinedload
+
+from fastapi_query.ext.sqlalchemy import (
+    apply_filters,
+    apply_ordering,
+    get_count_statement
+)
+from fastapi_query.ext.sqlalchemy.counting import get_count_cache_key
+from fastapi_query.pagination import CountCache, CountStrategy
+from .examples.models import (
+    Product,
+    Order,
+    OrderItem
+)
+from .examples.schemas import ProductFilters
+
+
+def _normalize(stmt) -> str:
+    return " ".join(str(stmt).split())
+
+
+def test_count_without_ordering_and_options(db: Session) -> None:
+    """ Test Counting - Ordering and Loader Options are dropped"""
+    stmt = select(
+        Order
+    ).options(
+        joinedload(Order.shipping_address),
+        selectinload(Order.items).joinedload(OrderItem.product)
+    ).where(
+        Order.deleted_at.is_(None)
+    )
+
+    stmt = apply_ordering(
+        model_class=Order,
+        stmt=stmt,
+        order_by="-total_amount"
+    )
+
+    count_stmt = get_count_statement(stmt)
+
+    assert _normalize(count_stmt) == (
+        "SELECT count(*) AS count_1 FROM orders WHERE orders.deleted_at IS NULL"
+    )
+    assert db.scalar(count_stmt) == 4
+
+
+def test_count_distinct_with_fan_out_join(db: Session) -> None:
+    """ Test Counting - count(DISTINCT pk) for to-many joins only"""
+    many_stmt = select(Order).join(Order.items)
+    one_stmt = select(Order).join(Order.shipping_address)
+
+    assert "count(DISTINCT orders.id)" in _normalize(get_count_statement(many_stmt))
+    assert "count(*)" in _normalize(get_count_statement(one_stmt))
+
+    assert db.scalar(get_count_statement(many_stmt)) == 4
+    assert db.scalar(get_count_statement(one_stmt)) == 4
+
+
+def test_capped_count(db: Session) -> None:
+    """ Test Counting - Capped Count"""
+    stmt = apply_filters(
+        model_class=Product,
+        stmt=select(Product),
+        filters=ProductFilters(price__gt=1000)
+    )
+
+    count_stmt = get_count_statement(stmt, count_cap=2)
+
+    assert "LIMIT" in _normalize(count_stmt)
+    assert db.scalar(count_stmt) == 3
+
+
+def test_count_with_limit_keeps_subquery(db: Session) -> None:
+    """ Test Counting - Statement with limit is counted as a subquery"""
+    stmt = select(Product).order_by(Product.price).limit(2)
+
+    count_stmt = get_count_statement(stmt)
+
+    assert "ORDER BY" in _normalize(count_stmt)
+    assert db.scalar(count_stmt) == 2
+
+
+def test_count_cache_key_compiled_once(db: Session) -> None:
+    """ Test Counting - the cache key SQL is compiled once per statement shape"""
+    count_cache = CountCache()
+    dialect = db.get_bind().dialect
+
+    def get_key(price: int, order_by: str) -> str:
+        stmt = apply_filters(
+            model_class=Product,
+            stmt=select(Product),
+            filters=ProductFilters(price__gt=price)
+        )
+
+        return get_count_cache_key(
+            count_cache=count_cache,
+            stmt=apply_ordering(model_class=Product, stmt=stmt, order_by=order_by),
+            count_strategy=CountStrategy.EXACT,
+            dialect=dialect
+        )
+
+    key = get_key(price=1000, order_by="name")
+
+    with mock.patch.object(Select, "compile", side_effect=AssertionError):
+        assert get_key(price=1000, order_by="-price") == key
+        assert get_key(price=2000, order_by="name") != key
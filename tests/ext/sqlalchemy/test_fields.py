@@ -0,0 +1,85 @@
+import pytest
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from fastapi_query.ext.sqlalchemy import apply_fields, paginate, paginate_async
+from fastapi_query.fields import FieldsParams, project_items
+from fastapi_query.pagination import PaginationParams
+from .examples.models import (
+    Order,
+    Product
+)
+
+
+def test_load_only(db: Session) -> None:
+    """ Test Fields - only the selected columns are loaded """
+    stmt, tree = apply_fields(
+        model_class=Product,
+        stmt=select(Product),
+        fields_params=FieldsParams(fields="name,categories__name")
+    )
+
+    items = db.scalars(stmt).all()
+
+    assert items
+    assert "price" in inspect(items[0]).unloaded
+    assert "name" not in inspect(items[0]).unloaded
+
+    res = project_items(items=items, tree=tree)
+
+    assert set(res[0].keys()) == {"name", "categories"}
+    assert all(
+        set(category.keys()) == {"name"}
+        for item in res
+        for category in item["categories"]
+    )
+
+
+def test_nested_fields(db: Session) -> None:
+    """ Test Fields - nested relationships, expanded relationships """
+    res = paginate(
+        db=db,
+        stmt=select(Order),
+        model_class=Order,
+        pagination_params=PaginationParams(),
+        fields_params=FieldsParams(
+            fields="total_amount,items__qty,items__product__name,shipping_address"
+        )
+    )
+
+    item = res["items"][0]
+
+    assert set(item.keys()) == {"total_amount", "items", "shipping_address"}
+    assert set(item["items"][0].keys()) == {"qty", "product"}
+    assert set(item["items"][0]["product"].keys()) == {"name"}
+    assert "city" in item["shipping_address"]
+
+
+@pytest.mark.parametrize(
+    "fields",
+    ["unknown", "name__unknown", "categories__unknown", "price__id"]
+)
+def test_invalid_fields(fields: str) -> None:
+    with pytest.raises(RequestValidationError):
+        apply_fields(
+            model_class=Product,
+            stmt=select(Product),
+            fields_params=FieldsParams(fields=fields)
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_fields(async_db: AsyncSession) -> None:
+    """ Test Fields - relationships are eagerly loaded for the async session """
+    res = await paginate_async(
+        db=async_db,
+        stmt=select(Product),
+        model_class=Product,
+        pagination_params=PaginationParams(get_all=True),
+        fields_params=FieldsParams(fields="id,categories__name")
+    )
+
+    assert res["items"]
+    assert set(res["items"][0].keys()) == {"id", "categories"}
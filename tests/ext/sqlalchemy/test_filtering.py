@@ -1,8 +1,29 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload, joinedload
+from datetime import datetime
+from enum import Enum
+from typing import Any, Generator, List, Optional
+
+import pytest
+from sqlalchemy import Enum as SAEnum, create_engine, select, text, Engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    joinedload,
+    mapped_column,
+    selectinload
+)
 
-from fastapi_query.ext.sqlalchemy import apply_filters
-from fastapi_query.filtering import BaseFilterParams
+from fastapi_query.ext.sqlalchemy import (
+    apply_filters,
+    compile_filters,
+    track_statement_cache
+)
+from fastapi_query.filtering import (
+    BaseFilterParams,
+    RelationshipFilterStrategy,
+    SearchMode
+)
 from .examples.models import (
     Product,
     Order,
@@ -12,8 +33,10 @@ from .examples.models import (
 from .examples.schemas import (
     ProductFilters,
     OrderFilters,
+    OrderItemFilters,
     AddressNestedFilters,
-    CategoryFilters
+    CategoryFilters,
+    CategoryNestedFilters
 )
 
 
@@ -326,3 +349,509 @@ def test_no_filters(db: Session) -> None:
     )
 
     assert stmt_before == stmt_after
+
+
+def test_compiled_filters_are_cached(db: Session) -> None:
+    """ Test Filtering - Compiled Filter Plan is reused"""
+    filter_plan = compile_filters(
+        model_class=Order,
+        filter_class=OrderFilters
+    )
+
+    assert filter_plan is compile_filters(
+        model_class=Order,
+        filter_class=OrderFilters
+    )
+
+    filter_params = OrderFilters(
+        shipping_address=AddressNestedFilters(
+            zip_code="90123"
+        ),
+        total_amount__gt=5000
+    )
+
+    stmt = apply_filters(
+        model_class=Order,
+        stmt=select(Order),
+        filters=filter_params
+    )
+
+    res = db.scalars(stmt).all()
+
+    assert len(res) == 3
+
+
+def test_named_params(engine: Engine, db: Session) -> None:
+    """ Test Filtering - Named Params reuse the compiled statement"""
+    with track_statement_cache(engine) as stats:
+        for name, price in (("pan", 3000), ("car", 60000)):
+            stmt = apply_filters(
+                model_class=Product,
+                stmt=select(Product),
+                filters=ProductFilters(
+                    search=name,
+                    price__lt=price,
+                    categories=CategoryNestedFilters(id__in="1,6,7")
+                ),
+                named_params=True
+            )
+
+            assert ":fq_price__lt" in str(stmt)
+            assert "fq_categories__id__in" in str(stmt)
+
+            res = db.scalars(stmt).all()
+
+            assert len(res) == 1
+
+    assert stats.misses == 1
+    assert stats.hits == 1
+
+
+@pytest.mark.parametrize(
+    "model_class,filter_params",
+    [
+        (Product, ProductFilters(categories=CategoryNestedFilters(id__in="1,2"))),
+        (Product, ProductFilters(search="kit", price__gt=1000)),
+        (Order, OrderFilters(items=OrderItemFilters(qty=1))),
+        (Order, OrderFilters(search="west")),
+        (Order, OrderFilters(shipping_address=AddressNestedFilters(city="San Diego"))),
+    ]
+)
+@pytest.mark.parametrize(
+    "relationship_strategy,sql_fragment",
+    [
+        (RelationshipFilterStrategy.IN, "IN (SELECT"),
+        # The to-many relationships are semi-joined by the JOIN strategy
+        (RelationshipFilterStrategy.JOIN, None),
+    ]
+)
+def test_relationship_strategies(
+        db: Session,
+        model_class: Any,
+        filter_params: BaseFilterParams,
+        relationship_strategy: RelationshipFilterStrategy,
+        sql_fragment: Optional[str]
+) -> None:
+    """ Test Filtering - Relationship strategies match EXISTS"""
+    stmt = select(model_class).where(model_class.deleted_at.is_(None))
+
+    expected = db.scalars(apply_filters(
+        model_class=model_class,
+        stmt=stmt,
+        filters=filter_params
+    )).all()
+
+    strategy_stmt = apply_filters(
+        model_class=model_class,
+        stmt=stmt,
+        filters=filter_params,
+        relationship_strategy=relationship_strategy
+    )
+    res = db.scalars(strategy_stmt).all()
+
+    assert expected
+    assert sql_fragment is None or sql_fragment in str(strategy_stmt)
+    assert "EXISTS" not in str(strategy_stmt)
+    assert "DISTINCT" not in str(strategy_stmt)
+    assert sorted(item.id for item in res) == sorted(item.id for item in expected)
+
+
+def test_relationship_strategy_from_settings(db: Session) -> None:
+    """ Test Filtering - Relationship strategy from the filter class Settings"""
+
+    class ProductJoinFilters(ProductFilters):
+        class Settings(ProductFilters.Settings):
+            relationship_strategy = RelationshipFilterStrategy.JOIN
+
+    stmt = apply_filters(
+        model_class=Product,
+        stmt=select(Product),
+        filters=ProductJoinFilters(
+            search="kit",
+            categories=CategoryNestedFilters(id__in="1,2")
+        )
+    )
+    sql = str(stmt)
+
+    # The to-many categories are semi-joined (the filters and the search)
+    assert sql.count("products.id IN (SELECT") == 2
+    assert "EXISTS" not in sql
+    assert "DISTINCT" not in sql
+    assert len(db.scalars(stmt).all()) == len(set(db.scalars(stmt).all()))
+
+
+def test_join_strategy_to_one(db: Session) -> None:
+    """ Test Filtering - JOIN strategy joins the to-one relationships only"""
+    stmt = apply_filters(
+        model_class=Order,
+        stmt=select(Order).order_by(Order.total_amount),
+        filters=OrderFilters(
+            shipping_address=AddressNestedFilters(city="San Diego"),
+            items=OrderItemFilters(qty=1)
+        ),
+        relationship_strategy=RelationshipFilterStrategy.JOIN
+    )
+    sql = str(stmt)
+
+    assert "JOIN addresses" in sql
+    assert "order_items" in sql.split("WHERE")[1]
+    assert "DISTINCT" not in sql
+    assert len(db.scalars(stmt).all()) == len(set(db.scalars(stmt).all()))
+
+
+class OrderPathFilters(OrderFilters):
+    shipping_address__city: Optional[str] = None
+    items__qty: Optional[int] = None
+    items__qty__gte: Optional[int] = None
+    items__product__name__icontains: Optional[str] = None
+
+
+def test_relationship_path_filters(db: Session) -> None:
+    """ Test Filtering - Predicates on the same relationship are merged"""
+    filter_params = OrderPathFilters(
+        shipping_address__city="San Diego",
+        shipping_address=AddressNestedFilters(zip_code="90123"),
+        items__qty__gte=2,
+        items__product__name__icontains="a",
+        items=OrderItemFilters(product_id=1)
+    )
+
+    stmt = apply_filters(
+        model_class=Order,
+        stmt=select(Order),
+        filters=filter_params
+    )
+    sql = str(stmt)
+
+    # shipping_address, items and items.product are probed once each
+    assert sql.count("EXISTS") == 3
+    assert sql.count("FROM addresses") == 1
+    assert sql.count("FROM order_items") == 1
+
+    res = db.scalars(stmt).all()
+    expected = [
+        order for order in db.scalars(
+            select(Order).options(
+                joinedload(Order.shipping_address),
+                selectinload(Order.items).joinedload(OrderItem.product)
+            )
+        ).unique().all()
+        if order.shipping_address.city == "San Diego" and
+        order.shipping_address.zip_code == "90123" and
+        any(
+            item.qty >= 2 and item.product_id == 1 and "a" in item.product.name.lower()
+            for item in order.items
+        )
+    ]
+
+    assert sorted(order.id for order in res) == sorted(order.id for order in expected)
+
+
+def test_relationship_path_filters_named_params(db: Session) -> None:
+    """ Test Filtering - Merged probe of the flat path and nested filters"""
+    filter_params = OrderPathFilters(
+        items=OrderItemFilters(qty=1, product_id=2),
+        items__qty=1,
+        items__product__name__icontains="a"
+    )
+
+    stmt = apply_filters(
+        model_class=Order,
+        stmt=select(Order),
+        filters=filter_params,
+        named_params=True
+    )
+    sql = str(stmt)
+
+    # items and items.product are probed once each
+    assert sql.count("EXISTS") == 2
+    assert sql.count("FROM order_items") == 1
+
+    params = stmt.compile().params
+
+    assert params["fq_items__qty"] == params["fq_items__qty_2"] == 1
+    assert params["fq_items__product_id"] == 2
+
+    res = db.scalars(stmt).all()
+    expected = db.scalars(apply_filters(
+        model_class=Order,
+        stmt=select(Order),
+        filters=filter_params
+    )).all()
+
+    assert res
+    assert sorted(order.id for order in res) == sorted(order.id for order in expected)
+
+
+def test_named_params_flat_and_nested_field(db: Session) -> None:
+    """ Test Filtering - Flat path and nested filters bound to distinct params"""
+    stmt = apply_filters(
+        model_class=Order,
+        stmt=select(Order),
+        filters=OrderPathFilters(
+            items=OrderItemFilters(qty=1),
+            items__qty=2
+        ),
+        named_params=True
+    )
+    params = stmt.compile().params
+
+    assert params["fq_items__qty"] == 1
+    assert params["fq_items__qty_2"] == 2
+    # The predicates apply to the same item, none has both quantities
+    assert db.scalars(stmt).all() == []
+
+
+def test_invalid_relationship_path() -> None:
+    """ Test Filtering - Invalid relationship path"""
+
+    class InvalidPathFilters(OrderFilters):
+        shipping_address__unknown: Optional[str] = None
+
+    with pytest.raises(ValueError):
+        apply_filters(
+            model_class=Order,
+            stmt=select(Order),
+            filters=InvalidPathFilters(shipping_address__unknown="x")
+        )
+
+
+class ProductFullTextFilters(ProductFilters):
+    class Settings(ProductFilters.Settings):
+        search_mode = SearchMode.FULL_TEXT
+        search_vector_fields = {"categories": "name"}
+        search_fts_tables = {"": "products_fts"}
+
+
+@pytest.fixture(scope="function")
+def products_fts(engine: Engine) -> Generator[None, None, None]:
+    """ Creates the FTS5 table of the products, dropped after the test """
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE products_fts "
+            "USING fts5(name, content='products', content_rowid='id')"
+        ))
+        conn.execute(text(
+            "INSERT INTO products_fts(products_fts) VALUES('rebuild')"
+        ))
+
+    yield
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE products_fts"))
+
+
+def test_full_text_search_sqlite(
+        engine: Engine,
+        db: Session,
+        products_fts: None
+) -> None:
+    """ Test Filtering - Full-text search with the FTS5 table"""
+    with track_statement_cache(engine) as stats:
+        for search, expected in (
+                ("machine washing", ["Car Washing Machine", "Washing Machine"]),
+                ("car", ["Car Washing Machine"]),
+                ("wash", []),
+        ):
+            stmt = apply_filters(
+                model_class=Product,
+                stmt=select(Product),
+                filters=ProductFullTextFilters(search=search),
+                named_params=True
+            )
+            sql = str(stmt.compile(dialect=engine.dialect))
+
+            assert "products_fts MATCH" in sql
+            # No FTS5 table for categories, so the categories fall back to ilike
+            assert "lower(categories.name) LIKE lower(" in sql
+
+            res = db.scalars(stmt).all()
+
+            assert sorted(product.name for product in res) == expected
+
+    assert stats.misses == 1
+    assert stats.hits == 2
+
+
+def test_full_text_search_postgresql() -> None:
+    """ Test Filtering - Full-text search compiled for PostgreSQL"""
+    stmt = apply_filters(
+        model_class=Product,
+        stmt=select(Product),
+        filters=ProductFullTextFilters(search="washing machine")
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert (
+        "to_tsvector('simple'::regconfig, products.name) @@ "
+        "plainto_tsquery('simple'::regconfig, "
+    ) in sql
+    # Precomputed tsvector column (name stands in for it)
+    assert "categories.name @@ plainto_tsquery('simple'::regconfig, " in sql
+    assert "ILIKE" not in sql
+
+
+def test_full_text_search_without_words(db: Session) -> None:
+    """ Test Filtering - Full-text search falls back to ilike"""
+    stmt = apply_filters(
+        model_class=Product,
+        stmt=select(Product),
+        filters=ProductFullTextFilters(search="-")
+    )
+
+    assert "MATCH" not in str(stmt)
+    assert db.scalars(stmt).all() == []
+
+
+class ProductNameFilters(ProductFilters):
+    name__startswith: Optional[str] = None
+    name__istartswith: Optional[str] = None
+    name__contains: Optional[str] = None
+    name__iexact: Optional[str] = None
+
+
+class ProductNameRangeFilters(ProductNameFilters):
+    class Settings(ProductNameFilters.Settings):
+        startswith_as_range = True
+
+
+@pytest.mark.parametrize(
+    "filter_params,expected",
+    [
+        (ProductNameFilters(name__contains="%"), []),
+        (ProductNameFilters(name__iexact="toast_r"), []),
+        (ProductNameFilters(name__iexact="toaster"), ["Toaster"]),
+        (ProductNameFilters(search="_"), []),
+        (ProductNameFilters(name__startswith="Wash"), ["Washing Machine"]),
+        (ProductNameRangeFilters(name__startswith="Wash"), ["Washing Machine"]),
+        (ProductNameRangeFilters(name__startswith="wash"), []),
+        (ProductNameRangeFilters(name__istartswith="wASH"), ["Washing Machine"]),
+        (ProductNameRangeFilters(name__istartswith="t"), ["Table Soccer", "Toaster"]),
+    ]
+)
+def test_like_patterns_and_prefix_ranges(
+        db: Session,
+        filter_params: BaseFilterParams,
+        expected: List[str]
+) -> None:
+    """ Test Filtering - Escaped LIKE patterns and prefix ranges"""
+    stmt = apply_filters(
+        model_class=Product,
+        stmt=select(Product),
+        filters=filter_params
+    )
+
+    res = db.scalars(stmt).all()
+
+    assert sorted(product.name for product in res) == expected
+
+
+def test_prefix_range_criteria() -> None:
+    """ Test Filtering - startswith compiled as the range predicate"""
+    stmt = apply_filters(
+        model_class=Product,
+        stmt=select(Product),
+        filters=ProductNameRangeFilters(name__startswith="ab", name__istartswith="Cd"),
+        named_params=True
+    )
+    sql = str(stmt)
+
+    assert "LIKE" not in sql
+    assert "products.name >= :fq_name__startswith__lower" in sql
+    assert "products.name < :fq_name__startswith__upper" in sql
+    assert "lower(products.name) >= :fq_name__istartswith__lower" in sql
+    assert stmt.compile().params["fq_name__istartswith__upper"] == "ce"
+
+
+def test_large_in_list(engine: Engine, db: Session) -> None:
+    """ Test Filtering - IN list bound to a single parameter"""
+    with track_statement_cache(engine) as stats:
+        for ids in ("1,2", ",".join(map(str, range(1, 1000)))):
+            stmt = apply_filters(
+                model_class=Product,
+                stmt=select(Product),
+                filters=ProductFilters(
+                    categories=CategoryNestedFilters(id__in=ids, id__not_in="2")
+                ),
+                named_params=True
+            )
+            sql = str(stmt.compile(dialect=engine.dialect))
+
+            assert sql.count("json_each(?)") == 2
+
+            res = db.scalars(stmt).all()
+
+            assert res
+
+    assert stats.misses == 1
+    assert stats.hits == 1
+
+    pg_sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "categories.id = ANY (" in pg_sql
+    assert "categories.id != ALL (" in pg_sql
+
+
+def test_in_list_with_non_json_values(db: Session) -> None:
+    """ Test Filtering - IN list of values that are not JSON-safe"""
+
+    class OrderDateFilters(BaseFilterParams):
+        created_at__in: Optional[List[datetime]] = None
+
+    filter_params = OrderDateFilters(
+        created_at__in="2024-01-01T10:00:00,2024-01-02T10:00:00"
+    )
+    stmt = apply_filters(
+        model_class=Order,
+        stmt=select(Order),
+        filters=filter_params
+    )
+    expected = db.scalars(
+        select(Order).where(Order.created_at.in_(filter_params.created_at__in))
+    ).all()
+
+    assert "json_each" not in str(stmt.compile(dialect=db.get_bind().dialect))
+    assert db.scalars(stmt).all() == expected
+
+
+def test_in_list_with_enum_column() -> None:
+    """ Test Filtering - IN list on the Enum column (bound by name)"""
+
+    class Color(str, Enum):
+        RED = "red"
+        GREEN = "green"
+
+    class EnumBase(DeclarativeBase):
+        pass
+
+    class Item(EnumBase):
+        __tablename__ = "items"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        color: Mapped[Color] = mapped_column(SAEnum(Color))
+
+    class ItemFilters(BaseFilterParams):
+        color__in: Optional[List[Color]] = None
+        color__not_in: Optional[List[Color]] = None
+
+    engine = create_engine("sqlite://")
+    EnumBase.metadata.create_all(bind=engine)
+
+    with Session(engine) as db:
+        db.add_all([Item(id=1, color=Color.RED), Item(id=2, color=Color.GREEN)])
+        db.commit()
+
+        for filter_params, expected in (
+                (ItemFilters(color__in="red"), [1]),
+                (ItemFilters(color__not_in="red"), [2]),
+        ):
+            stmt = apply_filters(
+                model_class=Item,
+                stmt=select(Item.id),
+                filters=filter_params
+            )
+
+            assert "json_each" not in str(stmt.compile(dialect=engine.dialect))
+            assert "ANY" not in str(stmt.compile(dialect=postgresql.dialect()))
+            assert db.scalars(stmt).all() == expected
+
+    engine.dispose()
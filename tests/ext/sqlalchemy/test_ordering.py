@@ -1,10 +1,23 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session, contains_eager
+from typing import Optional
+
+from sqlalchemy import ForeignKey, create_engine, func, select
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    aliased,
+    contains_eager,
+    mapped_column,
+    relationship
+)
 
 from fastapi_query.ext.sqlalchemy import apply_ordering
+from fastapi_query.ext.sqlalchemy.ordering import _resolve_ordering_terms
 from .examples.models import (
     Category,
-    Order
+    Order,
+    OrderItem,
+    Product
 )
 
 
@@ -160,3 +173,189 @@ def test_nested_invalid_field(db: Session) -> None:
 
     for i in range(len(res) - 1):
         assert res[i].name >= res[i + 1].name
+
+
+def test_allowed_fields() -> None:
+    """ Test Ordering - the fields that are not allowed are ignored """
+    stmt = apply_ordering(
+        model_class=Category,
+        stmt=select(Category),
+        order_by="-name,created_at,id",
+        allowed_fields={"name", "id"}
+    )
+
+    assert [str(clause) for clause in stmt._order_by_clauses] == [
+        "categories.name DESC",
+        "categories.id"
+    ]
+
+
+def test_cached_resolution() -> None:
+    """ Test Ordering - the resolved criteria are cached """
+    _resolve_ordering_terms.cache_clear()
+
+    for _ in range(3):
+        apply_ordering(
+            model_class=Order,
+            stmt=select(Order),
+            order_by="-shipping_address__address_line,id"
+        )
+
+    cache_info = _resolve_ordering_terms.cache_info()
+
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
+def test_nested_auto_join(db: Session) -> None:
+    """ Test Ordering - the to-one relationships are joined automatically"""
+    stmt = apply_ordering(
+        model_class=OrderItem,
+        stmt=select(OrderItem),
+        order_by="-product__name,id"
+    )
+
+    assert str(stmt).count("JOIN products") == 1
+
+    res = db.scalars(stmt).all()
+
+    assert len(res) == db.scalar(select(func.count(OrderItem.id)))
+
+    for i in range(len(res) - 1):
+        assert res[i].product.name >= res[i + 1].product.name
+
+
+def test_nested_existing_join(db: Session) -> None:
+    """ Test Ordering - the already joined relationships are not joined again"""
+    stmt = apply_ordering(
+        model_class=Order,
+        stmt=select(Order).join(Order.shipping_address),
+        order_by="shipping_address__address_line"
+    )
+
+    assert str(stmt).count("JOIN addresses") == 1
+    assert "LEFT OUTER JOIN" not in str(stmt)
+
+
+def test_to_many_aggregate(db: Session) -> None:
+    """ Test Ordering - the to-many paths are ordered by an aggregate"""
+    stmt = apply_ordering(
+        model_class=Order,
+        stmt=select(Order).where(Order.deleted_at.is_(None)),
+        order_by="-items__qty,id"
+    )
+
+    assert "JOIN" not in str(stmt).split("ORDER BY")[0]
+
+    res = db.scalars(stmt).all()
+
+    assert len(res) == db.scalar(
+        select(func.count(Order.id)).where(Order.deleted_at.is_(None))
+    )
+
+    max_qty = [
+        max((item.qty for item in order.items), default=None)
+        for order in res
+    ]
+    non_null = [qty for qty in max_qty if qty is not None]
+
+    assert non_null == sorted(non_null, reverse=True)
+
+
+def test_many_to_many_aggregate(db: Session) -> None:
+    """ Test Ordering - the many-to-many paths are ordered by an aggregate"""
+    stmt = apply_ordering(
+        model_class=Product,
+        stmt=select(Product),
+        order_by="categories__name"
+    )
+
+    res = db.scalars(stmt).all()
+
+    assert len(res) == db.scalar(select(func.count(Product.id)))
+
+    min_names = [
+        min(category.name for category in product.categories)
+        for product in res
+        if product.categories
+    ]
+
+    assert min_names == sorted(min_names)
+
+
+class _PostsBase(DeclarativeBase):
+    pass
+
+
+class _User(_PostsBase):
+    __tablename__ = "users"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class _Post(_PostsBase):
+    __tablename__ = "posts"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    author_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    editor_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"))
+
+    author: Mapped[_User] = relationship(foreign_keys=[author_id])
+    editor: Mapped[Optional[_User]] = relationship(foreign_keys=[editor_id])
+
+
+def test_nested_same_target_table() -> None:
+    """ Test Ordering - two relationships to the same table are joined apart"""
+    engine = create_engine("sqlite://")
+    _PostsBase.metadata.create_all(bind=engine)
+
+    with Session(engine) as db:
+        db.add_all([
+            _User(id=1, name="a"),
+            _User(id=2, name="b"),
+            _User(id=3, name="c"),
+            _Post(id=1, author_id=1, editor_id=2),
+            _Post(id=2, author_id=1, editor_id=3),
+            _Post(id=3, author_id=3, editor_id=1),
+        ])
+        db.commit()
+
+        stmt = apply_ordering(
+            model_class=_Post,
+            stmt=select(_Post.id),
+            order_by="author__name,-editor__name"
+        )
+
+        assert str(stmt).count("JOIN users") == 2
+        assert db.scalars(stmt).all() == [2, 1, 3]
+
+        # Joined through the other relationship, the target is aliased
+        stmt = apply_ordering(
+            model_class=_Post,
+            stmt=select(_Post.id).join(_Post.author),
+            order_by="-editor__name"
+        )
+
+        assert str(stmt).count("JOIN users") == 2
+        assert db.scalars(stmt).all() == [2, 1, 3]
+
+        # Joined through the relationship ON clause, not joined again
+        stmt = apply_ordering(
+            model_class=_Post,
+            stmt=select(_Post.id).join(_User, _Post.editor_id == _User.id),
+            order_by="-editor__name,id"
+        )
+
+        assert str(stmt).count("JOIN users") == 1
+        assert db.scalars(stmt).all() == [2, 1, 3]
+
+        # Joined aliased by the caller, the relationship is joined
+        editor = aliased(_User)
+        stmt = apply_ordering(
+            model_class=_Post,
+            stmt=select(_Post.id).join(_Post.editor.of_type(editor)),
+            order_by="author__name,id"
+        )
+
+        assert db.scalars(stmt).all() == [1, 2, 3]
+
+    engine.dispose()
@@ -1,16 +1,41 @@
-import pytest
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+import json
+from datetime import datetime
+from typing import Generator, Optional
+from unittest import mock
 
-from fastapi_query.ext.sqlalchemy import paginate, paginate_async
-from fastapi_query.pagination import PaginationParams
+import pytest
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy import event, func, select, text, update, Engine
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import Session, selectinload
+
+from fastapi_query._compat import _model_dump_json, _validate_from_attributes
+from fastapi_query.ext.sqlalchemy import (
+    apply_filters,
+    paginate,
+    paginate_async,
+    stream,
+    stream_async,
+    track_statement_cache
+)
+from fastapi_query.fields import FieldsParams
+from fastapi_query.filtering import RelationshipFilterStrategy
+from fastapi_query.pagination import (
+    CountCache,
+    PaginationParams,
+    CursorPaginationParams,
+    CountStrategy,
+    ResultMode
+)
 from .examples.models import (
     Product,
     Category
 )
 from .examples.schemas import (
-    ProductFilters
+    CategoryNestedFilters,
+    CategoryOut,
+    ProductFilters,
+    ProductOut
 )
 
 
@@ -73,6 +98,31 @@ def test_basic_category_with_get_all(db: Session) -> None:
     assert meta["items_per_page"] == meta["total_items"]
     assert meta["total_pages"] == 1
     assert len(items) == meta["total_items"]
+    assert meta["truncated"] is False
+
+
+@pytest.mark.parametrize("get_all_limit,truncated", [(3, True), (7, False)])
+def test_get_all_limit(
+        db: Session,
+        get_all_limit: int,
+        truncated: bool
+) -> None:
+    """ Test Pagination - get_all is capped and fetched in chunks """
+
+    res = paginate(
+        db=db,
+        stmt=select(Category).where(Category.deleted_at.is_(None)),
+        pagination_params=PaginationParams(get_all=True),
+        get_all_limit=get_all_limit,
+        get_all_chunk_size=2
+    )
+
+    meta = res["meta"]
+
+    assert len(res["items"]) == get_all_limit
+    assert meta["total_items"] == get_all_limit
+    assert meta["total_items_exact"] is not truncated
+    assert meta["truncated"] is truncated
 
 
 def test_product_with_filters(db: Session) -> None:
@@ -246,6 +296,22 @@ async def test_async_basic_with_get_all(async_db: AsyncSession) -> None:
     assert len(items) == meta["total_items"]
 
 
+@pytest.mark.asyncio
+async def test_async_get_all_limit(async_db: AsyncSession) -> None:
+    """ Test Async Pagination - get_all is capped and fetched in chunks """
+
+    res = await paginate_async(
+        db=async_db,
+        stmt=select(Category).where(Category.deleted_at.is_(None)),
+        pagination_params=PaginationParams(get_all=True),
+        get_all_limit=3,
+        get_all_chunk_size=2
+    )
+
+    assert len(res["items"]) == 3
+    assert res["meta"]["truncated"] is True
+
+
 @pytest.mark.asyncio
 async def test_async_with_filters(async_db: AsyncSession) -> None:
     """ Test Async Pagination - Basic with filters"""
@@ -355,3 +421,723 @@ async def test_async_with_missing_model_class(async_db: AsyncSession) -> None:
         exception_occurred = True
 
     assert exception_occurred
+
+
+def test_cursor_pagination(db: Session) -> None:
+    """ Test Pagination - Cursor Pagination with ordering"""
+    stmt = select(
+        Product
+    ).where(
+        Product.deleted_at.is_(None)
+    )
+
+    pages = []
+    cursor = None
+
+    while True:
+        res = paginate(
+            db=db,
+            stmt=stmt,
+            model_class=Product,
+            pagination_params=CursorPaginationParams(size=4, cursor=cursor),
+            ordering_params="-price"
+        )
+        pages.append(res)
+        cursor = res["meta"]["next_cursor"]
+
+        if cursor is None:
+            break
+
+    items = [item for page in pages for item in page["items"]]
+
+    assert [len(page["items"]) for page in pages] == [4, 2]
+    assert pages[0]["meta"]["prev_cursor"] is None
+    assert [item.price for item in items] == sorted(
+        [item.price for item in items],
+        reverse=True
+    )
+
+    res = paginate(
+        db=db,
+        stmt=stmt,
+        model_class=Product,
+        pagination_params=CursorPaginationParams(
+            size=4,
+            cursor=pages[-1]["meta"]["prev_cursor"]
+        ),
+        ordering_params="-price"
+    )
+
+    assert [item.id for item in res["items"]] == [
+        item.id for item in pages[0]["items"]
+    ]
+    assert res["meta"]["prev_cursor"] is None
+    assert res["meta"]["next_cursor"] is not None
+
+
+def test_cursor_pagination_related_ordering(db: Session) -> None:
+    """ Test Pagination - Cursor Pagination ordered by a to-many path"""
+    stmt = select(Product)
+
+    pages = []
+    cursor = None
+
+    while True:
+        res = paginate(
+            db=db,
+            stmt=stmt,
+            model_class=Product,
+            pagination_params=CursorPaginationParams(size=2, cursor=cursor),
+            ordering_params="-categories__name"
+        )
+        pages.append(res)
+        cursor = res["meta"]["next_cursor"]
+
+        if cursor is None:
+            break
+
+    items = [item for page in pages for item in page["items"]]
+    names = [
+        max(category.name for category in item.categories)
+        for item in items
+        if item.categories
+    ]
+
+    assert len({item.id for item in items}) == len(items)
+    assert len(items) == db.scalar(select(func.count(Product.id)))
+    assert names == sorted(names, reverse=True)
+
+
+@pytest.mark.parametrize("ordering_params", ["deleted_at", "-deleted_at"])
+def test_cursor_pagination_nullable_ordering(
+        db: Session,
+        ordering_params: str
+) -> None:
+    """ Test Pagination - Cursor Pagination ordered by a column with NULLs"""
+    db.execute(
+        update(Category)
+        .where(Category.id.in_([2, 5]))
+        .values(deleted_at=datetime(2024, 1, 1))
+    )
+
+    pages = []
+    cursor = None
+
+    while True:
+        res = paginate(
+            db=db,
+            stmt=select(Category),
+            model_class=Category,
+            pagination_params=CursorPaginationParams(size=2, cursor=cursor),
+            ordering_params=ordering_params
+        )
+        pages.append(res)
+        cursor = res["meta"]["next_cursor"]
+
+        if cursor is None:
+            break
+
+    items = [item for page in pages for item in page["items"]]
+    nulls = [item.deleted_at is None for item in items]
+
+    assert len({item.id for item in items}) == len(items)
+    assert len(items) == db.scalar(select(func.count(Category.id)))
+    assert nulls == sorted(nulls, reverse=ordering_params.startswith("-"))
+
+    db.rollback()
+
+
+def test_cursor_pagination_invalid_cursor(db: Session) -> None:
+    """ Test Pagination - Cursor Pagination with invalid cursor"""
+    exception_occurred = False
+
+    try:
+        _ = paginate(
+            db=db,
+            stmt=select(Product),
+            model_class=Product,
+            pagination_params=CursorPaginationParams(cursor="invalid")
+        )
+    except RequestValidationError:
+        exception_occurred = True
+
+    assert exception_occurred
+
+
+@pytest.mark.asyncio
+async def test_async_cursor_pagination(async_db: AsyncSession) -> None:
+    """ Test Async Pagination - Cursor Pagination with filters"""
+    filter_params = ProductFilters(
+        price__gt=3000
+    )
+
+    stmt = select(
+        Product
+    ).where(
+        Product.deleted_at.is_(None)
+    )
+
+    first_page = await paginate_async(
+        db=async_db,
+        stmt=stmt,
+        model_class=Product,
+        pagination_params=CursorPaginationParams(size=3),
+        filter_params=filter_params,
+        ordering_params="name"
+    )
+
+    second_page = await paginate_async(
+        db=async_db,
+        stmt=stmt,
+        model_class=Product,
+        pagination_params=CursorPaginationParams(
+            size=3,
+            cursor=first_page["meta"]["next_cursor"]
+        ),
+        filter_params=filter_params,
+        ordering_params="name"
+    )
+
+    names = [
+        item.name
+        for item in [*first_page["items"], *second_page["items"]]
+    ]
+
+    assert names == [
+        "Car Washing Machine",
+        "Lazy Bag",
+        "Table Soccer",
+        "Toaster",
+        "Washing Machine"
+    ]
+    assert second_page["meta"]["next_cursor"] is None
+
+
+def test_paginate_relationship_strategy(db: Session) -> None:
+    """ Test Pagination - Relationship strategy passed to the filters"""
+    filter_params = ProductFilters(
+        categories=CategoryNestedFilters(id__in="1,2")
+    )
+
+    with mock.patch(
+            "fastapi_query.ext.sqlalchemy.pagination.apply_filters",
+            wraps=apply_filters
+    ) as apply_filters_mock:
+        res = paginate(
+            db=db,
+            stmt=select(Product),
+            model_class=Product,
+            filter_params=filter_params,
+            relationship_strategy=RelationshipFilterStrategy.IN,
+            pagination_params=PaginationParams(page=1, size=2)
+        )
+
+    assert apply_filters_mock.call_args.kwargs["relationship_strategy"] == (
+        RelationshipFilterStrategy.IN
+    )
+    assert res["meta"]["total_items"] == len(db.scalars(apply_filters(
+        model_class=Product,
+        stmt=select(Product),
+        filters=filter_params
+    )).all())
+
+
+COUNT_STRATEGY_CASES = [
+    (CountStrategy.EXACT, None, 6, True, True),
+    (CountStrategy.NONE, None, None, False, True),
+    (CountStrategy.CAPPED, 3, 3, False, True),
+    (CountStrategy.CAPPED, 10, 6, True, True),
+    (CountStrategy.ESTIMATED, None, 6, True, True),
+]
+
+
+@pytest.mark.parametrize(
+    "count_strategy,count_cap,total_items,total_items_exact,has_next",
+    COUNT_STRATEGY_CASES
+)
+def test_count_strategies(
+        db: Session,
+        count_strategy: CountStrategy,
+        count_cap: Optional[int],
+        total_items: Optional[int],
+        total_items_exact: bool,
+        has_next: bool
+) -> None:
+    """ Test Pagination - Count Strategies"""
+    res = paginate(
+        db=db,
+        stmt=select(Product).where(Product.deleted_at.is_(None)),
+        pagination_params=PaginationParams(page=2, size=2),
+        count_strategy=count_strategy,
+        count_cap=count_cap
+    )
+
+    meta = res["meta"]
+
+    assert len(res["items"]) == 2
+    assert meta["total_items"] == total_items
+    assert meta["total_items_exact"] == total_items_exact
+    assert meta["has_next"] == has_next
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "count_strategy,count_cap,total_items,total_items_exact,has_next",
+    COUNT_STRATEGY_CASES
+)
+async def test_async_count_strategies(
+        async_db: AsyncSession,
+        count_strategy: CountStrategy,
+        count_cap: Optional[int],
+        total_items: Optional[int],
+        total_items_exact: bool,
+        has_next: bool
+) -> None:
+    """ Test Pagination - Count Strategies (same page meta as sync)"""
+    res = await paginate_async(
+        db=async_db,
+        stmt=select(Product).where(Product.deleted_at.is_(None)),
+        pagination_params=PaginationParams(page=2, size=2),
+        count_strategy=count_strategy,
+        count_cap=count_cap
+    )
+
+    meta = res["meta"]
+
+    assert len(res["items"]) == 2
+    assert meta["total_items"] == total_items
+    assert meta["total_items_exact"] == total_items_exact
+    assert meta["has_next"] == has_next
+
+
+@pytest.fixture(scope="function")
+def sqlite_stat(engine: Engine) -> Generator[None, None, None]:
+    """ Collects the statistics (sqlite_stat1), dropped after the test """
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+    yield
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS sqlite_stat1"))
+
+
+def test_estimated_count_with_sqlite_stat(db: Session, sqlite_stat: None) -> None:
+    """ Test Pagination - Estimated Count from sqlite_stat1"""
+    res = paginate(
+        db=db,
+        stmt=select(Category),
+        pagination_params=PaginationParams(page=1, size=5),
+        count_strategy=CountStrategy.ESTIMATED
+    )
+
+    meta = res["meta"]
+
+    assert len(res["items"]) == 5
+    assert meta["total_items"] == 7
+    assert meta["total_items_exact"] is False
+    assert meta["has_next"] is True
+
+
+@pytest.mark.parametrize(
+    "page,items_count,executed_queries",
+    [
+        (2, 2, 1),
+        (10, 0, 2),
+    ]
+)
+def test_window_count(
+        engine: Engine,
+        db: Session,
+        page: int,
+        items_count: int,
+        executed_queries: int
+) -> None:
+    """ Test Pagination - Total Count within the page query"""
+    with track_statement_cache(engine) as stats:
+        res = paginate(
+            db=db,
+            stmt=select(Product).where(Product.deleted_at.is_(None)),
+            model_class=Product,
+            pagination_params=PaginationParams(page=page, size=2),
+            ordering_params="name",
+            count_strategy=CountStrategy.WINDOW
+        )
+
+    meta = res["meta"]
+
+    assert len(res["items"]) == items_count
+    assert all(isinstance(item, Product) for item in res["items"])
+    assert meta["total_items"] == 6
+    assert meta["total_pages"] == 3
+    assert stats.hits + stats.misses + stats.uncached == executed_queries
+
+
+def test_statement_cache_stats_stop(engine: Engine, db: Session) -> None:
+    """ Test Statement Cache Stats - the listener is removed on exit"""
+    with track_statement_cache(engine) as stats:
+        db.scalars(select(Category)).all()
+
+    db.scalars(select(Category)).all()
+
+    assert stats.hits + stats.misses + stats.uncached == 1
+    assert not event.contains(engine, "after_cursor_execute", stats)
+
+
+@pytest.mark.asyncio
+async def test_async_window_count(async_db: AsyncSession) -> None:
+    """ Test Async Pagination - Total Count within the page query"""
+    res = await paginate_async(
+        db=async_db,
+        stmt=select(Category).where(Category.deleted_at.is_(None)),
+        pagination_params=PaginationParams(page=1, size=5),
+        count_strategy=CountStrategy.WINDOW
+    )
+
+    meta = res["meta"]
+
+    assert len(res["items"]) == 5
+    assert meta["total_items"] == 7
+    assert meta["has_next"] is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_engine", [True, False])
+async def test_async_concurrent_count(
+        async_db: AsyncSession,
+        async_engine: AsyncEngine,
+        use_engine: bool
+) -> None:
+    """ Test Async Pagination - Count on a separate connection"""
+    count_bind = async_engine if use_engine else async_sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession
+    )
+
+    res = await paginate_async(
+        db=async_db,
+        stmt=select(Product).where(Product.deleted_at.is_(None)),
+        model_class=Product,
+        pagination_params=PaginationParams(page=3, size=2),
+        filter_params=ProductFilters(price__gt=1000),
+        count_bind=count_bind
+    )
+
+    meta = res["meta"]
+
+    assert len(res["items"]) == 2
+    assert meta["total_items"] == 6
+    assert meta["total_pages"] == 3
+    assert meta["has_next"] is False
+
+
+@pytest.mark.parametrize(
+    "count_strategy",
+    [CountStrategy.EXACT, CountStrategy.WINDOW]
+)
+def test_count_cache(
+        engine: Engine,
+        db: Session,
+        count_strategy: CountStrategy
+) -> None:
+    """ Test Pagination - Cached Total Count"""
+    count_cache = CountCache(ttl=60)
+    stmt = select(Product).where(Product.deleted_at.is_(None))
+
+    def get_page(page: int, price__gt: int, ordering_params: str):
+        return paginate(
+            db=db,
+            stmt=stmt,
+            model_class=Product,
+            pagination_params=PaginationParams(page=page, size=2),
+            filter_params=ProductFilters(price__gt=price__gt),
+            ordering_params=ordering_params,
+            count_strategy=count_strategy,
+            count_cache=count_cache
+        )
+
+    first_page = get_page(page=1, price__gt=1000, ordering_params="name")
+
+    with track_statement_cache(engine) as stats:
+        second_page = get_page(page=2, price__gt=1000, ordering_params="-name")
+
+    assert stats.hits + stats.misses + stats.uncached == 1
+    assert second_page["meta"]["total_items"] == first_page["meta"]["total_items"] == 6
+    assert second_page["meta"]["has_next"] is True
+    assert len(second_page["items"]) == 2
+
+    with track_statement_cache(engine) as stats:
+        other_filter = get_page(page=1, price__gt=100000, ordering_params="name")
+
+    assert stats.hits + stats.misses + stats.uncached == 2 - (
+        count_strategy == CountStrategy.WINDOW
+    )
+    assert other_filter["meta"]["total_items"] != 6
+
+
+@pytest.mark.asyncio
+async def test_async_count_cache(
+        async_db: AsyncSession,
+        async_engine: AsyncEngine
+) -> None:
+    """ Test Async Pagination - Cached Total Count"""
+    count_cache = CountCache(ttl=60)
+    stmt = select(Product).where(Product.deleted_at.is_(None))
+
+    await paginate_async(
+        db=async_db,
+        stmt=stmt,
+        model_class=Product,
+        pagination_params=PaginationParams(page=1, size=2),
+        filter_params=ProductFilters(price__gt=1000),
+        count_cache=count_cache
+    )
+
+    with track_statement_cache(async_engine) as stats:
+        res = await paginate_async(
+            db=async_db,
+            stmt=stmt,
+            model_class=Product,
+            pagination_params=PaginationParams(page=3, size=2),
+            filter_params=ProductFilters(price__gt=1000),
+            count_cache=count_cache,
+            count_bind=async_engine
+        )
+
+    meta = res["meta"]
+
+    assert stats.hits + stats.misses + stats.uncached == 1
+    assert len(res["items"]) == 2
+    assert meta["total_items"] == 6
+    assert meta["has_next"] is False
+
+
+def test_stream(db: Session) -> None:
+    """ Test Streaming - all the filtered items in the order """
+    filter_params = ProductFilters(price__gt=1500)
+
+    stmt = select(
+        Product
+    ).where(
+        Product.deleted_at.is_(None)
+    )
+
+    items = list(stream(
+        db=db,
+        stmt=stmt,
+        model_class=Product,
+        filter_params=filter_params,
+        ordering_params="-price,id",
+        chunk_size=2
+    ))
+
+    expected = db.scalars(
+        stmt.where(
+            Product.price > 1500
+        ).order_by(Product.price.desc(), Product.id)
+    ).all()
+
+    assert len(items) > 2
+    assert [item.id for item in items] == [item.id for item in expected]
+
+
+def test_stream_missing_model_class(db: Session) -> None:
+    with pytest.raises(ValueError):
+        stream(
+            db=db,
+            stmt=select(Product),
+            ordering_params="-price"
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_stream(async_db: AsyncSession) -> None:
+    """ Test Async Streaming - all the filtered items """
+    filter_params = ProductFilters(price__gt=1500)
+
+    stmt = select(
+        Product
+    ).where(
+        Product.deleted_at.is_(None)
+    )
+
+    items = [
+        item async for item in stream_async(
+            db=async_db,
+            stmt=stmt,
+            model_class=Product,
+            filter_params=filter_params,
+            ordering_params="id",
+            chunk_size=2
+        )
+    ]
+
+    expected = (
+        await async_db.scalars(
+            stmt.where(Product.price > 1500).order_by(Product.id)
+        )
+    ).all()
+
+    assert len(items) > 2
+    assert [item.id for item in items] == [item.id for item in expected]
+
+
+@pytest.mark.parametrize(
+    "pagination_params,count_strategy",
+    [
+        (PaginationParams(page=1, size=3), CountStrategy.EXACT),
+        (PaginationParams(page=1, size=3), CountStrategy.WINDOW),
+        (PaginationParams(get_all=True), CountStrategy.EXACT),
+        (CursorPaginationParams(size=3), CountStrategy.EXACT),
+    ]
+)
+@pytest.mark.parametrize("result_mode", [ResultMode.MAPPINGS, ResultMode.TUPLES])
+def test_result_modes(
+        db: Session,
+        pagination_params: PaginationParams,
+        count_strategy: CountStrategy,
+        result_mode: ResultMode
+) -> None:
+    """ Test Pagination - rows as plain data """
+    stmt = select(Product).where(Product.deleted_at.is_(None))
+    kwargs = {
+        "db": db,
+        "stmt": stmt,
+        "model_class": Product,
+        "pagination_params": pagination_params,
+        "ordering_params": "name",
+        "count_strategy": count_strategy
+    }
+
+    expected = paginate(**kwargs)["items"]
+
+    res = paginate(**kwargs, result_mode=result_mode)
+    items = res["items"]
+
+    assert len(items) == len(expected)
+    assert all(not isinstance(item, Product) for item in items)
+
+    if result_mode == ResultMode.MAPPINGS:
+        assert [item["name"] for item in items] == [item.name for item in expected]
+        assert set(items[0].keys()) == {
+            "id", "name", "price", "created_at", "updated_at", "deleted_at"
+        }
+    else:
+        assert [item[1] for item in items] == [item.name for item in expected]
+        assert len(items[0]) == 6
+
+
+def test_result_schema_and_fields(db: Session) -> None:
+    """ Test Pagination - columns selected by schema or fields """
+    res = paginate(
+        db=db,
+        stmt=select(Category),
+        model_class=Category,
+        pagination_params=PaginationParams(),
+        result_mode=ResultMode.MAPPINGS,
+        result_schema=CategoryOut
+    )
+
+    assert set(res["items"][0].keys()) == {
+        "id", "name", "created_at", "updated_at", "deleted_at"
+    }
+
+    res = paginate(
+        db=db,
+        stmt=select(Product),
+        model_class=Product,
+        pagination_params=PaginationParams(),
+        result_mode=ResultMode.MAPPINGS,
+        fields_params=FieldsParams(fields="id,price")
+    )
+
+    assert set(res["items"][0].keys()) == {"id", "price"}
+
+    with pytest.raises(RequestValidationError):
+        paginate(
+            db=db,
+            stmt=select(Product),
+            model_class=Product,
+            pagination_params=PaginationParams(),
+            result_mode=ResultMode.TUPLES,
+            fields_params=FieldsParams(fields="id,categories__name")
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pagination_params",
+    [PaginationParams(page=1, size=3), PaginationParams(get_all=True)]
+)
+async def test_async_result_mode(
+        async_db: AsyncSession,
+        pagination_params: PaginationParams
+) -> None:
+    res = await paginate_async(
+        db=async_db,
+        stmt=select(Product).where(Product.deleted_at.is_(None)),
+        model_class=Product,
+        pagination_params=pagination_params,
+        result_mode=ResultMode.MAPPINGS
+    )
+
+    assert res["items"]
+    assert all("name" in item for item in res["items"])
+
+
+@pytest.mark.parametrize(
+    "pagination_params",
+    [PaginationParams(page=1, size=3), CursorPaginationParams(size=3)]
+)
+def test_prebuilt_json_response(
+        db: Session,
+        pagination_params: PaginationParams
+) -> None:
+    """ Test Pagination - validated once and serialized to JSON bytes """
+    stmt = select(
+        Product
+    ).options(
+        selectinload(Product.categories)
+    ).where(
+        Product.deleted_at.is_(None)
+    )
+    kwargs = {
+        "db": db,
+        "stmt": stmt,
+        "model_class": Product,
+        "pagination_params": pagination_params
+    }
+
+    response = paginate(**kwargs, item_schema=ProductOut)
+    page = paginate(**kwargs)
+    expected = {
+        "items": [
+            json.loads(_model_dump_json(
+                _validate_from_attributes(ProductOut, item)
+            ))
+            for item in page["items"]
+        ],
+        "meta": page["meta"]
+    }
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == expected
+
+
+@pytest.mark.asyncio
+async def test_async_prebuilt_json_response(async_db: AsyncSession) -> None:
+    response = await paginate_async(
+        db=async_db,
+        stmt=select(Category),
+        model_class=Category,
+        pagination_params=PaginationParams(),
+        result_mode=ResultMode.MAPPINGS,
+        item_schema=CategoryOut
+    )
+
+    body = json.loads(response.body)
+
+    assert body["meta"]["total_items"] == len(body["items"])
+    assert set(body["items"][0].keys()) == {
+        "id", "name", "created_at", "updated_at", "deleted_at"
+    }
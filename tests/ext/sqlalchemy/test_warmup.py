@@ -0,0 +1,89 @@
+from typing import Generator, Optional
+
+import pytest
+from fastapi import FastAPI
+
+from fastapi_query import registry
+from fastapi_query.ext.sqlalchemy import warmup_model
+from fastapi_query.filtering import BaseFilterParams, Filter
+from fastapi_query.warmup import warmup
+from .examples.models import Order, Product
+from .examples.schemas import CategoryNestedFilters, OrderFilters, ProductFilters
+
+
+class InvalidProductFilters(BaseFilterParams):
+    search: Optional[str] = None
+    title: Optional[str] = None
+    price__between: Optional[int] = None
+
+    categories: Optional[CategoryNestedFilters] = None
+
+    class Settings(BaseFilterParams.Settings):
+        searchable_fields = ["name", "categories__title"]
+
+
+@pytest.fixture
+def isolated_registry() -> Generator[None, None, None]:
+    entries = dict(registry._registry)
+    registry._registry.clear()
+
+    yield
+
+    registry._registry.clear()
+    registry._registry.update(entries)
+
+
+def test_warmup_model() -> None:
+    """ Test Warmup - the valid filter classes and ordering fields"""
+    assert warmup_model(
+        Product,
+        ProductFilters,
+        frozenset({"name", "categories__name"})
+    ) == []
+    assert warmup_model(
+        Order,
+        OrderFilters,
+        frozenset({"shipping_address__city", "items__qty"})
+    ) == []
+
+
+def test_warmup_model_errors() -> None:
+    """ Test Warmup - the invalid fields are reported"""
+    errors = warmup_model(
+        Product,
+        InvalidProductFilters,
+        frozenset({"price", "title"})
+    )
+
+    assert len(errors) == 4
+    assert errors[-1] == "Product - Invalid Ordering Field - title"
+
+
+def test_warmup_model_other_orm() -> None:
+    """ Test Warmup - the model classes of the other ORMs are skipped"""
+    assert warmup_model(ProductFilters, None, frozenset()) is None
+
+
+@pytest.mark.asyncio
+async def test_warmup_declared_filters(isolated_registry: None) -> None:
+    """ Test Warmup - the declared filters are checked before any request"""
+    app = FastAPI()
+
+    @app.get("/products")
+    def get_products(
+            filter_params: InvalidProductFilters = Filter(
+                InvalidProductFilters,
+                model_class=Product,
+                ordering_fields=["name", "title"]
+            )
+    ) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="Invalid Ordering Field - title"):
+        await warmup(app=app)
+
+    reports = await warmup(app=app, raise_errors=False)
+    errors = [error for report in reports for error in report.errors]
+
+    assert len(errors) == 4
+    assert any(error.startswith("InvalidProductFilters.title - ") for error in errors)
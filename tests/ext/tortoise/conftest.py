@@ -39,17 +39,29 @@ def database_url(sqlite_file_path: str) -> str:
     return f"sqlite:///{sqlite_file_path}"
 
 
+@pytest.fixture(scope="module")
+def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    # The async tests run on the loop the database is initialized on,
+    # the connection lock of the client is bound to it on Python 3.8
+    loop = asyncio.new_event_loop()
+
+    yield loop
+
+    loop.close()
+
+
 @pytest.fixture(scope="module", autouse=True)
-def init_tests(database_url: str) -> Generator[None, None, None]:
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(
+def init_tests(
+        database_url: str,
+        event_loop: asyncio.AbstractEventLoop
+) -> Generator[None, None, None]:
+    event_loop.run_until_complete(
         init_database(database_url=database_url)
     )
 
     yield
 
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(
+    event_loop.run_until_complete(
         drop_database()
     )
 
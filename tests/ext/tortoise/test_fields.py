@@ -0,0 +1,57 @@
+import pytest
+from fastapi.exceptions import RequestValidationError
+from tortoise.queryset import QuerySet
+
+from fastapi_query.ext.tortoise import apply_fields, paginate
+from fastapi_query.fields import FieldsParams
+from fastapi_query.pagination import PaginationParams
+from .examples.models import (
+    Order,
+    Product
+)
+
+
+@pytest.mark.asyncio
+async def test_only() -> None:
+    """ Test Fields - only the selected fields are loaded """
+    res = await paginate(
+        queryset=QuerySet(Product),
+        pagination_params=PaginationParams(),
+        fields_params=FieldsParams(fields="name,categories__name")
+    )
+
+    assert res["items"]
+    assert set(res["items"][0].keys()) == {"name", "categories"}
+    assert all(
+        set(category.keys()) == {"name"}
+        for item in res["items"]
+        for category in item["categories"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_nested_fields() -> None:
+    """ Test Fields - nested relations, expanded relations """
+    res = await paginate(
+        queryset=QuerySet(Order),
+        pagination_params=PaginationParams(),
+        fields_params=FieldsParams(
+            fields="total_amount,items__qty,items__product__name,shipping_address"
+        )
+    )
+
+    item = res["items"][0]
+
+    assert set(item.keys()) == {"total_amount", "items", "shipping_address"}
+    assert set(item["items"][0].keys()) == {"qty", "product"}
+    assert set(item["items"][0]["product"].keys()) == {"name"}
+    assert "city" in item["shipping_address"]
+
+
+@pytest.mark.parametrize("fields", ["unknown", "name__unknown", "price__id"])
+def test_invalid_fields(fields: str) -> None:
+    with pytest.raises(RequestValidationError):
+        apply_fields(
+            queryset=QuerySet(Product),
+            fields_params=FieldsParams(fields=fields)
+        )
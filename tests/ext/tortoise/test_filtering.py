@@ -1,3 +1,5 @@
+from typing import Optional
+
 import pytest
 from tortoise.queryset import QuerySet
 
@@ -321,3 +323,25 @@ async def test_no_filters() -> None:
     )
 
     assert queryset_before == queryset_after
+
+
+class ProductNameRangeFilters(ProductFilters):
+    name__startswith: Optional[str] = None
+
+    class Settings(ProductFilters.Settings):
+        startswith_as_range = True
+
+
+@pytest.mark.asyncio
+async def test_startswith_as_range() -> None:
+    """ Test Filtering - startswith applied as the range predicate"""
+    queryset = apply_filters(
+        queryset=QuerySet(Product),
+        filters=ProductNameRangeFilters(name__startswith="Wash")
+    )
+
+    assert "LIKE" not in queryset.sql()
+
+    res = await queryset.all()
+
+    assert [product.name for product in res] == ["Washing Machine"]
@@ -1,7 +1,9 @@
 import pytest
+from pypika import Order as SortOrder
 from tortoise.queryset import QuerySet
 
 from fastapi_query.ext.tortoise import apply_ordering
+from fastapi_query.ext.tortoise.ordering import _resolve_ordering_fields
 from .examples.models import (
     Category,
     Order
@@ -158,3 +160,21 @@ async def test_nested_invalid_field() -> None:
 
     for i in range(len(res) - 1):
         assert res[i].name >= res[i + 1].name
+
+
+def test_allowed_fields() -> None:
+    """ Test Ordering - the fields that are not allowed are ignored """
+    _resolve_ordering_fields.cache_clear()
+
+    for _ in range(2):
+        queryset = apply_ordering(
+            queryset=QuerySet(Category),
+            order_by="-name,created_at,unknown,id",
+            allowed_fields={"name", "id", "unknown"}
+        )
+
+    assert queryset._orderings == [
+        ("name", SortOrder.desc),
+        ("id", SortOrder.asc)
+    ]
+    assert _resolve_ordering_fields.cache_info().hits == 1
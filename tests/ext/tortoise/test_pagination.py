@@ -1,14 +1,20 @@
+import json
+
 import pytest
 from tortoise.queryset import QuerySet
 
-from fastapi_query.ext.tortoise import paginate
-from fastapi_query.pagination import PaginationParams
+from fastapi_query._compat import _model_dump_json, _validate_from_attributes
+from fastapi_query.ext.tortoise import paginate, stream
+from fastapi_query.pagination import CountCache, PaginationParams
 from .examples.models import (
+    Address,
+    OrderItem,
     Product,
     Category
 )
 from .examples.schemas import (
-    ProductFilters
+    ProductFilters,
+    ProductOut
 )
 
 
@@ -73,6 +79,24 @@ async def test_async_basic_with_get_all() -> None:
     assert len(items) == meta["total_items"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("get_all_limit,truncated", [(3, True), (7, False)])
+async def test_async_get_all_limit(get_all_limit: int, truncated: bool) -> None:
+    """ Test Async Pagination - get_all is capped """
+
+    res = await paginate(
+        queryset=QuerySet(Category).filter(deleted_at=None),
+        pagination_params=PaginationParams(get_all=True),
+        get_all_limit=get_all_limit
+    )
+
+    meta = res["meta"]
+
+    assert len(res["items"]) == get_all_limit
+    assert meta["total_items_exact"] is not truncated
+    assert meta["truncated"] is truncated
+
+
 @pytest.mark.asyncio
 async def test_async_with_filters() -> None:
     """ Test Async Pagination - Basic with filters"""
@@ -142,3 +166,166 @@ async def test_async_with_ordering() -> None:
 
     for i in range(len(items) - 1):
         assert items[i].name >= items[i + 1].name
+
+
+@pytest.mark.asyncio
+async def test_async_count_cache() -> None:
+    """ Test Async Pagination - Cached Total Count"""
+    count_cache = CountCache(ttl=60)
+
+    def get_queryset() -> QuerySet:
+        return QuerySet(
+            Category
+        ).filter(
+            deleted_at=None
+        )
+
+    first_page = await paginate(
+        queryset=get_queryset(),
+        pagination_params=PaginationParams(page=1, size=5),
+        count_cache=count_cache
+    )
+
+    cache_key = count_cache.make_key(get_queryset().count().sql())
+
+    assert first_page["meta"]["total_items"] == 7
+    assert count_cache.get(cache_key) == (7, True)
+
+    # The cached count is used instead of the count query
+    count_cache.set(key=cache_key, total_items=8, total_items_exact=True)
+
+    second_page = await paginate(
+        queryset=get_queryset(),
+        pagination_params=PaginationParams(page=2, size=5),
+        ordering_params="-name",
+        count_cache=count_cache
+    )
+
+    assert second_page["meta"]["total_items"] == 8
+    assert len(second_page["items"]) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordering_params", [None, "-price,id"])
+async def test_async_stream(ordering_params: str) -> None:
+    """ Test Async Streaming - keyset and offset chunks """
+    queryset = QuerySet(
+        Product
+    ).filter(
+        deleted_at=None
+    )
+
+    items = [
+        item async for item in stream(
+            queryset=queryset,
+            filter_params=ProductFilters(price__gt=1500),
+            ordering_params=ordering_params,
+            chunk_size=2
+        )
+    ]
+
+    expected = await queryset.filter(price__gt=1500).order_by(
+        *(ordering_params.split(",") if ordering_params else ["id"])
+    )
+
+    assert len(items) > 2
+    assert [item.id for item in items] == [item.id for item in expected]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordering_params", ["line_2,-id", "-line_2,-id"])
+async def test_async_stream_nullable_ordering(ordering_params: str) -> None:
+    """ Test Async Streaming - keyset chunks with NULL ordering values """
+    addresses = [
+        await Address.create(
+            line_1="North Street 1",
+            line_2=line_2,
+            city="San Diego",
+            zip_code="90123",
+            country="US"
+        )
+        for line_2 in ("B", "A", "B")
+    ]
+
+    try:
+        items = [
+            item async for item in stream(
+                queryset=QuerySet(Address),
+                ordering_params=ordering_params,
+                chunk_size=2
+            )
+        ]
+    finally:
+        for address in addresses:
+            await address.delete()
+
+    values = [(item.line_2, item.id) for item in items]
+    nulls = sorted(
+        [value for value in values if value[0] is None],
+        key=lambda value: -value[1]
+    )
+    not_nulls = sorted(
+        [value for value in values if value[0] is not None],
+        key=lambda value: (value[0], -value[1])
+    )
+
+    # NULLs are last, first when desc
+    if ordering_params.startswith("-"):
+        expected = nulls + sorted(not_nulls, reverse=True)
+    else:
+        expected = not_nulls + nulls
+
+    assert len(values) == len(set(values)) > 4
+    assert values == expected
+
+
+@pytest.mark.asyncio
+async def test_async_stream_relationship_ordering() -> None:
+    """ Test Async Streaming - keyset chunks ordered by a related field """
+    items = [
+        item async for item in stream(
+            queryset=QuerySet(OrderItem),
+            ordering_params="-order__total_amount,qty",
+            chunk_size=2
+        )
+    ]
+
+    expected = await QuerySet(OrderItem).order_by(
+        "-order__total_amount", "qty", "id"
+    )
+
+    assert len(items) > 2
+    assert [item.id for item in items] == [item.id for item in expected]
+
+
+@pytest.mark.asyncio
+async def test_async_prebuilt_json_response() -> None:
+    """ Test Async Pagination - validated once and serialized to JSON bytes """
+    queryset = QuerySet(
+        Product
+    ).filter(
+        deleted_at=None
+    ).prefetch_related("categories")
+
+    params = PaginationParams(page=1, size=3)
+
+    response = await paginate(
+        queryset=queryset,
+        pagination_params=params,
+        item_schema=ProductOut
+    )
+    page = await paginate(
+        queryset=queryset,
+        pagination_params=params
+    )
+    expected = {
+        "items": [
+            json.loads(_model_dump_json(
+                _validate_from_attributes(ProductOut, item)
+            ))
+            for item in page["items"]
+        ],
+        "meta": page["meta"]
+    }
+
+    assert json.loads(response.body) == expected
@@ -0,0 +1,52 @@
+from typing import Optional
+
+import pytest
+
+from fastapi_query.ext.tortoise import warmup_model
+from fastapi_query.filtering import BaseFilterParams
+from .examples.models import Order, Product
+from .examples.schemas import CategoryNestedFilters, OrderFilters, ProductFilters
+
+
+class InvalidProductFilters(BaseFilterParams):
+    search: Optional[str] = None
+    title: Optional[str] = None
+    price__between: Optional[int] = None
+
+    categories: Optional[CategoryNestedFilters] = None
+
+    class Settings(BaseFilterParams.Settings):
+        searchable_fields = ["name", "categories__title"]
+
+
+@pytest.mark.asyncio
+async def test_warmup_model() -> None:
+    """ Test Warmup - the valid filter classes and ordering fields"""
+    assert warmup_model(
+        Product,
+        ProductFilters,
+        frozenset({"name", "categories__name"})
+    ) == []
+    assert warmup_model(
+        Order,
+        OrderFilters,
+        frozenset({"shipping_address__city"})
+    ) == []
+
+
+@pytest.mark.asyncio
+async def test_warmup_model_errors() -> None:
+    """ Test Warmup - the invalid fields are reported"""
+    errors = warmup_model(
+        Product,
+        InvalidProductFilters,
+        frozenset({"price", "title"})
+    )
+
+    assert len(errors) == 4
+    assert errors[-1] == "Product - Invalid Ordering Field - title"
+
+
+def test_warmup_model_other_orm() -> None:
+    """ Test Warmup - the model classes of the other ORMs are skipped"""
+    assert warmup_model(ProductFilters, None, frozenset()) is None
@@ -0,0 +1,58 @@
+from typing import Any, Dict
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from fastapi_query.fields.utils import get_fields_tree, project_item
+
+
+@pytest.mark.parametrize(
+    "fields,tree",
+    [
+        (None, {}),
+        ("", {}),
+        ("id, name", {"id": {}, "name": {}}),
+        (
+            "id,tags__name,tags__id,owner__address__city",
+            {
+                "id": {},
+                "tags": {"name": {}, "id": {}},
+                "owner": {"address": {"city": {}}}
+            }
+        ),
+    ]
+)
+def test_get_fields_tree(fields: str, tree: Dict[str, Any]) -> None:
+    assert get_fields_tree(fields) == tree
+
+
+def test_get_fields_tree_invalid_path() -> None:
+    with pytest.raises(RequestValidationError):
+        get_fields_tree("tags__")
+
+
+class Record:
+    """ ORM-like object """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.__dict__.update(kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        raise AssertionError(f"Unselected field '{name}' accessed")
+
+
+def test_project_item() -> None:
+    item = Record(
+        id=1,
+        name="Item",
+        tags=[Record(id=1, name="a"), Record(id=2, name="b")],
+        owner=None
+    )
+
+    tree = {"name": {}, "tags": {"name": {}}, "owner": {"id": {}}}
+
+    assert project_item(item, tree) == {
+        "name": "Item",
+        "tags": [{"name": "a"}, {"name": "b"}],
+        "owner": None
+    }
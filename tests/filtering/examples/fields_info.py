@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import TypedDict, Dict, Type, Any, Optional
+from typing import TypedDict, Dict, Type, Any, List, Optional
 
 
 class FieldInfoAttrs(TypedDict):
@@ -15,9 +15,9 @@ ADDRESS_FIELDS_INFO: Dict[str, FieldInfoAttrs] = {
         "default": None
     },
     "id__not_in": {
-        "type": Optional[str],
+        "type": Optional[List[str]],
         "required": False,
-        "default": "5,6"
+        "default": ["5", "6"]
     },
     "line_1__icontains": {
         "type": Optional[str],
@@ -61,9 +61,9 @@ USER_FIELDS_INFO: Dict[str, FieldInfoAttrs] = {
         "default": None
     },
     "id__in": {
-        "type": Optional[str],
+        "type": Optional[List[str]],
         "required": False,
-        "default": "1,2,3"
+        "default": ["1", "2", "3"]
     },
     "username": {
         "type": Optional[str],
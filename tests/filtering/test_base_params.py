@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from fastapi_query.filtering import WithPrefix
 from .examples.schemas import UserFilters
 
@@ -6,3 +9,35 @@ def test_with_prefix():
     model = WithPrefix(UserFilters, prefix="test_prefix")
 
     assert model.Settings.prefix == "test_prefix"
+
+
+def test_max_list_length():
+    class LimitedUserFilters(UserFilters):
+        class Settings(UserFilters.Settings):
+            max_list_length = 3
+
+    assert LimitedUserFilters(id__in="1,2,3").id__in == [1, 2, 3]
+    assert LimitedUserFilters(id__in=[1, 2]).id__in == [1, 2]
+
+    with pytest.raises(ValidationError):
+        LimitedUserFilters(id__in="1,2,3,4")
+
+    # Not limited by default
+    assert len(UserFilters(id__in=",".join(["1"] * 5000)).id__in) == 5000
+
+
+def test_list_fields():
+    class LimitedUserFilters(UserFilters):
+        class Settings(UserFilters.Settings):
+            max_list_length = 3
+
+    assert UserFilters._list_fields == frozenset({"id__in"})
+    assert LimitedUserFilters._list_fields == UserFilters._list_fields
+
+    assert LimitedUserFilters(id__in=["1,2", "3"]).id__in == [1, 2, 3]
+
+    with pytest.raises(ValidationError):
+        LimitedUserFilters(id__in=["1", "2", "3", "4"])
+
+    with pytest.raises(ValidationError):
+        LimitedUserFilters(id__in=["1,2", "3,4"])
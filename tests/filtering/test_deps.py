@@ -1,4 +1,12 @@
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from pydantic import Field
+
+from fastapi_query._compat import PYDANTIC_V2
+from fastapi_query.filtering import BaseFilterParams, Filter
 
 
 def test_filter_dependency(client: TestClient) -> None:
@@ -15,3 +23,103 @@ def test_filter_dependency(client: TestClient) -> None:
     data = response.json()
     assert data["id"] == 1
     assert data["username__contains"] == "user"
+
+
+def test_filter_dependency_coercion(client: TestClient) -> None:
+    response = client.get(
+        url="/self",
+        params={
+            "id__in": "4,5",
+            "created_at__gte": "2024-01-01T00:00:00",
+            "shipping_address__id": "7"
+        }
+    )
+
+    assert response.is_success
+
+    data = response.json()
+    assert data["id__in"] == [4, 5]
+    assert data["created_at__gte"] == "2024-01-01T00:00:00"
+    assert data["shipping_address"]["id"] == 7
+
+
+@pytest.mark.skipif(
+    not PYDANTIC_V2,
+    reason="FastAPI validates the query values itself on pydantic v1"
+)
+def test_filter_dependency_error_locations(client: TestClient) -> None:
+    response = client.get(
+        url="/self",
+        params={
+            "id": "invalid",
+            "shipping_address__id__not_in": "1,invalid"
+        }
+    )
+
+    assert response.status_code == 422
+
+    locations = [error["loc"] for error in response.json()["detail"]]
+    assert locations == [
+        ["query", "id"],
+        ["query", "shipping_address__id__not_in", 1]
+    ]
+
+
+def test_filter_dependency_repeated_params(client: TestClient) -> None:
+    response = client.get(
+        url="/self",
+        params=[
+            ("id__in", "1,2"),
+            ("id__in", "3"),
+            ("shipping_address__id__not_in", "9")
+        ]
+    )
+
+    assert response.is_success
+
+    data = response.json()
+    assert data["id__in"] == [1, 2, 3]
+    assert data["shipping_address"]["id__not_in"] == [9]
+    assert data["billing_address"]["id__not_in"] == [5, 6]
+
+
+def test_filter_dependency_openapi_constraints() -> None:
+    class NestedFilters(BaseFilterParams):
+        code: Optional[str] = Field(None, min_length=2)
+
+    class ConstrainedFilters(BaseFilterParams):
+        id: Optional[int] = Field(None, ge=1, description="Identifier")
+        name: Optional[str] = Field(None, min_length=2, max_length=10)
+        price__lt: Optional[float] = Field(None, gt=0, le=100, deprecated=True)
+        nested: Optional[NestedFilters] = None
+
+    app = FastAPI()
+
+    @app.get("/items")
+    def get_items(
+            filters: ConstrainedFilters = Filter(ConstrainedFilters)
+    ) -> None:
+        pass
+
+    parameters = {
+        parameter["name"]: parameter
+        for parameter in app.openapi()["paths"]["/items"]["get"]["parameters"]
+    }
+
+    def get_schema(name: str) -> dict:
+        schema = parameters[name]["schema"]
+        return schema["anyOf"][0] if "anyOf" in schema else schema
+
+    assert get_schema("id")["minimum"] == 1
+    assert parameters["id"]["description"] == "Identifier"
+    assert get_schema("name")["minLength"] == 2
+    assert get_schema("name")["maxLength"] == 10
+    assert get_schema("price__lt")["exclusiveMinimum"] == 0
+    assert get_schema("price__lt")["maximum"] == 100
+    assert parameters["price__lt"]["deprecated"] is True
+    assert get_schema("nested__code")["minLength"] == 2
+
+    response = TestClient(app).get(url="/items", params={"id": 0})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "id"]
@@ -9,6 +9,9 @@ from fastapi_query.filtering.utils import (
     check_sequence_type,
     check_nested_filter_type,
     flatten_filter_fields,
+    get_filter_fields_info,
+    get_prefix_upper_bound,
+    get_values_packer,
     pack_values
 )
 from .examples.fields_info import (
@@ -17,6 +20,7 @@ from .examples.fields_info import (
     ADDRESS_FIELDS_INFO,
     FieldInfoAttrs
 )
+from fastapi_query.filtering import BaseFilterParams, WithPrefix
 from .examples.schemas import UserFilters, OrderFilters, AddressFilters
 from fastapi_query._compat import _model_dump  # noqa
 
@@ -180,3 +184,68 @@ def test_pack_values(
 
     assert exception_should_occur == exception_occurred
 
+
+def test_get_filter_fields_info() -> None:
+    """ The fields metadata is computed once per filter class """
+    get_filter_fields_info.cache_clear()
+
+    for _ in range(3):
+        fields_info = get_filter_fields_info(UserFilters)
+
+    cache_info = get_filter_fields_info.cache_info()
+
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+    nested = {
+        info.name: info.prefix
+        for info in fields_info
+        if info.nested_filter_type is not None
+    }
+
+    assert nested == {
+        "shipping_address": "shipping_address",
+        "billing_address": "billing_address",
+        "orders": "orders"
+    }
+
+def test_get_values_packer() -> None:
+    """ The packer is generated once and maps the prefixed keys """
+
+    class ShopFilters(BaseFilterParams):
+        name: Optional[str] = None
+        owner: Optional[WithPrefix(UserFilters, "user")] = None  # type: ignore
+
+    packer = get_values_packer(ShopFilters)
+
+    assert get_values_packer(ShopFilters) is packer
+
+    res = packer({
+        "name": "Shop",
+        "user__username": "john",
+        "user__shipping_address__city": "Paris",
+        "owner__username": "ignored"
+    })
+
+    assert res.name == "Shop"
+    assert res.owner.username == "john"
+    assert res.owner.shipping_address.city == "Paris"
+    assert res.owner.billing_address.city is None
+
+
+@pytest.mark.parametrize(
+    "prefix,expected",
+    [
+        ("abc", "abd"),
+        ("Az", "A{"),
+        ("", None),
+        ("a\U0010FFFF", "b"),
+        ("\U0010FFFF", None),
+        ("\ud7ff", "\ue000"),
+    ]
+)
+def test_get_prefix_upper_bound(
+        prefix: str,
+        expected: Optional[str]
+) -> None:
+    assert get_prefix_upper_bound(prefix) == expected
@@ -0,0 +1,42 @@
+from unittest import mock
+
+from fastapi_query.pagination import CountCache, InMemoryCountCacheBackend
+
+
+def test_count_cache_key() -> None:
+    cache = CountCache()
+
+    key = cache.make_key("SELECT 1", {"fq_price__gt": 1000}, "exact")
+
+    assert key.startswith("fastapi_query:count:")
+    assert key == cache.make_key("SELECT 1", {"fq_price__gt": 1000}, "exact")
+    assert key != cache.make_key("SELECT 1", {"fq_price__gt": 2000}, "exact")
+
+
+def test_count_cache_ttl() -> None:
+    cache = CountCache(ttl=10)
+
+    with mock.patch("fastapi_query.pagination.cache.monotonic", return_value=100):
+        cache.set(key="a", total_items=10, total_items_exact=True)
+
+    with mock.patch("fastapi_query.pagination.cache.monotonic", return_value=105):
+        assert cache.get("a") == (10, True)
+
+    with mock.patch("fastapi_query.pagination.cache.monotonic", return_value=110):
+        assert cache.get("a") is None
+
+
+def test_count_cache_lru_eviction() -> None:
+    backend = InMemoryCountCacheBackend(maxsize=2)
+    cache = CountCache(backend=backend)
+
+    cache.set(key="a", total_items=1, total_items_exact=True)
+    cache.set(key="b", total_items=2, total_items_exact=True)
+    assert cache.get("a") == (1, True)
+
+    cache.set(key="c", total_items=3, total_items_exact=False)
+
+    assert len(backend) == 2
+    assert cache.get("a") == (1, True)
+    assert cache.get("b") is None
+    assert cache.get("c") == (3, False)
@@ -0,0 +1,124 @@
+import csv
+import json
+from io import StringIO
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_query.pagination import ExportFormat, streaming_response
+
+
+class Owner(BaseModel):
+    name: str
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    tags: List[str] = []
+    owner: Optional[Owner] = None
+
+
+class ItemRecord:
+    """ ORM-like object """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.__dict__.update(kwargs)
+
+
+def _get_records() -> List[ItemRecord]:
+    return [
+        ItemRecord(
+            id=i,
+            name=f"Item, {i}",
+            tags=["a", "b"],
+            owner=ItemRecord(name=f"Owner {i}")
+        )
+        for i in range(1, 6)
+    ]
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/export")
+    def export(export_format: ExportFormat = ExportFormat.NDJSON) -> Any:
+        return streaming_response(
+            items=iter(_get_records()),
+            schema=Item,
+            export_format=export_format,
+            filename=f"items.{export_format.value}",
+            batch_size=2
+        )
+
+    @app.get("/export-partial")
+    def export_partial() -> Any:
+        # The first item has no owner, the header is taken from the schema
+        records = _get_records()
+        records[0].owner = None
+
+        return streaming_response(
+            items=records,
+            schema=Item,
+            export_format=ExportFormat.CSV
+        )
+
+    @app.get("/export-async")
+    async def export_async() -> Any:
+        async def _items() -> AsyncIterator[ItemRecord]:
+            for record in _get_records():
+                yield record
+
+        return streaming_response(
+            items=_items(),
+            schema=Item
+        )
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/export", "/export-async"])
+def test_ndjson(client: TestClient, path: str) -> None:
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows: List[Dict[str, Any]] = [
+        json.loads(line) for line in response.text.splitlines()
+    ]
+
+    assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0]["owner"] == {"name": "Owner 1"}
+
+
+def test_csv(client: TestClient) -> None:
+    response = client.get("/export", params={"export_format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == (
+        'attachment; filename="items.csv"'
+    )
+
+    rows = list(csv.reader(StringIO(response.text)))
+
+    assert rows[0] == ["id", "name", "tags", "owner__name"]
+    assert rows[1] == ["1", "Item, 1", '["a", "b"]', "Owner 1"]
+    assert len(rows) == 6
+
+
+def test_csv_columns_from_schema(client: TestClient) -> None:
+    response = client.get("/export-partial")
+
+    assert response.status_code == 200
+
+    rows = list(csv.reader(StringIO(response.text)))
+
+    assert rows[0] == ["id", "name", "tags", "owner__name"]
+    assert rows[1] == ["1", "Item, 1", '["a", "b"]', ""]
+    assert rows[2] == ["2", "Item, 2", '["a", "b"]', "Owner 2"]
@@ -1,9 +1,20 @@
+import json
+from base64 import urlsafe_b64encode
+from datetime import datetime, date
+from decimal import Decimal
 from typing import List, Any
+from uuid import UUID
 
 import pytest
+from fastapi.exceptions import RequestValidationError
 
 from fastapi_query.pagination import PaginationParams
-from fastapi_query.pagination.utils import prepare_response
+from fastapi_query.pagination.utils import (
+    prepare_get_all_response,
+    prepare_response,
+    encode_cursor,
+    decode_cursor
+)
 
 
 @pytest.mark.parametrize(
@@ -43,3 +54,64 @@ def test_prepare_response(
     assert meta["total_items"] == total_items
 
     assert res["items"] == items
+
+
+@pytest.mark.parametrize(
+    "fetched_items,get_all_limit,total_items,truncated",
+    [
+        (10, 10, 10, False),
+        (11, 10, 10, True),
+        (11, None, 11, False),
+    ]
+)
+def test_prepare_get_all_response(
+        fetched_items: int,
+        get_all_limit: int,
+        total_items: int,
+        truncated: bool
+) -> None:
+    res = prepare_get_all_response(
+        items=[{}] * fetched_items,
+        pagination_params=PaginationParams(get_all=True),
+        get_all_limit=get_all_limit
+    )
+
+    meta = res["meta"]
+    assert len(res["items"]) == total_items
+    assert meta["total_items"] == total_items
+    assert meta["total_items_exact"] is not truncated
+    assert meta["truncated"] is truncated
+
+
+@pytest.mark.parametrize(
+    "values,backwards",
+    [
+        ([1], False),
+        (["name", 10], True),
+        ([datetime(2023, 1, 1, 12, 30), date(2023, 1, 1), None], False),
+        ([Decimal("10.50"), UUID("12345678123456781234567812345678")], True),
+    ]
+)
+def test_cursor_round_trip(
+        values: List[Any],
+        backwards: bool
+) -> None:
+    cursor = encode_cursor(values=values, backwards=backwards)
+
+    assert decode_cursor(cursor=cursor, size=len(values)) == (values, backwards)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"v": [{"dec": "not-a-number"}], "b": False},
+        {"v": [{"uuid": "not-a-uuid"}], "b": False},
+        {"v": [{"unknown": "1"}], "b": False},
+        {"v": [1]},
+    ]
+)
+def test_decode_malformed_cursor(payload: Any) -> None:
+    cursor = urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    with pytest.raises(RequestValidationError):
+        decode_cursor(cursor=cursor)
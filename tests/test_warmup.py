@@ -0,0 +1,90 @@
+from typing import Generator, Optional
+
+import pytest
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from fastapi_query import registry
+from fastapi_query.filtering import BaseFilterParams, Filter
+from fastapi_query.warmup import register, warmup, warmup_sync
+from .filtering.examples.schemas import AddressFilters, UserFilters
+
+
+class ItemOut(BaseModel):
+    id: int
+
+
+class InvalidNestedFilters(BaseFilterParams):
+    id: Optional[int] = None
+    item: Optional[ItemOut] = None
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry() -> Generator[None, None, None]:
+    entries = dict(registry._registry)
+    item_schemas = dict(registry._item_schemas)
+    registry._registry.clear()
+    registry._item_schemas.clear()
+
+    yield
+
+    registry._registry.clear()
+    registry._registry.update(entries)
+    registry._item_schemas.clear()
+    registry._item_schemas.update(item_schemas)
+
+
+def test_filter_dependency_registered() -> None:
+    Filter(AddressFilters)
+
+    reports = warmup_sync()
+
+    assert [report.name for report in reports] == ["AddressFilters"]
+    assert reports[0].errors == ()
+    assert reports[0].build_time >= 0
+
+
+def test_app_filter_classes() -> None:
+    app = FastAPI()
+
+    @app.get("/users")
+    def get_users(filter_params: UserFilters = Filter(UserFilters)) -> None:
+        pass
+
+    registry._registry.clear()
+    reports = warmup_sync(app=app)
+
+    assert [report.name for report in reports] == ["UserFilters"]
+
+
+def test_invalid_nested_type() -> None:
+    register(filter_class=InvalidNestedFilters)
+
+    with pytest.raises(ValueError, match="must subclass BaseFilterParams"):
+        warmup_sync()
+
+    reports = warmup_sync(raise_errors=False)
+
+    assert len(reports[0].errors) == 1
+
+
+def test_unsupported_model_class() -> None:
+    register(filter_class=AddressFilters, model_class=ItemOut)
+
+    reports = warmup_sync(raise_errors=False)
+
+    assert [report.name for report in reports] == [
+        "AddressFilters",
+        "AddressFilters -> ItemOut"
+    ]
+    assert "unsupported model class" in reports[1].errors[0]
+
+
+@pytest.mark.asyncio
+async def test_async_warmup() -> None:
+    register(item_schema=ItemOut)
+
+    reports = await warmup()
+
+    assert [report.name for report in reports] == ["ItemOut"]
+    assert reports[0].errors == ()